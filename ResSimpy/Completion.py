@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from dataclasses import dataclass
 from typing import Optional
+from uuid import UUID
 
 from ResSimpy.DataObjectMixin import DataObjectMixin
 from ResSimpy.ISODateTime import ISODateTime
@@ -39,6 +40,7 @@ class Completion(DataObjectMixin, ABC):
         dfactor (Optional[float]): non-darcy factor to use for rate dependent skin calculations. 'D' in Nexus
         rel_perm_method (Optional[int]): rel perm method to use for the completion. 'IRELPM' in Nexus
         status (Optional[str]): the status of the layer, can be 'ON' or 'OFF'
+        id (Optional[UUID]): existing id of the completion, a new one is generated if not provided.
 
 
     """
@@ -72,8 +74,8 @@ class Completion(DataObjectMixin, ABC):
                  depth_to_bottom: Optional[float] = None, perm_thickness_ovr: Optional[float] = None,
                  dfactor: Optional[float] = None, rel_perm_method: Optional[int] = None,
                  status: Optional[str] = None, date_format: Optional[DateFormatEnum.DateFormat] = None,
-                 start_date: Optional[str] = None) -> None:
-        super().__init__({})
+                 start_date: Optional[str] = None, id: Optional[UUID] = None) -> None:
+        super().__init__({}, id=id)
         self.__well_radius = well_radius
         self.__date = date
         self.__i = i
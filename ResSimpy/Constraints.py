@@ -1,13 +1,15 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-import pandas as pd
 
 from ResSimpy.Constraint import Constraint
-from typing import Optional, Mapping, Sequence
+from typing import TYPE_CHECKING, Optional, Mapping, Sequence
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass(kw_only=True)
 class Constraints(ABC):
@@ -2,6 +2,7 @@
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import Optional
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Units.AttributeMappings.AttributeMappingBase import AttributeMapBase
@@ -14,9 +15,10 @@ from ResSimpy.Utils.obj_to_table_string import to_table_line
 class DataObjectMixin(ABC):
     __id: uuid.UUID = field(default_factory=lambda: uuid.uuid4(), compare=False)
 
-    def __init__(self, properties_dict: dict[str, None | int | str | float]) -> None:
+    def __init__(self, properties_dict: dict[str, None | int | str | float], id: Optional[uuid.UUID] = None) -> None:
         # properties dict is a parameter to make the call signature equivalent to subclasses.
-        self.__id = uuid.uuid4()
+        # id is only provided for objects recreated from stored data that already have an id.
+        self.__id = uuid.uuid4() if id is None else id
         if properties_dict:
             raise ValueError('No properties should be passed to the DataObjectMixin')
 
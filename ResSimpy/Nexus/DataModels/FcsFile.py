@@ -1,10 +1,12 @@
 from __future__ import annotations
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 import os
 import warnings
 
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
-from typing import Optional
+from ResSimpy.Nexus.include_file_reader import IncludeFileReader
+from typing import Generator, Iterable, Optional
 
 # Use correct Self type depending upon Python version
 import sys
@@ -17,6 +19,8 @@ else:
 from ResSimpy.Utils.factory_methods import get_empty_dict_int_nexus_file, get_empty_list_str, \
     get_empty_list_nexus_file
 from ResSimpy.Nexus.NexusKeywords.fcs_keywords import FCS_KEYWORDS
+from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+from ResSimpy.Enums.UnitsEnum import UnitSystem
 import ResSimpy.Nexus.nexus_file_operations as nfo
 from ResSimpy.Utils.generic_repr import generic_repr
 from datetime import datetime
@@ -52,6 +56,9 @@ class FcsNexusFile(NexusFile):
     polymer_files: Optional[dict[int, NexusFile]] = field(default_factory=get_empty_dict_int_nexus_file)
     adsorption_files: Optional[dict[int, NexusFile]] = field(default_factory=get_empty_dict_int_nexus_file)
     flux_in_files: Optional[dict[int, NexusFile]] = field(default_factory=get_empty_dict_int_nexus_file)
+    date_format: Optional[DateFormat] = field(default=None, compare=False)
+    run_units: Optional[UnitSystem] = field(default=None, compare=False)
+    default_units: Optional[UnitSystem] = field(default=None, compare=False)
     files_info: list[tuple[Optional[str], Optional[str], Optional[datetime]]]
 
     def __init__(
@@ -87,7 +94,10 @@ class FcsNexusFile(NexusFile):
             esp_files: Optional[dict[int, NexusFile]] = None,
             polymer_files: Optional[dict[int, NexusFile]] = None,
             adsorption_files: Optional[dict[int, NexusFile]] = None,
-            flux_in_files: Optional[dict[int, NexusFile]] = None
+            flux_in_files: Optional[dict[int, NexusFile]] = None,
+            date_format: Optional[DateFormat] = None,
+            run_units: Optional[UnitSystem] = None,
+            default_units: Optional[UnitSystem] = None
     ) -> None:
         self.restart_file = restart_file
         self.structured_grid_file = structured_grid_file
@@ -117,7 +127,14 @@ class FcsNexusFile(NexusFile):
         self.polymer_files = polymer_files if polymer_files is not None else get_empty_dict_int_nexus_file()
         self.adsorption_files = adsorption_files if adsorption_files is not None else get_empty_dict_int_nexus_file()
         self.flux_in_files = flux_in_files if flux_in_files is not None else get_empty_dict_int_nexus_file()
+        self.date_format = date_format
+        self.run_units = run_units
+        self.default_units = default_units
         self.files_info = []
+        # the fcs file and any files it includes, used to check whether they have changed
+        self.__fcs_include_structure: Optional[NexusFile] = None
+        # fcs keywords of the model files that have only been recorded by path and not yet read
+        self.__unloaded_sections: set[str] = set()
         super().__init__(location=location, include_locations=include_locations, origin=origin,
                          include_objects=include_objects, file_content_as_list=file_content_as_list)
 
@@ -125,7 +142,10 @@ class FcsNexusFile(NexusFile):
         return generic_repr(self)
 
     @classmethod
-    def generate_fcs_structure(cls, fcs_file_path: str, recursive: bool = True) -> Self:
+    def generate_fcs_structure(cls, fcs_file_path: str, recursive: bool = True,
+                               max_workers: Optional[int] = None,
+                               file_reader: Optional[IncludeFileReader] = None,
+                               sections: Optional[Iterable[str]] = None) -> Self:
         """Creates an instance of the FcsNexusFile, populates it through looking through the different keywords \
             in the FCS and assigning the paths to objects.
 
@@ -133,6 +153,13 @@ class FcsNexusFile(NexusFile):
         ----
             fcs_file_path (str): path to the fcs file of interest
             recursive (bool, optional): Whether the NexusFile structure will be recursively created. Defaults to True.
+            max_workers (Optional[int], optional): maximum number of files to read from disk at the same time. \
+                Defaults to None, which reads the files one after another. Ignored if file_reader is provided.
+            file_reader (Optional[IncludeFileReader], optional): reader to share with other calls loading files from \
+                the same model. Defaults to None, which creates a new reader with max_workers.
+            sections (Optional[Iterable[str]], optional): fcs keywords of the model files to load, e.g. \
+                {'WELLS', 'RUNCONTROL'}, case insensitive. The other model files are only recorded by path, without \
+                being read, until they are loaded with load_section. Defaults to None, which loads all the model files.
 
         Raises:
         ------
@@ -143,6 +170,12 @@ class FcsNexusFile(NexusFile):
         -------
             FcsNexusFile: instance of a FcsNexusFile for a given fcs file path
         """
+        if file_reader is None:
+            with IncludeFileReader(max_workers=max_workers) as new_file_reader:
+                return cls.generate_fcs_structure(fcs_file_path, recursive=recursive, file_reader=new_file_reader,
+                                                  sections=sections)
+        sections_to_load = None if sections is None else {x.upper() for x in sections}
+
         fcs_file = cls(location=fcs_file_path)
         fcs_file.include_objects = get_empty_list_nexus_file()
         fcs_file.file_content_as_list = get_empty_list_str()
@@ -153,14 +186,33 @@ class FcsNexusFile(NexusFile):
             raise FileNotFoundError(f'fcs file not found for path {fcs_file_path}')
         origin_path = fcs_file_path
         fcs_nexus_file = NexusFile.generate_file_include_structure(
-            fcs_file_path, origin=None)
+            fcs_file_path, origin=None, file_reader=file_reader)
         fcs_file.files_info.append((fcs_nexus_file.location, fcs_nexus_file.linked_user,
                                     fcs_nexus_file.last_modified))
         flat_fcs_file_content = fcs_nexus_file.get_flat_list_str_file
         if flat_fcs_file_content is None or fcs_file.file_content_as_list is None:
             raise ValueError(f'FCS file not found, no content for {fcs_file_path=}')
         fcs_file.file_content_as_list = flat_fcs_file_content
+        fcs_file.__fcs_include_structure = fcs_nexus_file
+
+        # find all the files referenced in the fcs first so that they can all be read at the same time
+        model_file_keys: list[tuple[str, Optional[str], str]] = []
         for i, line in enumerate(flat_fcs_file_content):
+            # read the global settings in the same pass as the model files
+            if nfo.check_token('DATEFORMAT', line) or nfo.check_token('DATE_FORMAT', line):
+                format_token = 'DATEFORMAT' if nfo.check_token('DATEFORMAT', line) else 'DATE_FORMAT'
+                date_format_value = nfo.get_token_value_at(format_token, i, flat_fcs_file_content)
+                if date_format_value is not None:
+                    fcs_file.date_format = DateFormat.DD_MM_YYYY if date_format_value == 'DD/MM/YYYY' else \
+                        DateFormat.MM_DD_YYYY
+            elif nfo.check_token('RUN_UNITS', line):
+                run_units_value = nfo.get_token_value_at('RUN_UNITS', i, flat_fcs_file_content)
+                if run_units_value is not None:
+                    fcs_file.run_units = UnitSystem(run_units_value.upper())
+            elif nfo.check_token('DEFAULT_UNITS', line):
+                default_units_value = nfo.get_token_value_at('DEFAULT_UNITS', i, flat_fcs_file_content)
+                if default_units_value is not None:
+                    fcs_file.default_units = UnitSystem(default_units_value.upper())
             if not nfo.nexus_token_found(line, valid_list=FCS_KEYWORDS):
                 continue
             key = nfo.get_next_value(start_line_index=i, file_as_list=flat_fcs_file_content, search_string=line)
@@ -168,20 +220,33 @@ class FcsNexusFile(NexusFile):
                 warnings.warn(f'get next value failed to find a suitable token in {line}')
                 continue
             key = key.upper()
-            value = nfo.get_token_value(key, line, flat_fcs_file_content[i::])
+            value = nfo.get_token_value_at(key, i, flat_fcs_file_content)
             if value is None:
                 warnings.warn(f'No value found for {key}, skipping file')
                 continue
             # TODO handle methods / sets instead of getting full file path
             if key in cls.fcs_keyword_map_multi():
-                # for keywords that have multiple methods we store the value in a dictionary
-                # with the method number and the NexusFile object
                 _, method_string, method_number, value = (
                     nfo.get_multiple_sequential_values(flat_fcs_file_content[i::], 4)
                 )
-                full_file_path = nfo.get_full_file_path(value, origin_path)
+                model_file_keys.append((key, method_number, value))
+            elif key in cls.fcs_keyword_map_single():
+                model_file_keys.append((key, None, value))
+        file_reader.prefetch(nfo.get_full_file_path(path, origin_path) for key, _, path in model_file_keys
+                             if sections_to_load is None or key in sections_to_load)
+
+        for key, method, file_path in model_file_keys:
+            full_file_path = nfo.get_full_file_path(file_path, origin_path)
+            if sections_to_load is None or key in sections_to_load:
                 nexus_file = NexusFile.generate_file_include_structure(
-                    value, origin=fcs_file_path, recursive=recursive, top_level_file=True)
+                    file_path, origin=fcs_file_path, recursive=recursive, top_level_file=True, file_reader=file_reader)
+            else:
+                nexus_file = NexusFile(location=file_path, include_locations=None, origin=fcs_file_path,
+                                       include_objects=None, file_content_as_list=None)
+                fcs_file.__unloaded_sections.add(key)
+            if method is not None:
+                # for keywords that have multiple methods we store the value in a dictionary
+                # with the method number and the NexusFile object
                 fcs_property = getattr(fcs_file, cls.fcs_keyword_map_multi()[key])
                 # manually initialise if the property is still a None after class instantiation
                 if fcs_property is None:
@@ -189,24 +254,15 @@ class FcsNexusFile(NexusFile):
                 # shallow copy to maintain list elements pointing to nexus_file that are
                 # stored in the file_content_as_list
                 fcs_property_list = fcs_property.copy()
-                fcs_property_list.update({int(method_number): nexus_file})
+                fcs_property_list.update({int(method): nexus_file})
                 # set the attribute in the FcsNexusFile instance
                 setattr(fcs_file, cls.fcs_keyword_map_multi()[key], fcs_property_list)
-                fcs_file.include_objects.append(nexus_file)
-                fcs_file.include_locations.append(full_file_path)
-                fcs_file.files_info.append((nexus_file.location, nexus_file.linked_user,
-                                            nexus_file.last_modified))
-            elif key in cls.fcs_keyword_map_single():
-                full_file_path = nfo.get_full_file_path(value, origin_path)
-                nexus_file = NexusFile.generate_file_include_structure(
-                    value, origin=fcs_file_path, recursive=recursive, top_level_file=True)
-                setattr(fcs_file, cls.fcs_keyword_map_single()[key], nexus_file)
-                fcs_file.include_objects.append(nexus_file)
-                fcs_file.include_locations.append(full_file_path)
-                fcs_file.files_info.append((nexus_file.location, nexus_file.linked_user,
-                                            nexus_file.last_modified))
             else:
-                continue
+                setattr(fcs_file, cls.fcs_keyword_map_single()[key], nexus_file)
+            fcs_file.include_objects.append(nexus_file)
+            fcs_file.include_locations.append(full_file_path)
+            fcs_file.files_info.append((nexus_file.location, nexus_file.linked_user,
+                                        nexus_file.last_modified))
         return fcs_file
 
     @staticmethod
@@ -255,6 +311,119 @@ class FcsNexusFile(NexusFile):
         return_dict = dict(single_keywords, **multi_keywords)
         return return_dict
 
+    def iterate_model_files(self) -> Generator[NexusFile, None, None]:
+        """Iterates over every file in the model referenced directly by the fcs file."""
+        for _, file in self.iterate_model_files_with_attribute():
+            yield file
+
+    def iterate_model_files_with_attribute(self) -> Generator[tuple[str, NexusFile], None, None]:
+        """Iterates over every file in the model referenced directly by the fcs file, along with the name of the \
+        attribute holding the file, e.g. 'well_files'.
+        """
+        for attr_name in self.fcs_keyword_map_single().values():
+            file: None | NexusFile = getattr(self, attr_name, None)
+            if file is not None:
+                yield attr_name, file
+        for attr_name in self.fcs_keyword_map_multi().values():
+            file_dict: None | dict[int, NexusFile] = getattr(self, attr_name, None)
+            if file_dict is not None:
+                # copy the files in case they are replaced while iterating
+                for method_file in list(file_dict.values()):
+                    yield attr_name, method_file
+
+    @property
+    def unloaded_sections(self) -> set[str]:
+        """The fcs keywords of the model files that have only been recorded by path and not yet read."""
+        return set(self.__unloaded_sections)
+
+    def load_section(self, section: str, recursive: bool = True,
+                     file_reader: Optional[IncludeFileReader] = None) -> bool:
+        """Reads the model files for a section that was skipped when generating the fcs structure.
+
+        Args:
+            section (str): fcs keyword for the model files to load, e.g. 'PVT'. Case insensitive.
+            recursive (bool, optional): Whether the NexusFile structure will be recursively created. Defaults to True.
+            file_reader (Optional[IncludeFileReader], optional): reader to share with other calls loading files from \
+                the same model. Defaults to None, which creates a new reader.
+
+        Returns:
+            bool: True if any files were loaded, False if the section had already been loaded.
+        """
+        section = section.upper()
+        if section not in self.__unloaded_sections:
+            return False
+        if file_reader is None:
+            with IncludeFileReader() as new_file_reader:
+                return self.load_section(section, recursive=recursive, file_reader=new_file_reader)
+
+        attr_name = {**self.fcs_keyword_map_single(), **self.fcs_keyword_map_multi()}[section]
+        section_files = [file for file_attr_name, file in self.iterate_model_files_with_attribute()
+                         if file_attr_name == attr_name]
+        for file in section_files:
+            if file.location is None:
+                continue
+            loaded_file = NexusFile.generate_file_include_structure(
+                file.location, origin=file.origin, recursive=recursive, top_level_file=True, file_reader=file_reader)
+            self.replace_model_file(file, loaded_file)
+        self.__unloaded_sections.discard(section)
+        return True
+
+    def find_fcs_files_changed_on_disk(self) -> list[NexusFile]:
+        """Finds the fcs file and any files it includes that have been modified, created or deleted on disk since \
+        they were loaded. Doesn't check the model files referenced by the fcs file.
+
+        Returns:
+            list[NexusFile]: the files that have changed on disk.
+        """
+        if self.__fcs_include_structure is None:
+            return []
+        return self.__fcs_include_structure.find_files_changed_on_disk()
+
+    def replace_model_file(self, old_file: NexusFile, new_file: NexusFile) -> None:
+        """Replaces a file referenced directly by the fcs file with a new file, for example after reloading it.
+
+        Args:
+            old_file (NexusFile): the model file to replace.
+            new_file (NexusFile): the file to replace it with.
+
+        Raises:
+            ValueError: if old_file is not one of the model files.
+        """
+        found = False
+        for attr_name in self.fcs_keyword_map_single().values():
+            if getattr(self, attr_name, None) is old_file:
+                setattr(self, attr_name, new_file)
+                found = True
+        for attr_name in self.fcs_keyword_map_multi().values():
+            file_dict: None | dict[int, NexusFile] = getattr(self, attr_name, None)
+            if file_dict is None:
+                continue
+            for method_number, file in file_dict.items():
+                if file is old_file:
+                    file_dict[method_number] = new_file
+                    found = True
+        if not found:
+            raise ValueError(f'{old_file.location} is not a model file of {self.location}')
+
+        if self.include_objects is not None:
+            for i, file in enumerate(self.include_objects):
+                if file is old_file:
+                    self.include_objects[i] = new_file
+                    # files_info starts with the fcs file followed by the details of each of the include objects
+                    if len(self.files_info) == len(self.include_objects) + 1:
+                        self.files_info[i + 1] = (new_file.location, new_file.linked_user, new_file.last_modified)
+
+    @contextmanager
+    def batch_edit(self) -> Generator[Self, None, None]:
+        """Context manager for making many edits to the model files, with each file flattened at most once. See \
+        NexusFile.batch_edit for details.
+        """
+        with ExitStack() as stack:
+            for file in self.iterate_model_files():
+                stack.enter_context(file.batch_edit())
+            with super().batch_edit():
+                yield self
+
     def update_model_files(self, new_file_path: None | str = None, new_include_file_location: None | str = None,
                            write_out_all_files: bool = False, preserve_file_names: bool = False,
                            overwrite_include_files: bool = False) -> None:
@@ -270,9 +439,16 @@ class FcsNexusFile(NexusFile):
             preserve_file_names (bool): Defaults to False. If True will derive names from the existing fcs_file.
             If False will derive new names from the new fcs file name and the property it represents in Nexus.
             overwrite_include_files (bool): Defaults to False. If True will overwrite the included files.
+            Any sections skipped when the fcs structure was generated are loaded before the files are written.
         """
         # Take the original file, find which files have changed and write out those locations
 
+        # model files that have only been recorded by path have no content to write out, so read them first
+        if self.__unloaded_sections:
+            with IncludeFileReader() as file_reader:
+                for section in sorted(self.__unloaded_sections):
+                    self.load_section(section, file_reader=file_reader)
+
         if new_file_path is not None:
             file_location = new_file_path
             new_fcs_name = os.path.basename(new_file_path).replace('.fcs', '')
@@ -358,7 +534,8 @@ class FcsNexusFile(NexusFile):
         file_changed = False
         if self.file_content_as_list is None:
             raise ValueError('No file content to change file path on.')
-        for index, line in enumerate(self.get_flat_list_str_file):
+        flat_file = self.get_flat_list_str_file
+        for index, line in enumerate(flat_file):
             if not nfo.check_token(token, line):
                 continue
 
@@ -368,7 +545,7 @@ class FcsNexusFile(NexusFile):
                 if int(method_num_in_file) != method_number:
                     continue
             else:
-                path_to_replace = nfo.get_expected_token_value(token, line, self.get_flat_list_str_file)
+                path_to_replace = nfo.get_expected_token_value_at(token, index, flat_file)
             # edit the file as list
             file_to_edit, index_to_mod = self.find_which_include_file(flattened_index=index)
             if file_to_edit.file_content_as_list is None:
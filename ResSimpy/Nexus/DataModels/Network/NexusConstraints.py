@@ -4,8 +4,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Mapping, Sequence, cast
 from uuid import UUID
 
-import pandas as pd
-
 from ResSimpy.Constraint import Constraint
 from ResSimpy.Constraints import Constraints
 from ResSimpy.Nexus.nexus_collect_tables import collect_all_tables_to_objects
@@ -16,6 +14,7 @@ from ResSimpy.Utils.obj_to_dataframe import obj_to_dataframe
 import ResSimpy.Nexus.nexus_file_operations as nfo
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusNetwork import NexusNetwork
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
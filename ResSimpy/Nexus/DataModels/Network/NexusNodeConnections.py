@@ -2,7 +2,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from uuid import UUID
 
-import pandas as pd
 from typing import Sequence, Optional, TYPE_CHECKING
 
 from ResSimpy.File import File
@@ -18,6 +17,7 @@ from ResSimpy.NodeConnections import NodeConnections
 from ResSimpy.Utils.obj_to_dataframe import obj_to_dataframe
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusNetwork import NexusNetwork
 
 
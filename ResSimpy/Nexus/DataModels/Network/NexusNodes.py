@@ -3,8 +3,6 @@ from dataclasses import dataclass, field
 from uuid import UUID
 from typing import Sequence, Optional, TYPE_CHECKING
 
-import pandas as pd
-
 from ResSimpy.File import File
 from ResSimpy.Nexus.nexus_add_new_object_to_file import AddObjectOperations
 from ResSimpy.Nexus.nexus_collect_tables import collect_all_tables_to_objects
@@ -16,6 +14,7 @@ from ResSimpy.Nodes import Nodes
 from ResSimpy.Utils.obj_to_dataframe import obj_to_dataframe
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusNetwork import NexusNetwork
 
 
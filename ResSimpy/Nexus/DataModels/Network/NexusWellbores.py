@@ -4,8 +4,6 @@ from dataclasses import field, dataclass
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
-
 from ResSimpy.File import File
 from ResSimpy.Nexus.nexus_add_new_object_to_file import AddObjectOperations
 from ResSimpy.Nexus.nexus_collect_tables import collect_all_tables_to_objects
@@ -17,6 +15,7 @@ from ResSimpy.Utils.obj_to_dataframe import obj_to_dataframe
 from ResSimpy.Wellbores import Wellbores
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusNetwork import NexusNetwork
 
 
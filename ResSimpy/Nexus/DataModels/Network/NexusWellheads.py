@@ -3,8 +3,6 @@ from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
-
 from ResSimpy.File import File
 from ResSimpy.Nexus.nexus_add_new_object_to_file import AddObjectOperations
 from ResSimpy.Nexus.nexus_collect_tables import collect_all_tables_to_objects
@@ -16,6 +14,7 @@ from ResSimpy.Utils.obj_to_dataframe import obj_to_dataframe
 from ResSimpy.Wellheads import Wellheads
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusNetwork import NexusNetwork
 
 
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.aquifer_keywords import AQUIFER_SINGLE_KEYWORDS, AQUIFER_TABLE_KEYWORDS
 from ResSimpy.Nexus.NexusKeywords.aquifer_keywords import AQUIFER_KEYWORDS_VALUE_FLOAT, AQUIFER_KEYWORDS_VALUE_INT
@@ -12,6 +11,10 @@ from ResSimpy.DynamicProperty import DynamicProperty
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -42,6 +45,7 @@ class NexusAquiferMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with aquifer data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         aquifer_dict = self.properties
         for key, value in aquifer_dict.items():
@@ -82,31 +86,29 @@ class NexusAquiferMethod(DynamicProperty):
         for table_name in AQUIFER_TABLE_KEYWORDS:
             table_being_read[table_name] = False
 
+        single_keywords = KeywordMatcher(AQUIFER_TYPE_KEYWORDS + AQUIFER_SINGLE_KEYWORDS)
+        float_keywords = KeywordMatcher(AQUIFER_KEYWORDS_VALUE_FLOAT)
+        int_keywords = KeywordMatcher(AQUIFER_KEYWORDS_VALUE_INT)
+        aquifer_keywords = KeywordMatcher(AQUIFER_KEYWORDS)
+
         line_indx = 0
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Find standalone aquifer keywords, such as CARTER_TRACY or LINEAR
-            if [i for i in line.split() if i in AQUIFER_TYPE_KEYWORDS + AQUIFER_SINGLE_KEYWORDS]:
-                for word in AQUIFER_TYPE_KEYWORDS + AQUIFER_SINGLE_KEYWORDS:
-                    if nfo.check_token(word, line):
-                        self.properties[word] = ''
+            for word in single_keywords.find_all(line):
+                self.properties[word] = ''
             # Find AQUIFER key-float value pairs, such as LINFAC 0.8 or BAQ 20.
-            if [i for i in line.split() if i in AQUIFER_KEYWORDS_VALUE_FLOAT]:
-                for key in AQUIFER_KEYWORDS_VALUE_FLOAT:
-                    if nfo.check_token(key, line):
-                        self.properties[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
+            for key in float_keywords.find_all(line):
+                self.properties[key] = float(nfo.get_expected_token_value_at(key, line_index, file_as_list))
             # Find AQUIFER key-int value pairs, such as ITDPD 1 or IWATER 2
-            if [i for i in line.split() if i in AQUIFER_KEYWORDS_VALUE_INT]:
-                for key in AQUIFER_KEYWORDS_VALUE_INT:
-                    if nfo.check_token(key, line):
-                        self.properties[key] = int(nfo.get_expected_token_value(key, line, file_as_list))
+            for key in int_keywords.find_all(line):
+                self.properties[key] = int(nfo.get_expected_token_value_at(key, line_index, file_as_list))
 
             # Find beginning and ending indices of tables
             for table_key in AQUIFER_TABLE_KEYWORDS:
                 if (table_key == 'TRACER' and table_being_read[table_key] and nfo.check_token('END' + table_key,
                                                                                               line)) \
-                        or (table_key == 'TDPD' and table_being_read[table_key] and
-                            [i for i in line.split() if nfo.check_token(i, line) and i in AQUIFER_KEYWORDS]):
+                        or (table_key == 'TDPD' and table_being_read[table_key] and aquifer_keywords.found_in(line)):
                     table_being_read[table_key] = False
                     aquifer_table_indices[table_key][1] = line_indx
                 if nfo.check_token(table_key, line):
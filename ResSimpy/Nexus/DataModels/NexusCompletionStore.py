@@ -0,0 +1,368 @@
+"""Columnar storage for the completions loaded from Nexus wellspec files."""
+from __future__ import annotations
+
+import math
+import uuid
+from array import array
+from typing import Any, Iterable, Iterator, MutableSequence, Optional, Sequence, TYPE_CHECKING, Union, overload
+
+from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
+from ResSimpy.Nexus.DataModels.NexusRelPermEndPoint import NexusRelPermEndPoint
+from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+
+if TYPE_CHECKING:
+    import numpy as np
+
+CompletionValue = Union[None, int, float, str]
+
+# Constructor arguments of NexusCompletion that differ from the name of the attribute they set
+_CONSTRUCTOR_ARGUMENTS = {'polymer_block_radius': 'polymer_bore_radius'}
+_NO_CATEGORY = -1
+# Columns in the same order as NexusCompletion.to_dict
+_COMPLETION_COLUMNS: tuple[tuple[str, type], ...] = (*NexusCompletion.get_keyword_mapping().values(), ('date', str))
+_END_POINT_COLUMNS: tuple[str, ...] = tuple(x[0] for x in NexusRelPermEndPoint.nexus_mapping().values())
+# Order of the completion columns in DataFrames, the same as the keys of NexusCompletion.to_dict
+COMPLETION_COLUMN_NAMES: tuple[str, ...] = (*(x[0] for x in _COMPLETION_COLUMNS), *_END_POINT_COLUMNS)
+
+
+class NexusCompletionStore:
+    """Holds the properties of many completions in columns rather than as one object per completion.
+
+    Numeric properties are stored as arrays of floats, with nan for values that weren't set, and text properties and
+    dates as arrays of integer codes into a list of the distinct values. A column is only created once a value is set
+    for it, so properties not used in the wellspec tables take no space. Relative permeability end points are rare so
+    are stored only for the rows that have them.
+
+    A NexusCompletion is only created for a row when it is first accessed, after which that object holds the
+    properties of the row, so that any changes made to it are kept. Completions added after loading are stored as
+    objects from the start.
+    """
+
+    def __init__(self, date_format: Optional[DateFormat] = None, start_date: Optional[str] = None) -> None:
+        """Initialises the NexusCompletionStore class.
+
+        Args:
+            date_format (Optional[DateFormat]): date format of the dates of the completions.
+            start_date (Optional[str]): start date of the model, used for completions with numeric dates.
+        """
+        self.date_format: Optional[DateFormat] = date_format
+        self.start_date: Optional[str] = start_date
+        self.__attribute_types: dict[str, type] = dict(NexusCompletion.get_keyword_mapping().values())
+        self.__row_count: int = 0
+        self.__ids: list[uuid.UUID] = []
+        self.__numeric_columns: dict[str, array[float]] = {}
+        self.__text_columns: dict[str, array[int]] = {}
+        self.__categories: dict[str, list[str]] = {}
+        self.__category_codes: dict[str, dict[str, int]] = {}
+        self.__end_points: dict[int, NexusRelPermEndPoint] = {}
+        self.__completions: dict[int, NexusCompletion] = {}
+        self.__text_columns['date'] = array('i')
+
+    def __len__(self) -> int:
+        return self.__row_count
+
+    def __category_code(self, column: str, value: str) -> int:
+        codes = self.__category_codes.setdefault(column, {})
+        code = codes.get(value, None)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            self.__categories.setdefault(column, []).append(value)
+        return code
+
+    def append(self, date: str, values: Iterable[tuple[str, CompletionValue]],
+               rel_perm_end_point: Optional[NexusRelPermEndPoint] = None,
+               completion_id: Optional[uuid.UUID] = None) -> int:
+        """Adds a row for a completion.
+
+        Args:
+            date (str): date of the completion.
+            values (Iterable[tuple[str, CompletionValue]]): attribute name and value of each property set for the \
+                completion. The attribute names are those in NexusCompletion.get_keyword_mapping.
+            rel_perm_end_point (Optional[NexusRelPermEndPoint]): the relative permeability end points of the \
+                completion, if there are any.
+            completion_id (Optional[uuid.UUID]): id of the completion, a new one is generated if not provided.
+
+        Returns:
+            int: the row the completion was added at.
+        """
+        row = self.__row_count
+        self.__row_count += 1
+        self.__ids.append(uuid.uuid4() if completion_id is None else completion_id)
+        self.__text_columns['date'].append(self.__category_code('date', date))
+        set_columns: set[str] = {'date'}
+        for attribute, value in values:
+            if value is None:
+                continue
+            set_columns.add(attribute)
+            if self.__attribute_types[attribute] is str:
+                column = self.__text_columns.get(attribute, None)
+                if column is None:
+                    column = self.__text_columns[attribute] = array('i', [_NO_CATEGORY]) * row
+                column.append(self.__category_code(attribute, str(value)))
+            else:
+                numeric_column = self.__numeric_columns.get(attribute, None)
+                if numeric_column is None:
+                    numeric_column = self.__numeric_columns[attribute] = array('d', [math.nan]) * row
+                numeric_column.append(float(value))
+        # keep every column the same length
+        for attribute, numeric_column in self.__numeric_columns.items():
+            if attribute not in set_columns:
+                numeric_column.append(math.nan)
+        for attribute, text_column in self.__text_columns.items():
+            if attribute not in set_columns:
+                text_column.append(_NO_CATEGORY)
+        if rel_perm_end_point is not None:
+            self.__end_points[row] = rel_perm_end_point
+        return row
+
+    def add_completion(self, completion: NexusCompletion) -> int:
+        """Adds a row holding an existing completion object.
+
+        Args:
+            completion (NexusCompletion): the completion to add.
+
+        Returns:
+            int: the row the completion was added at.
+        """
+        row = self.append(completion.date, (), completion_id=completion.id)
+        self.__completions[row] = completion
+        return row
+
+    def row_id(self, row: int) -> uuid.UUID:
+        """Returns the id of the completion in a row without creating the completion."""
+        return self.__ids[row]
+
+    def is_materialized(self, row: int) -> bool:
+        """Returns True if the completion object for a row has been created."""
+        return row in self.__completions
+
+    def get_value(self, row: int, attribute: str) -> CompletionValue:
+        """Returns the value of a property for a row, from the completion object if it has been created.
+
+        Args:
+            row (int): the row to get the value from.
+            attribute (str): name of the attribute, e.g. 'k' or 'date'.
+        """
+        completion = self.__completions.get(row, None)
+        if completion is not None:
+            return getattr(completion, attribute)
+        text_column = self.__text_columns.get(attribute, None)
+        if text_column is not None:
+            code = text_column[row]
+            return None if code == _NO_CATEGORY else self.__categories[attribute][code]
+        numeric_column = self.__numeric_columns.get(attribute, None)
+        if numeric_column is None or math.isnan(numeric_column[row]):
+            return None
+        value = numeric_column[row]
+        return int(value) if self.__attribute_types[attribute] is int else value
+
+    def completion(self, row: int) -> NexusCompletion:
+        """Returns the completion for a row, creating it the first time it is requested."""
+        completion = self.__completions.get(row, None)
+        if completion is not None:
+            return completion
+        arguments: dict[str, CompletionValue] = {}
+        for attribute in self.__numeric_columns:
+            arguments[_CONSTRUCTOR_ARGUMENTS.get(attribute, attribute)] = self.get_value(row, attribute)
+        for attribute in self.__text_columns:
+            if attribute != 'date':
+                arguments[_CONSTRUCTOR_ARGUMENTS.get(attribute, attribute)] = self.get_value(row, attribute)
+        date = self.get_value(row, 'date')
+        completion = NexusCompletion(date=str(date), rel_perm_end_point=self.__end_points.get(row, None),
+                                     date_format=self.date_format, start_date=self.start_date, id=self.row_id(row),
+                                     **arguments)  # type: ignore[arg-type]
+        self.__completions[row] = completion
+        return completion
+
+    def get_columns(self, rows: Sequence[int]) -> dict[str, Any]:
+        """Returns the values of every property for the given rows as NumPy arrays, without creating completions.
+
+        Values are taken from the completion object for any row where it has been created. Numeric properties are
+        float arrays with nan for values that aren't set, or int arrays for integer properties set on every row. Text
+        properties and dates are object arrays with None for values that aren't set. Properties not set on any of the
+        rows are left out.
+
+        Args:
+            rows (Sequence[int]): rows to get the values for, in order.
+
+        Returns:
+            dict[str, Any]: NumPy array of values for each property, in the column order of NexusCompletion.to_dict.
+        """
+        import numpy as np
+
+        row_index = np.asarray(rows, dtype=np.int64)
+        materialized = [] if not self.__completions else \
+            [(position, self.__completions[row]) for position, row in enumerate(rows) if row in self.__completions]
+        columns: dict[str, np.ndarray] = {}
+        for attribute, attribute_type in _COMPLETION_COLUMNS:
+            values = self.__column_values(attribute, attribute_type, row_index)
+            changed_values = [(position, getattr(completion, attribute)) for position, completion in materialized]
+            if values is None:
+                if all(value is None for _, value in changed_values):
+                    continue
+                values = np.full(len(row_index), None if attribute_type is str else np.nan,
+                                 dtype=object if attribute_type is str else np.float64)
+            values = _set_column_values(values, changed_values)
+            if attribute_type is int and values.dtype == np.float64 and not np.isnan(values).any():
+                values = values.astype(np.int64)
+            columns[attribute] = values
+
+        end_points = [(position, self.__end_points[row]) for position, row in enumerate(rows)
+                      if row in self.__end_points and row not in self.__completions]
+        end_points += [(position, completion.rel_perm_end_point) for position, completion in materialized
+                       if completion.rel_perm_end_point is not None]
+        end_point_dicts = [(position, end_point.to_dict()) for position, end_point in end_points]
+        for attribute in _END_POINT_COLUMNS if end_point_dicts else ():
+            columns[attribute] = _set_column_values(np.full(len(row_index), np.nan),
+                                                    [(position, x[attribute]) for position, x in end_point_dicts])
+        return columns
+
+    def __column_values(self, attribute: str, attribute_type: type, row_index: np.ndarray) -> Optional[np.ndarray]:
+        """Returns the stored values of a property for the given rows, or None if it hasn't been set for any row."""
+        import numpy as np
+
+        if attribute_type is str:
+            codes = self.__text_columns.get(attribute, None)
+            if codes is None:
+                return None
+            # the last category is None, so rows without a value (code -1) look it up
+            categories = np.array([*self.__categories.get(attribute, []), None], dtype=object)
+            return categories[np.asarray(codes, dtype=np.int64)[row_index]]
+        numeric_values = self.__numeric_columns.get(attribute, None)
+        if numeric_values is None:
+            return None
+        return np.asarray(numeric_values, dtype=np.float64)[row_index]
+
+
+def _set_column_values(values: np.ndarray, changed_values: list[tuple[int, Any]]) -> np.ndarray:
+    """Sets values at the given positions of a column, switching a float column to objects if a value isn't numeric."""
+    import numpy as np
+
+    if values.dtype == np.float64:
+        if any(not (value is None or isinstance(value, int | float)) for _, value in changed_values):
+            values = values.astype(object)
+            values[np.isnan(values.astype(np.float64))] = None
+        else:
+            changed_values = [(position, np.nan if value is None else value) for position, value in changed_values]
+    for position, value in changed_values:
+        values[position] = value
+    return values
+
+
+def completion_columns(completions: Sequence[NexusCompletion]) -> dict[str, Any]:
+    """Returns the values of every completion property as a column, taken straight from the store where possible.
+
+    Args:
+        completions (Sequence[NexusCompletion]): completions to get the values of.
+
+    Returns:
+        dict[str, Any]: sequence of values for each property, in the column order of NexusCompletion.to_dict.
+    """
+    if isinstance(completions, NexusCompletionList):
+        return completions.store.get_columns(completions.rows)
+    columns: dict[str, Any] = {attribute: [getattr(completion, attribute) for completion in completions]
+                               for attribute, _ in _COMPLETION_COLUMNS}
+    end_point_dicts = [None if x.rel_perm_end_point is None else x.rel_perm_end_point.to_dict() for x in completions]
+    if any(x is not None for x in end_point_dicts):
+        for attribute in _END_POINT_COLUMNS:
+            columns[attribute] = [None if x is None else x[attribute] for x in end_point_dicts]
+    return columns
+
+
+class NexusCompletionList(MutableSequence[NexusCompletion]):
+    """The completions of a single well, held as rows of a NexusCompletionStore.
+
+    Behaves like a list of NexusCompletions. The completion objects are only created when they are accessed.
+    """
+
+    def __init__(self, store: NexusCompletionStore, rows: Iterable[int] = ()) -> None:
+        """Initialises the NexusCompletionList class.
+
+        Args:
+            store (NexusCompletionStore): store holding the completions.
+            rows (Iterable[int]): rows of the store holding the completions of the well, in order.
+        """
+        self.__store = store
+        self.__rows: array[int] = array('q', rows)
+
+    @property
+    def store(self) -> NexusCompletionStore:
+        """The store holding the completions."""
+        return self.__store
+
+    @property
+    def rows(self) -> Sequence[int]:
+        """Rows of the store holding the completions, in order."""
+        return self.__rows
+
+    def _extend_rows(self, rows: Iterable[int]) -> None:
+        """Adds completions already in the store to the end of the list without creating the completion objects."""
+        self.__rows.extend(rows)
+
+    def get_values(self, attribute: str) -> list[CompletionValue]:
+        """Returns the value of an attribute, such as 'date' or 'k', for each completion without creating them."""
+        return [self.__store.get_value(row, attribute) for row in self.__rows]
+
+    def index_of_id(self, completion_id: uuid.UUID) -> int:
+        """Returns the position of the completion with the given id without creating the completion objects.
+
+        Raises:
+            ValueError: if there is no completion with the id.
+        """
+        for index, row in enumerate(self.__rows):
+            if self.__store.row_id(row) == completion_id:
+                return index
+        raise ValueError(f'No completion found for id: {completion_id}')
+
+    @overload
+    def __getitem__(self, index: int) -> NexusCompletion:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[NexusCompletion]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> NexusCompletion | list[NexusCompletion]:
+        if isinstance(index, slice):
+            return [self.__store.completion(row) for row in self.__rows[index]]
+        return self.__store.completion(self.__rows[index])
+
+    @overload
+    def __setitem__(self, index: int, value: NexusCompletion) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[NexusCompletion]) -> None:
+        ...
+
+    def __setitem__(self, index: int | slice, value: NexusCompletion | Iterable[NexusCompletion]) -> None:
+        if isinstance(index, slice):
+            if isinstance(value, NexusCompletion):
+                raise TypeError('Can only assign an iterable of completions to a slice')
+            self.__rows[index] = array('q', [self.__store.add_completion(x) for x in value])
+        elif isinstance(value, NexusCompletion):
+            self.__rows[index] = self.__store.add_completion(value)
+        else:
+            raise TypeError(f'Can only assign a NexusCompletion, instead got {type(value)}')
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self.__rows[index]
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def __iter__(self) -> Iterator[NexusCompletion]:
+        for row in self.__rows:
+            yield self.__store.completion(row)
+
+    def insert(self, index: int, value: NexusCompletion) -> None:
+        self.__rows.insert(index, self.__store.add_completion(value))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, list | NexusCompletionList):
+            return NotImplemented
+        return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Union, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Union, Optional
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Enums.UnitsEnum import SUnits, TemperatureUnits, UnitSystem
 from ResSimpy.Nexus.NexusKeywords.equil_keywords import EQUIL_INTSAT_KEYWORDS, EQUIL_KEYWORDS_VALUE_FLOAT
@@ -13,6 +12,10 @@ from ResSimpy.DynamicProperty import DynamicProperty
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -44,6 +47,7 @@ class NexusEquilMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with equilibration data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         equil_dict = self.properties
         for key, value in equil_dict.items():
@@ -95,16 +99,23 @@ class NexusEquilMethod(DynamicProperty):
         # Indicator of which of equilibration tables are being read
         table_being_read = ''
 
+        float_keywords = KeywordMatcher(EQUIL_KEYWORDS_VALUE_FLOAT)
+        single_keywords = KeywordMatcher(EQUIL_SINGLE_KEYWORDS)
+        intsat_keywords = KeywordMatcher(EQUIL_INTSAT_KEYWORDS)
+        table_keywords = KeywordMatcher(EQUIL_TABLE_KEYWORDS)
+        composition_keywords = KeywordMatcher(EQUIL_COMPOSITION_OPTIONS)
+        end_keywords = KeywordMatcher(EQUIL_KEYWORDS)
+
         line_indx = 0
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Find EQUIL key-value pairs, such as PINIT 3000, WOC 7000 or OVERREAD SW (list, multiple OVERREADs)
-            if [i for i in line.split() if i in EQUIL_KEYWORDS_VALUE_FLOAT]:
-                for key in EQUIL_KEYWORDS_VALUE_FLOAT:
-                    if nfo.check_token(key, line) and 'DEPTH' not in line.split():  # Ensure not a table header
-                        self.properties[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
+            if 'DEPTH' not in line.split():  # Ensure not a table header
+                for key in float_keywords.find_all(line):
+                    self.properties[key] = float(nfo.get_expected_token_value_at(key, line_index, file_as_list))
             if nfo.check_token('AUTOGOC_COMP', line):
-                self.properties['AUTOGOC_COMP'] = nfo.get_expected_token_value('AUTOGOC_COMP', line, file_as_list)
+                self.properties['AUTOGOC_COMP'] = nfo.get_expected_token_value_at('AUTOGOC_COMP', line_index,
+                                                                                  file_as_list)
             if nfo.check_token('OVERREAD', line):
                 overread_vals = line.split('!')[0].split('OVERREAD')[1].split()
                 if 'OVERREAD' in self.properties.keys() and isinstance(self.properties['OVERREAD'], list):
@@ -114,41 +125,32 @@ class NexusEquilMethod(DynamicProperty):
             if nfo.check_token('VIP_INIT', line):
                 self.properties['VIP_INIT'] = ' '.join(line.split('!')[0].split()[1:])
             # Find standalone equilibration keywords
-            if [i for i in line.split() if i in EQUIL_SINGLE_KEYWORDS]:
-                for word in EQUIL_SINGLE_KEYWORDS:
-                    if nfo.check_token(word, line):
-                        self.properties[word] = ''
+            for word in single_keywords.find_all(line):
+                self.properties[word] = ''
             # Handle integrated saturation initialization options
-            if [i for i in line.split() if i in EQUIL_INTSAT_KEYWORDS]:
-                for key in EQUIL_INTSAT_KEYWORDS:
-                    if nfo.check_token(key, line):
-                        if nfo.get_token_value(key, line, file_as_list) == 'MOBILE':
-                            self.properties[key] = 'MOBILE'
-                        else:
-                            self.properties[key] = ''
+            for key in intsat_keywords.find_all(line):
+                if nfo.get_token_value_at(key, line_index, file_as_list) == 'MOBILE':
+                    self.properties[key] = 'MOBILE'
+                else:
+                    self.properties[key] = ''
 
             # Find starting index of an equil-related table. There is usually only one per equil file
-            if [i for i in line.split() if i in EQUIL_TABLE_KEYWORDS]:
-                for table_keyword in EQUIL_TABLE_KEYWORDS:
-                    if nfo.check_token(table_keyword, line):
-                        equil_table_indices[table_keyword] = [line_indx + 1, len(file_as_list)]
-                        table_being_read = table_keyword
-                        start_reading_table = True
-                        if table_keyword == 'COMPOSITION' and [i for i in line.split() if i in
-                                                               EQUIL_COMPOSITION_OPTIONS]:
-                            for comp_key in EQUIL_COMPOSITION_OPTIONS:
-                                if nfo.check_token(comp_key, line):
-                                    self.properties[comp_key] = float(nfo.get_expected_token_value(comp_key,
-                                                                                                   line, file_as_list))
+            found_table_keywords = table_keywords.find_all(line)
+            if found_table_keywords:
+                for table_keyword in found_table_keywords:
+                    equil_table_indices[table_keyword] = [line_indx + 1, len(file_as_list)]
+                    table_being_read = table_keyword
+                    start_reading_table = True
+                    if table_keyword == 'COMPOSITION':
+                        for comp_key in composition_keywords.find_all(line):
+                            self.properties[comp_key] = float(nfo.get_expected_token_value_at(
+                                comp_key, line_index, file_as_list))
                 line_indx += 1
                 continue
             # Find ending index of an equil-related table. There is usually only one per equil file
-            if start_reading_table and 'DEPTH' not in line.split():
-                for potential_endkeyword in EQUIL_KEYWORDS:
-                    if nfo.check_token(potential_endkeyword, line):
-                        equil_table_indices[table_being_read][1] = line_indx
-                        start_reading_table = False
-                        break
+            if start_reading_table and 'DEPTH' not in line.split() and end_keywords.found_in(line):
+                equil_table_indices[table_being_read][1] = line_indx
+                start_reading_table = False
 
             line_indx += 1
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os.path
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional, Generator
+from typing import Any, Optional, Generator, Iterator, Mapping, Sequence, TYPE_CHECKING
 
 # Use correct Self type depending upon Python version
 import sys
@@ -18,13 +19,18 @@ import ResSimpy.Nexus.nexus_file_operations as nfo
 import warnings
 from ResSimpy.Nexus.NexusKeywords.structured_grid_keywords import GRID_OPERATION_KEYWORDS, GRID_ARRAY_FORMAT_KEYWORDS, \
     GRID_ARRAY_KEYWORDS
-from ResSimpy.Utils.factory_methods import get_empty_list_str, get_empty_list_nexus_file, \
-    get_empty_dict_uuid_list_int
+from ResSimpy.Nexus.DataModels.NexusFileContent import NexusFileContent
+from ResSimpy.Nexus.DataModels.NexusObjectLocations import NexusObjectLocations
+from ResSimpy.Nexus.include_file_reader import IncludeFileReader, ParsedIncludeFile, read_file
+from ResSimpy.Nexus.include_line_index import IncludeLineIndex
+from ResSimpy.Utils.factory_methods import get_empty_list_str, get_empty_list_nexus_file
 from ResSimpy.File import File
-import pathlib
-import os
 from datetime import datetime, timezone
 
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.file_content_cache import FileContentCache
+    from ResSimpy.Nexus.include_file_reader import FileReadResult
+
 
 @dataclass(kw_only=True, repr=True)
 class NexusFile(File):
@@ -38,12 +44,16 @@ class NexusFile(File):
             Defaults to None.
         linked_user (Optional[str]): user or owner of the file. Defaults to None
         last_modified (Optional[datetime]): last modified date of the file
+        file_content_as_list (Optional[list[str]]): lines of the file. Stored as a NexusFileContent so that changes \
+            to the content can be detected.
+        object_locations (Optional[NexusObjectLocations]): line numbers in the flattened file where each object is \
+            stored, keyed by the id of the object. Can be set from a dictionary.
     """
 
     include_locations: Optional[list[str]] = field(default=None)
     origin: Optional[str] = None
     include_objects: Optional[list[NexusFile]] = field(default=None, repr=False)
-    object_locations: Optional[dict[UUID, list[int]]] = field(default=None, repr=False)
+    __object_locations: Optional[NexusObjectLocations] = field(default=None, repr=False)
     line_locations: Optional[list[tuple[int, UUID]]] = field(default=None, repr=False)
     linked_user: Optional[str] = field(default=None)
     last_modified: Optional[datetime] = field(default=None)
@@ -55,6 +65,22 @@ class NexusFile(File):
                  file_content_as_list: Optional[list[str]] = None,
                  linked_user: Optional[str] = None,
                  last_modified: Optional[datetime] = None) -> None:
+        self.__flat_file_cache: Optional[tuple[tuple[tuple[UUID, int, Optional[str]], ...], list[str],
+                                               list[tuple[int, UUID]], list[int]]] = None
+        # the line_locations these rows belong to, and the index within its own file of the start of each segment
+        self.__line_location_rows: Optional[tuple[list[tuple[int, UUID]], list[int]]] = None
+        self.__include_line_index: Optional[IncludeLineIndex] = None
+        self.__include_line_index_source: Optional[list[tuple[int, UUID]]] = None
+        self.__include_line_index_source_size: int = 0
+        self.__batch_edit_depth: int = 0
+        self.__batch_flat_file: Optional[list[str]] = None
+        # settings the content was read from disk with, and the version of the content matching the file on disk
+        self.__content_source: Optional[tuple[bool, bool, bool]] = None
+        self.__content_version_on_disk: Optional[int] = None
+        self.__content_cache: Optional[FileContentCache] = None
+        self.__content_size: Optional[int] = None
+        # version of the content when it was unloaded by the content cache, None while the content is in memory
+        self.__evicted_content_version: Optional[int] = None
         super().__init__(location=location, file_content_as_list=file_content_as_list)
         if origin is not None and location is not None:
             self.location = nfo.get_full_file_path(location, origin)
@@ -67,15 +93,121 @@ class NexusFile(File):
         self.include_objects: Optional[list[NexusFile]] = get_empty_list_nexus_file() \
             if include_objects is None else include_objects
         if self.object_locations is None:
-            self.object_locations: dict[UUID, list[int]] = get_empty_dict_uuid_list_int()
+            self.object_locations = NexusObjectLocations()
         if self.line_locations is None:
             self.line_locations = []
         self.linked_user = linked_user
         self.last_modified = last_modified
 
+    # Overrides the dataclass field from File so that the content is always stored as a NexusFileContent
+    @property  # type: ignore[misc]
+    def file_content_as_list(self) -> Optional[list[str]]:
+        """The lines of the file, with any include files left as INCLUDE statements.
+
+        If the content has been unloaded by a FileContentCache it is read from disk again.
+        """
+        if self.__evicted_content_version is not None:
+            self.__reload_content()
+        content = self.__file_content_as_list
+        if self.__content_cache is not None and content is not None and self.__content_matches_disk():
+            if self.__content_size is None:
+                self.__content_size = sum(len(x) for x in content)
+            self.__content_cache.record_access(self, self.__content_size)
+        return content
+
+    @file_content_as_list.setter
+    def file_content_as_list(self, value: Optional[list[str]]) -> None:
+        if value is not None and not isinstance(value, NexusFileContent):
+            value = NexusFileContent(value)
+        self.__file_content_as_list = value
+        self.__content_size = None
+        self.__evicted_content_version = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # unloaded content is read back in so that the stored file is complete. The content cache is shared with other
+        # files so isn't stored with the file.
+        if self.__evicted_content_version is not None:
+            self.__reload_content()
+        state = self.__dict__.copy()
+        state['_NexusFile__content_cache'] = None
+        return state
+
+    def __set_content_read_from_disk(self, recursive: bool, skip_arrays: bool, top_level_file: bool) -> None:
+        """Records that the content of the file was just read from disk, so that it can be read again if unloaded."""
+        content = self.__file_content_as_list
+        if isinstance(content, NexusFileContent):
+            self.__content_source = (recursive, skip_arrays, top_level_file)
+            self.__content_version_on_disk = content.version
+
+    def __content_matches_disk(self) -> bool:
+        """Returns True if the content hasn't been modified since it was read from disk."""
+        content = self.__file_content_as_list
+        return isinstance(content, NexusFileContent) and content.version == self.__content_version_on_disk
+
+    def __reload_content(self) -> None:
+        """Reads the content of the file from disk again after it has been unloaded."""
+        if self.__content_source is None or self.location is None:
+            raise ValueError(f'Unable to reload the content of {self.location} as it was not read from disk')
+        read_result = read_file(self.location)
+        if read_result.file_as_list is None:
+            raise FileNotFoundError(f'Unable to reload the content of {self.location} as the file no longer exists')
+        version = self.__evicted_content_version
+        if read_result.last_modified != self.last_modified:
+            warnings.warn(f'{self.location} has changed on disk since the model was loaded, using the new content. '
+                          f'Call refresh on the model to reload the files that have changed.')
+            version = None
+        recursive, skip_arrays, top_level_file = self.__content_source
+        parsed_file = self.__find_include_files(read_result.file_as_list, self.location, recursive, skip_arrays,
+                                                top_level_file)
+        content = NexusFileContent(parsed_file.file_as_list, version=version)
+        self.__file_content_as_list = content
+        self.__content_version_on_disk = content.version
+        self.__content_size = None
+        self.__evicted_content_version = None
+
+    def _evict_content(self) -> bool:
+        """Unloads the content of the file if it hasn't been modified since it was read from disk. Called by \
+        FileContentCache.
+
+        Returns:
+            bool: True if the content was unloaded.
+        """
+        content = self.__file_content_as_list
+        if self.__batch_edit_depth > 0 or not isinstance(content, NexusFileContent) or \
+                not self.__content_matches_disk():
+            return False
+        self.__evicted_content_version = content.version
+        self.__file_content_as_list = None
+        return True
+
+    def _set_content_cache(self, content_cache: Optional[FileContentCache]) -> None:
+        """Sets the cache that limits the memory used by the content of this file. Called by FileContentCache."""
+        self.__content_cache = content_cache
+        if content_cache is not None and self.__content_source is not None:
+            # count the content towards the cache budget
+            _ = self.file_content_as_list
+
+    def _clear_flat_file_cache(self) -> None:
+        """Drops the cached flattened copy of the file, which is built again when next needed."""
+        self.__flat_file_cache = None
+
+    @property
+    def object_locations(self) -> Optional[NexusObjectLocations]:
+        """Line numbers in the flattened file where each object is stored, keyed by the id of the object."""
+        return self.__object_locations
+
+    @object_locations.setter
+    def object_locations(self, value: Optional[Mapping[UUID, list[int]]]) -> None:
+        if value is not None and not isinstance(value, NexusObjectLocations):
+            value = NexusObjectLocations(value)
+        self.__object_locations = value
+
     @classmethod
     def generate_file_include_structure(cls, file_path: str, origin: Optional[str] = None, recursive: bool = True,
-                                        skip_arrays: bool = True, top_level_file: bool = True) -> Self:
+                                        skip_arrays: bool = True, top_level_file: bool = True,
+                                        max_workers: Optional[int] = None,
+                                        file_reader: Optional[IncludeFileReader] = None,
+                                        include_objects_to_reuse: Optional[Sequence[NexusFile]] = None) -> Self:
         """Generates a nexus file instance for a provided text file with information storing the included files.
 
         Args:
@@ -85,53 +217,113 @@ class NexusFile(File):
             skip_arrays (bool): If set True skips the INCLUDE arrays that come after property array and VALUE
             top_level_file (bool): If set to True, the code assumes this is a 'top level' file rather than an included
             one.
+            max_workers (Optional[int]): maximum number of include files to read from disk at the same time. The \
+            include files are found a level at a time, and all the files at the same depth are read together. \
+            Defaults to None, which reads the files one after another. Ignored if file_reader is provided.
+            file_reader (Optional[IncludeFileReader]): reader to share between several calls to this method. \
+            Defaults to None, which creates a new reader with max_workers.
+            include_objects_to_reuse (Optional[Sequence[NexusFile]]): include files of this file that are already \
+            loaded and unchanged on disk. Where the file still includes them they are used as they are rather than \
+            being read again. Defaults to None, which reads every include file.
 
         Returns:
             NexusFile: a class instance for NexusFile with knowledge of include files
         """
-        def __get_pathlib_path_details(full_file_path: str):
-            if full_file_path == "" or full_file_path is None:
-                return None
-            pathlib_path = pathlib.Path(full_file_path)
-            owner: str = ''
-            group: str = ''
-            try:
-                owner = pathlib_path.owner()
-                group = pathlib_path.group()
-            except NotImplementedError:
-                # owner or group not supported on this system, continue without filling out that information
-                pass
-            except PermissionError:
-                # user doesn't have permission to access the file, continue without filling out that information
-                warnings.warn(f'PermissionError when trying to access file at {full_file_path}')
-                pass
-            except FileNotFoundError:
-                # file not found, continue without filling out that information
-                warnings.warn(f'FileNotFoundError when trying to access file at {full_file_path}')
-                pass
-
-            if owner is not None and group is not None:
-                return f"{owner}:{group}"
-            elif owner is not None:
-                return owner
-            return None
-
-        def __get_datetime_from_os_stat(full_file_path: str):
-            if full_file_path == "" or full_file_path is None:
-                return None
-            stat_obj = os.stat(full_file_path)
-            timestamp = stat_obj.st_mtime
-            if timestamp is None:
-                return None
-            return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-
-        full_file_path = file_path
-        if origin is not None:
-            full_file_path = nfo.get_full_file_path(file_path, origin)
+        if file_reader is None:
+            with IncludeFileReader(max_workers=max_workers) as new_file_reader:
+                return cls.generate_file_include_structure(file_path, origin=origin, recursive=recursive,
+                                                           skip_arrays=skip_arrays, top_level_file=top_level_file,
+                                                           file_reader=new_file_reader,
+                                                           include_objects_to_reuse=include_objects_to_reuse)
+
+        full_file_path = file_path if origin is None else nfo.get_full_file_path(file_path, origin)
+        file_to_load = _IncludeFileToLoad(file_path=file_path, origin=origin, full_file_path=full_file_path,
+                                          recursive=recursive, skip_arrays=skip_arrays, top_level_file=top_level_file)
+
+        # find the include files a level at a time, starting to read every include file in a level before reading the
+        # first of them, so that the reads of all the files at the same depth can happen at the same time
+        files_to_scan = [file_to_load]
+        while files_to_scan:
+            next_files_to_scan: list[_IncludeFileToLoad] = []
+            for file_to_scan in files_to_scan:
+                next_files_to_scan += cls.__scan_include_file(
+                    file_to_scan, file_reader, include_objects_to_reuse if file_to_scan is file_to_load else None)
+            file_reader.prefetch(x.full_file_path for x in next_files_to_scan)
+            files_to_scan = next_files_to_scan
+
+        # the NexusFile instances are then created depth first, in the same order as the files appear in the model
+        return cls.__create_from_scanned_file(file_to_load)
 
-        try:
-            file_as_list = nfo.load_file_as_list(full_file_path)
-        except FileNotFoundError:
+    @classmethod
+    def __scan_include_file(cls, file_to_scan: _IncludeFileToLoad, file_reader: IncludeFileReader,
+                            include_objects_to_reuse: Optional[Sequence[NexusFile]]) -> list[_IncludeFileToLoad]:
+        """Reads a file and finds the files it includes.
+
+        Args:
+            file_to_scan (_IncludeFileToLoad): the file to read. Filled in with the result of reading it.
+            file_reader (IncludeFileReader): reader used to read the file.
+            include_objects_to_reuse (Optional[Sequence[NexusFile]]): already loaded include files of the file to use \
+            rather than reading them again.
+
+        Returns:
+            list[_IncludeFileToLoad]: the include files that still need to be read.
+        """
+        read_result = file_reader.read(file_to_scan.full_file_path)
+        file_to_scan.read_result = read_result
+        if read_result.file_as_list is None:
+            return []
+        full_file_path = file_to_scan.full_file_path
+        skip_arrays = file_to_scan.skip_arrays
+
+        # files included several times are only scanned once, with the lines of the file shared between the NexusFile
+        # instances. Each instance still gets its own list of lines, so editing one doesn't change the others.
+        parsed_file = file_reader.get_parsed_file(full_file_path, read_result.modified_time, file_to_scan.recursive,
+                                                  skip_arrays, file_to_scan.top_level_file)
+        if parsed_file is None:
+            parsed_file = cls.__find_include_files(read_result.file_as_list, full_file_path, file_to_scan.recursive,
+                                                   skip_arrays, file_to_scan.top_level_file)
+            file_reader.store_parsed_file(full_file_path, read_result.modified_time, file_to_scan.recursive,
+                                          skip_arrays, file_to_scan.top_level_file, parsed_file)
+        file_to_scan.parsed_file = parsed_file
+
+        # only reuse include files that were loaded with the same settings as this method loads them with
+        reusable_includes: dict[str, list[NexusFile]] = {}
+        for include_object in include_objects_to_reuse or []:
+            if include_object.location is not None and include_object.__content_source == (True, skip_arrays, False):
+                include_full_path = nfo.get_full_file_path(include_object.location, origin=full_file_path)
+                reusable_includes.setdefault(include_full_path, []).append(include_object)
+
+        files_to_read: list[_IncludeFileToLoad] = []
+        for inc_file_path, is_skipped_array in parsed_file.include_files:
+            inc_full_path = nfo.get_full_file_path(inc_file_path, origin=full_file_path)
+            matching_includes = reusable_includes.get(inc_full_path)
+            if is_skipped_array:
+                file_to_scan.include_files.append(None)
+            elif matching_includes:
+                file_to_scan.include_files.append(matching_includes.pop(0))
+            else:
+                inc_file = _IncludeFileToLoad(file_path=inc_file_path, origin=full_file_path,
+                                              full_file_path=inc_full_path, recursive=True, skip_arrays=skip_arrays,
+                                              top_level_file=False)
+                file_to_scan.include_files.append(inc_file)
+                files_to_read.append(inc_file)
+        return files_to_read
+
+    @classmethod
+    def __create_from_scanned_file(cls, scanned_file: _IncludeFileToLoad) -> Self:
+        """Creates the NexusFile instance for a file and its include files once they have all been read.
+
+        Args:
+            scanned_file (_IncludeFileToLoad): the file as read by __scan_include_file.
+
+        Returns:
+            NexusFile: a class instance for NexusFile with knowledge of include files
+        """
+        file_path = scanned_file.file_path
+        origin = scanned_file.origin
+        read_result = scanned_file.read_result
+        parsed_file = scanned_file.parsed_file
+        if read_result is None or parsed_file is None:
             # handle if a file can't be found
             location = file_path
 
@@ -146,14 +338,73 @@ class NexusFile(File):
             return nexus_file_class
 
         # check last modified and user for the file
-        user = __get_pathlib_path_details(full_file_path)
-        last_changed = __get_datetime_from_os_stat(full_file_path)
+        user = read_result.linked_user
+        last_changed = read_result.last_modified
+
+        includes_objects: list[NexusFile] = []
+        for (inc_file_path, _), include_file in zip(parsed_file.include_files, scanned_file.include_files):
+            inc_file: NexusFile
+            if include_file is None:
+                inc_file = cls(location=inc_file_path,
+                               include_locations=None,
+                               origin=scanned_file.full_file_path,
+                               include_objects=None,
+                               file_content_as_list=None,
+                               linked_user=user,
+                               last_modified=last_changed)
+            elif isinstance(include_file, _IncludeFileToLoad):
+                inc_file = cls.__create_from_scanned_file(include_file)
+            else:
+                inc_file = include_file
+            includes_objects.append(inc_file)
+
+        recursive, skip_arrays, top_level_file = \
+            scanned_file.recursive, scanned_file.skip_arrays, scanned_file.top_level_file
+        if parsed_file.ends_with_embedded_array:
+            # an 'embedded' grid array file only keeps the content up to the array to help with performance
+            embedded_array_file = cls(
+                location=file_path,
+                include_locations=list(parsed_file.include_locations),
+                origin=origin,
+                include_objects=includes_objects,
+                file_content_as_list=parsed_file.file_as_list
+            )
+            embedded_array_file.__set_content_read_from_disk(recursive, skip_arrays, top_level_file)
+            return embedded_array_file
 
+        nexus_file_class = cls(
+            location=file_path,
+            include_locations=list(parsed_file.include_locations),
+            origin=origin,
+            include_objects=None if not includes_objects else includes_objects,
+            file_content_as_list=parsed_file.file_as_list,
+            linked_user=user,
+            last_modified=last_changed
+        )
+        nexus_file_class.__set_content_read_from_disk(recursive, skip_arrays, top_level_file)
+
+        return nexus_file_class
+
+    @staticmethod
+    def __find_include_files(file_as_list: list[str], full_file_path: str, recursive: bool, skip_arrays: bool,
+                             top_level_file: bool) -> ParsedIncludeFile:
+        """Joins any continued lines in a file and finds the files that it includes.
+
+        Args:
+            file_as_list (list[str]): lines of the file as read from disk.
+            full_file_path (str): path to the file, used to find the full path of the include files.
+            recursive (bool): Whether the include files should be loaded.
+            skip_arrays (bool): If set True skips the INCLUDE arrays that come after property array and VALUE
+            top_level_file (bool): If set to False, stops at the first embedded grid array in the file.
+
+        Returns:
+            ParsedIncludeFile: the joined lines of the file and the files it includes.
+        """
         # prevent python from mutating the lists that it's iterating over
         modified_file_as_list: list[str] = []
         # search for the INCLUDE keyword and append to a list:
         inc_file_list: list[str] = []
-        includes_objects: Optional[list[NexusFile]] = []
+        include_files: list[tuple[str, bool]] = []
         skip_next_include = False
         previous_line: str
 
@@ -171,8 +422,8 @@ class NexusFile(File):
             if nfo.check_token("INCLUDE", line):
                 # Include found, check if we should skip loading it in (e.g. if it is a large array file)
                 ignore_keywords = ['NOLIST']
-                previous_value = nfo.get_previous_value(file_as_list=file_as_list[0: i + 1], search_before='INCLUDE',
-                                                        ignore_values=ignore_keywords)
+                previous_value = nfo.get_previous_value_at(line_index=i, file_as_list=file_as_list,
+                                                           search_before='INCLUDE', ignore_values=ignore_keywords)
 
                 keywords_to_skip_include = GRID_ARRAY_FORMAT_KEYWORDS + GRID_OPERATION_KEYWORDS + ["CORP"]
                 if previous_value is None:
@@ -184,29 +435,23 @@ class NexusFile(File):
             elif nfo.check_token("VALUE", line) and not top_level_file:
                 # Check if this is an 'embedded' grid array file. If it is, return this file with only the content up
                 # to this point to help with performance when analysing the files.
-                previous_value = nfo.get_previous_value(file_as_list=file_as_list[0: i + 1], search_before='VALUE')
-                next_value = nfo.get_next_value(start_line_index=0, file_as_list=file_as_list[i:],
+                previous_value = nfo.get_previous_value_at(line_index=i, file_as_list=file_as_list,
+                                                           search_before='VALUE')
+                next_value = nfo.get_next_value(start_line_index=i, file_as_list=file_as_list,
                                                 search_string=line.upper().split('VALUE')[1])
 
                 if previous_value is None or next_value is None:
                     continue
 
                 if next_value.upper() != 'INCLUDE' and previous_value.upper() in GRID_ARRAY_KEYWORDS:
-                    nexus_file_class = cls(
-                        location=file_path,
-                        include_locations=inc_file_list,
-                        origin=origin,
-                        include_objects=includes_objects,
-                        file_content_as_list=modified_file_as_list
-                    )
-
-                    return nexus_file_class
+                    return ParsedIncludeFile(file_as_list=modified_file_as_list, include_locations=inc_file_list,
+                                             include_files=include_files, ends_with_embedded_array=True)
                 else:
                     continue
 
             else:
                 continue
-            inc_file_path = nfo.get_token_value('INCLUDE', line, file_as_list)
+            inc_file_path = nfo.get_token_value_at('INCLUDE', i, file_as_list)
             if inc_file_path is None:
                 continue
             inc_full_path = nfo.get_full_file_path(inc_file_path, origin=full_file_path)
@@ -215,37 +460,13 @@ class NexusFile(File):
             if not recursive:
                 continue
             elif skip_arrays and skip_next_include:
-                inc_file = cls(location=inc_file_path,
-                               include_locations=None,
-                               origin=full_file_path,
-                               include_objects=None,
-                               file_content_as_list=None,
-                               linked_user=user,
-                               last_modified=last_changed)
-                if includes_objects is None:
-                    raise ValueError('include_objects is None - recursion failure.')
+                include_files.append((inc_file_path, True))
                 skip_next_include = False
             else:
-                inc_file = cls.generate_file_include_structure(inc_file_path, origin=full_file_path, recursive=True,
-                                                               skip_arrays=skip_arrays, top_level_file=False)
-                if includes_objects is None:
-                    raise ValueError('include_objects is None - recursion failure.')
-
-            includes_objects.append(inc_file)
+                include_files.append((inc_file_path, False))
 
-        includes_objects = None if not includes_objects else includes_objects
-
-        nexus_file_class = cls(
-            location=file_path,
-            include_locations=inc_file_list,
-            origin=origin,
-            include_objects=includes_objects,
-            file_content_as_list=modified_file_as_list,
-            linked_user=user,
-            last_modified=last_changed
-        )
-
-        return nexus_file_class
+        return ParsedIncludeFile(file_as_list=modified_file_as_list, include_locations=inc_file_list,
+                                 include_files=include_files, ends_with_embedded_array=False)
 
     def export_network_lists(self):
         """Exports lists of connections from and to for use in network graphs.
@@ -288,24 +509,24 @@ class NexusFile(File):
         if parent is None:
             parent = self
             parent.line_locations = []
+            parent.__line_location_rows = (parent.line_locations, [])
         if parent.line_locations is None:
             parent.line_locations = []
         if prefix_line is not None and prefix_line != ' ':
             file_index.index += 1
             yield prefix_line
 
-        new_entry = (file_index.index, self.id)
-        if new_entry not in parent.line_locations:
-            parent.line_locations.append(new_entry)
+        self.__add_line_location(parent, file_index.index, 0)
         depth: int = 0
         if max_depth is not None:
             depth = max_depth
-        if self.file_content_as_list is None:
+        file_content = self.file_content_as_list
+        if file_content is None:
             warnings.warn(f'No file content found for file: {self.location}')
             return
-        for row in self.file_content_as_list:
+        for row_index, row in enumerate(file_content):
             if nfo.check_token('INCLUDE', row):
-                incfile_location = nfo.get_token_value('INCLUDE', row, self.file_content_as_list)
+                incfile_location = nfo.get_token_value_at('INCLUDE', row_index, file_content)
                 if incfile_location is None:
                     continue
                 split_line = re.split(incfile_location, row, maxsplit=1, flags=re.IGNORECASE)
@@ -344,9 +565,8 @@ class NexusFile(File):
                     yield from include_file.iterate_line(file_index=file_index, max_depth=level_down_max_depth,
                                                          parent=parent, prefix_line=prefix_line)
 
-                    new_entry = (file_index.index, self.id)
-                    if new_entry not in parent.line_locations:
-                        parent.line_locations.append(new_entry)
+                    # the rest of the line after the include location stays on the INCLUDE line
+                    self.__add_line_location(parent, file_index.index, row_index if suffix_line else row_index + 1)
                     if suffix_line:
                         file_index.index += 1
                         # Add in space between include location and the rest of the line
@@ -358,13 +578,111 @@ class NexusFile(File):
                 file_index.index += 1
                 yield row
 
+    def __add_line_location(self, parent: NexusFile, flattened_index: int, row_index: int) -> None:
+        """Records that the flattened file moves into this file at flattened_index.
+
+        Args:
+            parent (NexusFile): the file being flattened, which holds the line_locations.
+            flattened_index (int): index in the flattened file of the first line of the new segment.
+            row_index (int): index in this file of the first line of the new segment.
+        """
+        if parent.line_locations is None:
+            return
+        new_entry = (flattened_index, self.id)
+        rows = parent.__line_location_rows
+        if rows is not None and rows[0] is not parent.line_locations:
+            rows = None
+        if new_entry not in parent.line_locations:
+            parent.line_locations.append(new_entry)
+            if rows is not None:
+                rows[1].append(row_index)
+        elif rows is not None:
+            # no lines have been added since the matching segment started, so it starts at this row instead
+            rows[1][parent.line_locations.index(new_entry)] = row_index
+
+    def __flat_file_signature(self) -> tuple[tuple[UUID, int, Optional[str]], ...]:
+        """Returns the id, content version and location of this file and all the files it includes.
+
+        Any edit to the content of any of the files, or to which files are included, changes the signature.
+        """
+        signature: list[tuple[UUID, int, Optional[str]]] = []
+        files_to_visit: list[NexusFile] = [self]
+        visited: set[UUID] = set()
+        while files_to_visit:
+            file = files_to_visit.pop()
+            if file.id in visited:
+                continue
+            visited.add(file.id)
+            content = file.__file_content_as_list
+            version = content.version if isinstance(content, NexusFileContent) else -1
+            if file.__evicted_content_version is not None:
+                # unloaded content is read back in with the same version if the file is unchanged on disk
+                version = file.__evicted_content_version
+            signature.append((file.id, version, file.location))
+            if file.include_objects is not None:
+                files_to_visit.extend(reversed(file.include_objects))
+        return tuple(signature)
+
     @property
     def get_flat_list_str_file(self) -> list[str]:
+        """The content of the file with the content of all include files expanded in place.
+
+        The flattened list and the line_locations are cached and only rebuilt when the content of this file or any of
+        its include files has changed since the last call. The returned list is shared between calls so should not be
+        modified directly, use add_to_file_as_list or remove_from_file_as_list instead.
+        """
         if self.file_content_as_list is None:
             raise ValueError(f'No file content found for {self.location}')
-        flat_list = list(self.iterate_line(file_index=None, keep_include_references=False))
+        if self.__batch_flat_file is not None:
+            return self.__batch_flat_file
+        signature = self.__flat_file_signature()
+        if self.__flat_file_cache is not None and self.__flat_file_cache[0] == signature:
+            _, flat_list, self.line_locations, segment_rows = self.__flat_file_cache
+            self.__line_location_rows = (self.line_locations, segment_rows)
+        else:
+            flat_list = list(self.iterate_line(file_index=None, keep_include_references=False))
+            if self.line_locations is not None and self.__line_location_rows is not None and \
+                    self.__line_location_rows[0] is self.line_locations:
+                self.__flat_file_cache = (signature, flat_list, self.line_locations, self.__line_location_rows[1])
+        if self.__batch_edit_depth > 0:
+            # copy so that the edits made during the batch don't change lists handed out before it started
+            self.__batch_flat_file = list(flat_list)
+            return self.__batch_flat_file
         return flat_list
 
+    def iterate_flat_lines(self) -> Iterator[str]:
+        """Iterates over the same lines as get_flat_list_str_file without building the flattened list.
+
+        The lines of the include files are read as they are reached, so loaders that only need each line once don't
+        hold a second copy of the whole flattened file. Uses the flattened list instead if it is already up to date, or
+        if it is about to be needed for the edits made in a batch_edit.
+        """
+        if self.file_content_as_list is None:
+            raise ValueError(f'No file content found for {self.location}')
+        if self.__batch_edit_depth > 0:
+            return iter(self.get_flat_list_str_file)
+        if self.__flat_file_cache is not None and self.__flat_file_cache[0] == self.__flat_file_signature():
+            return iter(self.get_flat_list_str_file)
+        return self.iterate_line(file_index=None, keep_include_references=False)
+
+    @contextmanager
+    def batch_edit(self) -> Generator[Self, None, None]:
+        """Context manager for making many edits to the file through add_to_file_as_list and \
+        remove_from_file_as_list.
+
+        Within the context the file is flattened at most once. Every edit is applied to that flattened snapshot as
+        well as to the content of the file it belongs to, so looking up where to make the next edit doesn't need the
+        file to be flattened again. Edits to the content of the file or its include files made in any other way are
+        not reflected in the snapshot until the context exits.
+        """
+        self.__batch_edit_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_edit_depth -= 1
+            if self.__batch_edit_depth == 0:
+                self.__batch_flat_file = None
+
     @property
     def get_flat_list_str_file_including_includes(self) -> list[str]:
         if self.file_content_as_list is None:
@@ -414,13 +732,8 @@ class NexusFile(File):
                 (i.e. from the get_flat_list_str_file method).
         """
         if self.object_locations is None:
-            self.object_locations: dict[UUID, list[int]] = get_empty_dict_uuid_list_int()
-        existing_line_locations = self.object_locations.get(obj_uuid, None)
-        if existing_line_locations is not None:
-            existing_line_locations.extend(line_indices)
-            existing_line_locations.sort()
-        else:
-            self.object_locations[obj_uuid] = line_indices
+            self.object_locations = NexusObjectLocations()
+        self.object_locations.add(obj_uuid, line_indices)
 
     def __update_object_locations(self, line_number: int, number_additional_lines: int) -> None:
         """Updates the object locations in a nexusfile by the additional lines. Used when files have been modified and
@@ -433,10 +746,7 @@ class NexusFile(File):
         """
         if self.object_locations is None:
             return
-        for object_id, list_indices in self.object_locations.items():
-            for i, obj_index in enumerate(list_indices):
-                if obj_index >= line_number:
-                    self.object_locations[object_id][i] = obj_index + number_additional_lines
+        self.object_locations.update_line_numbers(line_number, number_additional_lines)
 
     def __remove_object_locations(self, obj_uuid: UUID) -> None:
         """Removes an object location based on the obj_uuid provided. Used when removing objects in the file_as_list.
@@ -468,61 +778,150 @@ class NexusFile(File):
             if self.line_locations is None:
                 raise ValueError("No include line locations found.")
 
-        line_locations = [x[0] for x in self.line_locations]
-        line_locations.sort()
-        uuid_index: Optional[UUID] = None
-        index_in_included_file = 0
-
-        # Find the Nexusfile containing the line we are looking for
-        for numlines, obj_id in self.line_locations:
-            if numlines <= flattened_index:
-                uuid_index = obj_id
-            if numlines >= flattened_index:
-                break
-
-        get_next_line_count = False
-        lines_already_included = 0
-        previous_lines_value = 0
-
-        # Add the previously included lines from the file (if any) to the location after it has been split
-        for numlines, obj_id in self.line_locations:
-            if obj_id == uuid_index:
-                get_next_line_count = True
-                previous_lines_value = numlines
-                continue
-            else:
-                # If we have gone beyond where the line is, calculate the location in the relevant file
-                if numlines >= flattened_index:
-                    lines_already_included += flattened_index - previous_lines_value
-                    break
-
-                if get_next_line_count:
-                    lines_already_included += numlines - previous_lines_value
-                    get_next_line_count = False
-                previous_lines_value = numlines
-
-        if flattened_index > line_locations[-1]:
-            lines_already_included += flattened_index - line_locations[-1]
-
-        index_in_included_file += lines_already_included
+        uuid_index, index_in_included_file = self.__get_include_line_index().find(flattened_index)
 
         if uuid_index == self.id or self.include_objects is None:
             return self, index_in_included_file
 
-        nexus_file = None
-        for file in self.include_objects:
-            if file.id == uuid_index:
-                nexus_file = file
-            elif file.include_objects is not None:
-                # CURRENTLY THIS ONLY SUPPORTS 2 LEVELS OF INCLUDES
-                for lvl_2_include in file.include_objects:
-                    if lvl_2_include.id == uuid_index:
-                        nexus_file = lvl_2_include
+        nexus_file = self.__find_include_object(uuid_index)
         if nexus_file is None:
             raise ValueError(f'No file with {uuid_index=} found within include objects')
 
         return nexus_file, index_in_included_file
 
+    def __get_include_line_index(self) -> IncludeLineIndex:
+        """Returns the index of include file line locations, building it if the line locations have been regenerated
+        since it was last built.
+        """
+        if self.line_locations is None:
+            raise ValueError("No include line locations found.")
+        if self.__include_line_index is None or self.__include_line_index_source is not self.line_locations or \
+                self.__include_line_index_source_size != len(self.line_locations):
+            segment_rows = None
+            if self.__line_location_rows is not None and self.__line_location_rows[0] is self.line_locations:
+                segment_rows = self.__line_location_rows[1]
+            self.__include_line_index = IncludeLineIndex(self.line_locations, segment_rows)
+            self.__include_line_index_source = self.line_locations
+            self.__include_line_index_source_size = len(self.line_locations)
+        return self.__include_line_index
+
+    def __update_include_line_index(self, line_number: int, number_additional_lines: int) -> None:
+        """Updates the include line index after lines have been added or removed, if it is still valid for the
+        current line locations.
+
+        Args:
+            line_number (int): Line number in the flattened file at which the lines have been added or removed.
+            number_additional_lines (int): number of new lines added, negative for lines removed.
+        """
+        if self.__include_line_index is not None and self.__include_line_index_source is self.line_locations:
+            self.__include_line_index.update_line_count(line_number, number_additional_lines)
+
+    def __find_include_object(self, obj_id: UUID) -> Optional[NexusFile]:
+        """Searches through the include files at any depth for the file with the matching id.
+
+        Args:
+            obj_id (UUID): id of the file to find.
+
+        Returns:
+            Optional[NexusFile]: the include file with the matching id, None if it can't be found.
+        """
+        files_to_search = [] if self.include_objects is None else list(self.include_objects)
+        while files_to_search:
+            file = files_to_search.pop()
+            if file.id == obj_id:
+                return file
+            if file.include_objects is not None:
+                files_to_search.extend(file.include_objects)
+        return None
+
+    def __changed_on_disk(self) -> bool:
+        """Returns True if the file has been modified, created or deleted on disk since it was loaded."""
+        if self.location is None:
+            return False
+        full_file_path = self.location if self.origin is None else nfo.get_full_file_path(self.location, self.origin)
+        if self.__evicted_content_version is None and not self.file_content_as_list:
+            # array include files that were skipped have no content and the details of the file including them, so
+            # only files that couldn't be found, which have no last modified date, are checked for being created
+            return self.last_modified is None and os.path.isfile(full_file_path)
+        if self.last_modified is None:
+            # no record of when the file was modified so any changes can't be detected
+            return False
+        try:
+            modified_time = os.stat(full_file_path).st_mtime
+        except FileNotFoundError:
+            return True
+        if modified_time is None:
+            return False
+        return datetime.fromtimestamp(modified_time, tz=timezone.utc) != self.last_modified
+
+    def find_files_changed_on_disk(self) -> list[NexusFile]:
+        """Finds the file and any of its include files at any depth that have been modified, created or deleted on \
+        disk since they were loaded.
+
+        Returns:
+            list[NexusFile]: the files that have changed on disk.
+        """
+        changed_files: list[NexusFile] = []
+        files_to_check: list[NexusFile] = [self]
+        while files_to_check:
+            file = files_to_check.pop()
+            if file.__changed_on_disk():
+                changed_files.append(file)
+            if file.include_objects is not None:
+                files_to_check.extend(file.include_objects)
+        return changed_files
+
+    def reload_files_changed_on_disk(self, changed_files: Optional[Sequence[NexusFile]] = None,
+                                     file_reader: Optional[IncludeFileReader] = None) -> Self:
+        """Reads the files that have changed on disk again, along with the files that include them at any depth.
+
+        Include files that haven't changed and don't include any file that has are not read again, the same objects
+        are used in the reloaded file. Any changes made in memory to a file that is read again are discarded.
+
+        Args:
+            changed_files (Optional[Sequence[NexusFile]]): the files to read again, as found by \
+            find_files_changed_on_disk. Defaults to None, which finds the files that have changed.
+            file_reader (Optional[IncludeFileReader]): reader to share with other calls loading files from the same \
+            model. Defaults to None, which creates a new reader.
+
+        Returns:
+            NexusFile: the reloaded file, or this file if none of the files have changed.
+        """
+        if changed_files is None:
+            changed_files = self.find_files_changed_on_disk()
+        if file_reader is None:
+            with IncludeFileReader() as new_file_reader:
+                return self.reload_files_changed_on_disk(changed_files, file_reader=new_file_reader)
+        files_to_reload: set[int] = set()
+        self.__find_files_to_reload({id(x) for x in changed_files}, files_to_reload)
+        return self.__reload_files(files_to_reload, file_reader, top_level_file=True)
+
+    def __find_files_to_reload(self, changed_file_ids: set[int], files_to_reload: set[int]) -> bool:
+        """Adds the ids of the file and its include files at any depth that have changed or include a changed file \
+        to files_to_reload. Returns True if this file needs to be reloaded.
+        """
+        needs_reload = id(self) in changed_file_ids
+        for include_object in self.include_objects or []:
+            if include_object.__find_files_to_reload(changed_file_ids, files_to_reload):
+                needs_reload = True
+        if needs_reload:
+            files_to_reload.add(id(self))
+        return needs_reload
+
+    def __reload_files(self, files_to_reload: set[int], file_reader: IncludeFileReader, top_level_file: bool) -> Self:
+        """Reads the file again if its id is in files_to_reload, reusing the include files that aren't."""
+        if id(self) not in files_to_reload or self.location is None:
+            return self
+        reloaded_includes = [x.__reload_files(files_to_reload, file_reader, top_level_file=False)
+                             for x in self.include_objects or []]
+        recursive, skip_arrays = True, True
+        if self.__content_source is not None:
+            recursive, skip_arrays, top_level_file = self.__content_source
+        return self.generate_file_include_structure(self.location, origin=self.origin, recursive=recursive,
+                                                    skip_arrays=skip_arrays, top_level_file=top_level_file,
+                                                    file_reader=file_reader,
+                                                    include_objects_to_reuse=reloaded_includes)
+
     def add_to_file_as_list(self, additional_content: list[str], index: int,
                             additional_objects: Optional[dict[UUID, list[int]]] = None,
                             comments: Optional[str] = None) -> None:
@@ -543,14 +942,16 @@ class NexusFile(File):
         nexusfile_to_write_to, relative_index = self.find_which_include_file(index)
         if nexusfile_to_write_to.file_content_as_list is None:
             raise ValueError(f'No file content to write to in file: {nexusfile_to_write_to}')
-        nexusfile_to_write_to.file_content_as_list = \
-            nexusfile_to_write_to.file_content_as_list[:relative_index] + \
-            additional_content + nexusfile_to_write_to.file_content_as_list[relative_index:]
+        # insert in place rather than building a new list, which would copy every line in the file for each edit
+        nexusfile_to_write_to.file_content_as_list[relative_index:relative_index] = additional_content
+        if self.__batch_flat_file is not None:
+            self.__batch_flat_file[index:index] = additional_content
 
         self._file_modified_set(True)
 
         # update object locations
         self.__update_object_locations(line_number=index, number_additional_lines=len(additional_content))
+        self.__update_include_line_index(line_number=index, number_additional_lines=len(additional_content))
 
         if additional_objects is None:
             return
@@ -600,12 +1001,17 @@ class NexusFile(File):
 
         if string_to_remove is None:
             nexusfile_to_write_to.file_content_as_list.pop(relative_index)
+            if self.__batch_flat_file is not None:
+                del self.__batch_flat_file[index]
             self.__update_object_locations(line_number=index, number_additional_lines=-1)
+            self.__update_include_line_index(line_number=index, number_additional_lines=-1)
         else:
             entry_to_replace = nexusfile_to_write_to.file_content_as_list[relative_index]
             if isinstance(entry_to_replace, str):
                 nexusfile_to_write_to.file_content_as_list[relative_index] = \
                     entry_to_replace.replace(string_to_remove, '', 1)
+                if self.__batch_flat_file is not None:
+                    self.__batch_flat_file[index] = self.__batch_flat_file[index].replace(string_to_remove, '', 1)
             else:
                 raise ValueError(
                     f'Tried to replace at non string value at index: {relative_index} in '
@@ -708,12 +1114,12 @@ class NexusFile(File):
         if file_content is None or not file_content:
             raise ValueError(f'No file content found within file {self.location}')
 
-        for line in file_content:
+        for line_index, line in enumerate(file_content):
             if not nfo.check_token('INCLUDE', line):
                 continue
             # if the right path to replace is found then replace it
-            if nfo.get_expected_token_value('INCLUDE', line, file_content) == file_path_to_replace:
-                nfo.get_expected_token_value('INCLUDE', line, file_content, replace_with=new_path)
+            if nfo.get_expected_token_value_at('INCLUDE', line_index, file_content) == file_path_to_replace:
+                nfo.get_expected_token_value_at('INCLUDE', line_index, file_content, replace_with=new_path)
                 self._file_modified_set(True)
         # replace the location in the include locations list using the original path
 
@@ -729,3 +1135,19 @@ class NexusFile(File):
         self.include_locations[index_of_path_to_replace] = include_file.location
         # update the new path
         include_file.input_file_location = new_path
+
+
+@dataclass
+class _IncludeFileToLoad:
+    """A file found while loading the include structure of a NexusFile, along with the result of reading it."""
+
+    file_path: str
+    origin: Optional[str]
+    full_file_path: str
+    recursive: bool
+    skip_arrays: bool
+    top_level_file: bool
+    read_result: Optional[FileReadResult] = None
+    parsed_file: Optional[ParsedIncludeFile] = None
+    # for each file included: the file to load, an already loaded file to reuse or None for a skipped array file
+    include_files: list[_IncludeFileToLoad | NexusFile | None] = field(default_factory=list)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterable, Optional
+
+# Shared between all instances so that a replacement list never reuses the version of the list it replaced.
+_latest_content_version = [0]
+_content_version_lock = threading.Lock()
+
+
+def _new_content_version(at_least: int = 0) -> int:
+    """Returns a version number that hasn't been handed out before and is no lower than at_least."""
+    with _content_version_lock:
+        _latest_content_version[0] = max(_latest_content_version[0] + 1, at_least)
+        return _latest_content_version[0]
+
+
+class NexusFileContent(list[str]):
+    """List of the lines in a single Nexus file that takes a new version number every time it is modified.
+
+    Behaves exactly like a list of strings. NexusFile compares the versions of its own content and the content of its
+    include files to know when a cached flattened view of the file is out of date.
+    """
+
+    def __init__(self, iterable: Iterable[str] = (), version: Optional[int] = None) -> None:
+        """Initialises the NexusFileContent class.
+
+        Args:
+            iterable (Iterable[str]): lines of the file.
+            version (Optional[int]): version of earlier content that had exactly the same lines, for content that was
+                unloaded and has been read back in. Defaults to None, which gives the content a new version.
+        """
+        super().__init__(iterable)
+        self.__version = _new_content_version() if version is None else version
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Content loaded from a pickle keeps its version so that any cached flattened files stay valid. Versions handed
+        # out afterwards must all be higher so that they can't match a version stored in the pickle.
+        self.__dict__.update(state)
+        _new_content_version(at_least=self.__version)
+
+    @property
+    def version(self) -> int:
+        """Number that changes every time the content is modified."""
+        return self.__version
+
+    def mark_modified(self) -> None:
+        """Gives the content a new version number. Called automatically by all methods that modify the list."""
+        self.__version = _new_content_version()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self.mark_modified()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.mark_modified()
+
+    def __iadd__(self, other: Iterable[str]) -> NexusFileContent:  # type: ignore[override, misc]
+        super().__iadd__(other)
+        self.mark_modified()
+        return self
+
+    def __imul__(self, value: Any) -> NexusFileContent:  # type: ignore[override, misc]
+        super().__imul__(value)
+        self.mark_modified()
+        return self
+
+    def append(self, value: str) -> None:
+        super().append(value)
+        self.mark_modified()
+
+    def extend(self, values: Iterable[str]) -> None:
+        super().extend(values)
+        self.mark_modified()
+
+    def insert(self, index: Any, value: str) -> None:
+        super().insert(index, value)
+        self.mark_modified()
+
+    def pop(self, index: Any = -1) -> str:
+        value = super().pop(index)
+        self.mark_modified()
+        return value
+
+    def remove(self, value: str) -> None:
+        super().remove(value)
+        self.mark_modified()
+
+    def clear(self) -> None:
+        super().clear()
+        self.mark_modified()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.mark_modified()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.mark_modified()
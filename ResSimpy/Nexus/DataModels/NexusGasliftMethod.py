@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Enums.UnitsEnum import SUnits, TemperatureUnits, UnitSystem
 from ResSimpy.Nexus.NexusKeywords.gaslift_keywords import GL_ARRAY_KEYWORDS, GASLIFT_KEYWORDS, GL_TABLE_HEADER_COLS
@@ -10,6 +9,10 @@ from ResSimpy.DynamicProperty import DynamicProperty
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -40,6 +43,7 @@ class NexusGasliftMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with gaslift data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         gl_dict = self.properties
         for key, value in gl_dict.items():
@@ -73,28 +77,28 @@ class NexusGasliftMethod(DynamicProperty):
         # Dictionary of flags indicating which tables are being read
         start_reading_table = False
 
+        array_keywords = KeywordMatcher(GL_ARRAY_KEYWORDS)
+        end_keywords = KeywordMatcher(GASLIFT_KEYWORDS)
+        header_keywords = KeywordMatcher(GL_TABLE_HEADER_COLS)
+
         line_indx = 0
         for line in file_as_list:
 
             # Find arrays of parameters, e.g., QOIL 1.0 10. 100., or WCUT 0.0 0.1 0.2
-            potential_keyword = nfo.check_list_tokens(GL_ARRAY_KEYWORDS, line)
+            potential_keyword = array_keywords.find_first(line)
             if potential_keyword is not None:
                 line_elems = line.split('!')[0].split()
                 keyword_index = line_elems.index(potential_keyword)
                 self.properties[potential_keyword] = ' '.join(line_elems[keyword_index+1:])
 
             # Find ending index of gaslift table
-            if start_reading_table:
-                for potential_endkeyword in GASLIFT_KEYWORDS:
-                    if nfo.check_token(potential_endkeyword, line):
-                        gl_table_indices['GL_TABLE'][1] = line_indx
-                        start_reading_table = False
-                        break
+            if start_reading_table and end_keywords.found_in(line):
+                gl_table_indices['GL_TABLE'][1] = line_indx
+                start_reading_table = False
             # Find starting index of gaslift table
-            for header_keyword in GL_TABLE_HEADER_COLS:
-                if nfo.check_token(header_keyword, line):
-                    gl_table_indices['GL_TABLE'] = [line_indx, len(file_as_list)]
-                    start_reading_table = True
+            if header_keywords.found_in(line):
+                gl_table_indices['GL_TABLE'] = [line_indx, len(file_as_list)]
+                start_reading_table = True
 
             line_indx += 1
 
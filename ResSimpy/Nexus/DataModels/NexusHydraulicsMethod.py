@@ -2,8 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 import re
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.hyd_keywords import HYD_ARRAY_KEYWORDS, HYD_TABLE_HEADER_COLS, HYD_KEYWORDS
 from ResSimpy.Nexus.NexusKeywords.hyd_keywords import HYD_PRESSURE_KEYWORDS, HYD_SINGLE_KEYWORDS
@@ -14,6 +13,10 @@ from ResSimpy.DynamicProperty import DynamicProperty
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -44,6 +47,7 @@ class NexusHydraulicsMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with hydraulics data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         hyd_dict = self.properties
         for key, value in hyd_dict.items():
@@ -110,14 +114,20 @@ class NexusHydraulicsMethod(DynamicProperty):
         watinj_dict: dict[str, float] = {}
         found_waterinj = False
 
+        array_keywords = KeywordMatcher(HYD_ARRAY_KEYWORDS + HYD_ALQ_KEYWORD)
+        float_keywords = KeywordMatcher(HYD_KEYWORDS_VALUE_FLOAT + HYD_WATINJ_KEYWORDS_VALUE_FLOAT)
+        single_keywords = KeywordMatcher(HYD_SINGLE_KEYWORDS)
+        end_keywords = KeywordMatcher(HYD_KEYWORDS)
+        header_keywords = KeywordMatcher(HYD_TABLE_HEADER_COLS)
+
         line_indx = 0
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Find arrays of parameters, e.g., QOIL 1.0 10. 100., or GOR 0.0 0.5 1.0
-            potential_keyword = nfo.check_list_tokens(HYD_ARRAY_KEYWORDS + HYD_ALQ_KEYWORD, line)
+            potential_keyword = array_keywords.find_first(line)
             if potential_keyword is not None and not table_being_read['LIMITS']:
                 line_elems = line.split('!')[0].split()
-                next_val = nfo.get_expected_token_value(potential_keyword, line, file_as_list)
+                next_val = nfo.get_expected_token_value_at(potential_keyword, line_index, file_as_list)
                 if potential_keyword == 'ALQ' and next_val in HYD_ALQ_OPTIONS:
                     self.properties['ALQ_PARAM'] = next_val
                     keyword_index = line_elems.index(next_val)
@@ -131,20 +141,22 @@ class NexusHydraulicsMethod(DynamicProperty):
 
             # Handle DATGRAD property
             if nfo.check_token('DATGRAD', line):
-                self.properties['DATGRAD'] = nfo.get_expected_token_value('DATGRAD', line, file_as_list)
+                self.properties['DATGRAD'] = nfo.get_expected_token_value_at('DATGRAD', line_index, file_as_list)
 
             # Find HYD key-value pairs, such as LENGTH 3000, DATUM 7000 or DATGRAD GRAD
-            potential_keyword = nfo.check_list_tokens(HYD_KEYWORDS_VALUE_FLOAT + HYD_WATINJ_KEYWORDS_VALUE_FLOAT, line)
+            # The DATGRAD option GRAD is a value rather than the WATINJ GRAD keyword, so isn't searched for
+            potential_keyword = float_keywords.find_first(
+                re.sub(r'\bDATGRAD\s+GRAD\b', 'DATGRAD', line, flags=re.IGNORECASE))
             if potential_keyword is not None:
                 if found_waterinj and potential_keyword in HYD_WATINJ_KEYWORDS_VALUE_FLOAT:
                     watinj_dict[potential_keyword] = float(
-                        nfo.get_expected_token_value(potential_keyword, line, file_as_list))
+                        nfo.get_expected_token_value_at(potential_keyword, line_index, file_as_list))
                 elif potential_keyword in HYD_KEYWORDS_VALUE_FLOAT:
                     self.properties[potential_keyword] = float(
-                        nfo.get_expected_token_value(potential_keyword, line, file_as_list))
+                        nfo.get_expected_token_value_at(potential_keyword, line_index, file_as_list))
 
             # Find standalone hydraulics keywords
-            potential_keyword = nfo.check_list_tokens(HYD_SINGLE_KEYWORDS, line)
+            potential_keyword = single_keywords.find_first(line)
             if potential_keyword is not None:
                 self.properties[potential_keyword] = ''
 
@@ -159,19 +171,15 @@ class NexusHydraulicsMethod(DynamicProperty):
                 start_reading_table = False
 
             # Find ending index of hydraulics table
-            if start_reading_table and table_being_read['HYD_TABLE']:
-                for potential_endkeyword in HYD_KEYWORDS:
-                    if nfo.check_token(potential_endkeyword, line):
-                        hyd_table_indices['HYD_TABLE'][1] = line_indx
-                        start_reading_table = False
-                        table_being_read['HYD_TABLE'] = False
-                        break
+            if start_reading_table and table_being_read['HYD_TABLE'] and end_keywords.found_in(line):
+                hyd_table_indices['HYD_TABLE'][1] = line_indx
+                start_reading_table = False
+                table_being_read['HYD_TABLE'] = False
             # Find starting index of hydraulics table
-            for header_keyword in HYD_TABLE_HEADER_COLS:
-                if nfo.check_token(header_keyword, line):
-                    hyd_table_indices['HYD_TABLE'] = [line_indx, len(file_as_list)]
-                    table_being_read['HYD_TABLE'] = True
-                    start_reading_table = True
+            if header_keywords.found_in(line):
+                hyd_table_indices['HYD_TABLE'] = [line_indx, len(file_as_list)]
+                table_being_read['HYD_TABLE'] = True
+                start_reading_table = True
 
             line_indx += 1
 
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import Iterable, Iterator, Mapping, MutableMapping, Optional
+from uuid import UUID
+
+from ResSimpy.Utils.fenwick_tree import FenwickTree
+
+# Minimum number of line numbers no longer used by any object before they are cleared out of the runs
+_MIN_UNUSED_BEFORE_COMPACTING = 64
+# Number of line numbers added one at a time to hold before sorting them into a run
+_MAX_PENDING_LINES = 32
+
+
+class _LineRun:
+    """Line numbers stored together in sorted order, relative to offsets held in a Fenwick tree."""
+
+    def __init__(self, base_lines: list[int], owners: list[tuple[UUID, int]]) -> None:
+        """Initialises the _LineRun class.
+
+        Args:
+            base_lines (list[int]): line numbers in sorted order.
+            owners (list[tuple[UUID, int]]): the object id and the index in that object's line numbers of each line.
+        """
+        self.base_lines = base_lines
+        self.owners = owners
+        self.offsets = FenwickTree([0] * len(base_lines))
+        # number of line numbers in the run no longer used by their object
+        self.unused_count = 0
+
+    def __len__(self) -> int:
+        return len(self.base_lines)
+
+    def line_at(self, position: int) -> int:
+        return self.base_lines[position] + self.offsets.prefix_sum(position + 1)
+
+    def current_lines(self) -> list[int]:
+        """Returns every line number in the run with the offsets applied, in O(n)."""
+        offsets = accumulate(self.offsets[x] for x in range(len(self)))
+        return [line + offset for line, offset in zip(self.base_lines, offsets)]
+
+    def shift(self, line_number: int, number_additional_lines: int) -> None:
+        """Shifts every line number in the run at or after line_number by number_additional_lines."""
+        # The line numbers stay in sorted order, so the first one that needs to move can be found by bisection
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.line_at(middle) < line_number:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self):
+            self.offsets.add(low, number_additional_lines)
+
+
+class _PendingLines:
+    """Line numbers added since the last run was created, held unsorted until there are enough to make a run."""
+
+    def __init__(self) -> None:
+        self.lines: list[int] = []
+        self.owners: list[tuple[UUID, int]] = []
+        self.unused_count = 0
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def line_at(self, position: int) -> int:
+        return self.lines[position]
+
+    def current_lines(self) -> list[int]:
+        return self.lines
+
+    def shift(self, line_number: int, number_additional_lines: int) -> None:
+        for i, line in enumerate(self.lines):
+            if line >= line_number:
+                self.lines[i] = line + number_additional_lines
+
+
+class NexusObjectLocations(MutableMapping[UUID, list[int]]):
+    """Line numbers in a flattened Nexus file where each object is stored, keyed by the id of the object.
+
+    Behaves like a dictionary of lists of line numbers. The line numbers are held in a small number of sorted runs,
+    each storing its line numbers relative to offsets held in a Fenwick tree, so shifting the line numbers after lines
+    are added to or removed from the file takes O(log n) time per run rather than visiting every object. Line numbers
+    added are held unsorted until there are _MAX_PENDING_LINES of them, then form a new run. Runs of similar sizes are
+    merged, so there are at most O(log n) runs and each line number is merged O(log n) times.
+    """
+
+    def __init__(self, locations: Optional[Mapping[UUID, Iterable[int]]] = None) -> None:
+        """Initialises the NexusObjectLocations class.
+
+        Args:
+            locations (Optional[Mapping[UUID, Iterable[int]]]): initial line numbers for each object id. Defaults to
+                None, which creates an empty set of locations.
+        """
+        # Runs of line numbers, largest first
+        self.__runs: list[_LineRun] = []
+        self.__pending = _PendingLines()
+        # The run and position in the run of each line number of each object, in the order they were set. Every
+        # object in the mapping has an entry here to keep the order.
+        self.__positions: dict[UUID, list[tuple[_LineRun | _PendingLines, int]]] = {}
+        # Number of line numbers held in the runs, and how many of them are no longer used by any object
+        self.__stored_count = 0
+        self.__unused_count = 0
+        if locations is not None:
+            for obj_id, line_numbers in locations.items():
+                self[obj_id] = list(line_numbers)
+            self.__merge_runs(0, include_pending=True)
+
+    def __getitem__(self, obj_id: UUID) -> list[int]:
+        return [run.line_at(position) for run, position in self.__positions[obj_id]]
+
+    def __setitem__(self, obj_id: UUID, line_numbers: list[int]) -> None:
+        if obj_id in self.__positions:
+            self.__forget(obj_id)
+        pending = self.__pending
+        first_position = len(pending)
+        pending.lines += line_numbers
+        pending.owners += [(obj_id, i) for i in range(len(line_numbers))]
+        self.__positions[obj_id] = [(pending, first_position + i) for i in range(len(line_numbers))]
+        self.__stored_count += len(line_numbers)
+        if len(pending) < _MAX_PENDING_LINES:
+            return
+        # sort the pending line numbers into a run, merging it with the runs before it that are no more than twice
+        # the size of the runs being merged
+        first_run_to_merge = len(self.__runs)
+        merged_size = len(pending)
+        while first_run_to_merge > 0 and len(self.__runs[first_run_to_merge - 1]) <= 2 * merged_size:
+            first_run_to_merge -= 1
+            merged_size += len(self.__runs[first_run_to_merge])
+        self.__merge_runs(first_run_to_merge, include_pending=True)
+
+    def __delitem__(self, obj_id: UUID) -> None:
+        self.__forget(obj_id)
+        del self.__positions[obj_id]
+
+    def __iter__(self) -> Iterator[UUID]:
+        return iter(self.__positions)
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __contains__(self, obj_id: object) -> bool:
+        return obj_id in self.__positions
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __forget(self, obj_id: UUID) -> None:
+        """Stops tracking the line numbers currently stored for an object."""
+        for run, _ in self.__positions[obj_id]:
+            run.unused_count += 1
+        self.__unused_count += len(self.__positions[obj_id])
+        self.__positions[obj_id] = []
+        if self.__unused_count > max(_MIN_UNUSED_BEFORE_COMPACTING, self.__stored_count // 2):
+            self.__merge_runs(0, include_pending=True)
+
+    def __is_used(self, run: _LineRun | _PendingLines, position: int) -> bool:
+        """Returns True if the line number at a position in a run is still one of the line numbers of its object."""
+        obj_id, index = run.owners[position]
+        positions = self.__positions.get(obj_id)
+        if positions is None or index >= len(positions):
+            return False
+        stored_run, stored_position = positions[index]
+        return stored_run is run and stored_position == position
+
+    def __merge_runs(self, first_run: int, include_pending: bool = False) -> None:
+        """Merges the runs from first_run onwards into a single run, leaving out line numbers no longer used.
+
+        Args:
+            first_run (int): index of the first run to merge.
+            include_pending (bool): whether to also sort the pending line numbers into the merged run.
+        """
+        runs_to_merge: list[_LineRun | _PendingLines] = [*self.__runs[first_run:]]
+        if include_pending:
+            runs_to_merge.append(self.__pending)
+            self.__pending = _PendingLines()
+        lines: list[tuple[int, UUID, int]] = []
+        for run in runs_to_merge:
+            if run.unused_count == 0:
+                lines += [(line, *owner) for line, owner in zip(run.current_lines(), run.owners)]
+                continue
+            used_lines = [(line, *run.owners[position]) for position, line in enumerate(run.current_lines())
+                          if self.__is_used(run, position)]
+            self.__stored_count -= len(run) - len(used_lines)
+            self.__unused_count -= len(run) - len(used_lines)
+            lines += used_lines
+        lines.sort(key=lambda x: x[0])
+        merged_run = _LineRun([line for line, _, _ in lines], [(obj_id, index) for _, obj_id, index in lines])
+        for position, (_, obj_id, index) in enumerate(lines):
+            self.__positions[obj_id][index] = (merged_run, position)
+        del self.__runs[first_run:]
+        if len(merged_run) > 0:
+            self.__runs.append(merged_run)
+
+    def add(self, obj_id: UUID, line_numbers: list[int]) -> None:
+        """Adds line numbers for an object, keeping them sorted if the object already has line numbers stored.
+
+        Args:
+            obj_id (UUID): unique identifier of the object.
+            line_numbers (list[int]): line numbers in the flattened file to add for the object.
+        """
+        existing_line_numbers = self.get(obj_id, None)
+        if existing_line_numbers is None:
+            self[obj_id] = line_numbers
+        else:
+            self[obj_id] = sorted(existing_line_numbers + line_numbers)
+
+    def update_line_numbers(self, line_number: int, number_additional_lines: int) -> None:
+        """Shifts every stored line number at or after line_number by number_additional_lines.
+
+        Args:
+            line_number (int): line number in the flattened file at which the lines have been added or removed.
+            number_additional_lines (int): number of lines added, negative if lines were removed.
+        """
+        for run in self.__runs:
+            run.shift(line_number, number_additional_lines)
+        self.__pending.shift(line_number, number_additional_lines)
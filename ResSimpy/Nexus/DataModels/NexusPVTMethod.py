@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.pvt_keywords import PVT_BLACKOIL_PRIMARY_KEYWORDS, PVT_TYPE_KEYWORDS, PVT_KEYWORDS
 from ResSimpy.Nexus.NexusKeywords.pvt_keywords import PVT_EOS_METHODS, PVT_EOSOPTIONS_PRIMARY_WORDS
@@ -17,6 +16,13 @@ from ResSimpy.DynamicProperty import DynamicProperty
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union, get_empty_list_str, get_empty_eosopt_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher, keyword_matcher
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PVT_KEYWORD_MATCHER = KeywordMatcher(PVT_KEYWORDS)
+PVT_EOSOPTIONS_TERTIARY_MATCHER = KeywordMatcher(PVT_EOSOPTIONS_TERTIARY_KEYS)
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -81,6 +87,7 @@ class NexusPVTMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with PVT data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         pvt_dict = self.properties
         # Print description if present
@@ -156,7 +163,8 @@ class NexusPVTMethod(DynamicProperty):
         return printable_str
 
     def __populate_eos_opts_to_tertiary_keys(self, primary_key: str, primary_key_default_val: str, single_line: str,
-                                             line_list: list[str], list_of_secondary_keys: list[str]):
+                                             line_list: list[str], list_of_secondary_keys: list[str],
+                                             line_index: int):
         """Utility function to populate complex EOS options structures, from primary to tertiary keyword level.
         Applies to TRANSITION, TRANS_TEST and PHASEID Nexus EOS options.
 
@@ -166,26 +174,24 @@ class NexusPVTMethod(DynamicProperty):
             single_line (str): single line as read from input PVT file
             line_list (list[str]): list of strings that comprise input PVT file
             list_of_secondary_keys (list[str]): list of secondary keywords associated with the given primary keyword
+            line_index (int): index of single_line in line_list
         """
         if nfo.check_token(primary_key, single_line):
             self.eos_options[primary_key] = primary_key_default_val  # Set default value
-            if nfo.get_expected_token_value(primary_key, single_line, line_list) in list_of_secondary_keys:
-                self.eos_options[primary_key] = nfo.get_expected_token_value(primary_key, single_line, line_list)
-        if [i for i in single_line.split() if i in list_of_secondary_keys]:
-            for secondary_key in list_of_secondary_keys:
-                if nfo.check_token(secondary_key, single_line):
-                    self.eos_options[primary_key] = secondary_key
-                    for tertiary_key in PVT_EOSOPTIONS_TERTIARY_KEYS:
-                        if nfo.check_token(tertiary_key, single_line):
-                            if isinstance(self.eos_options[primary_key], str):  # Convert to tuple
-                                self.eos_options[primary_key] = (secondary_key, {})
+            if nfo.get_expected_token_value_at(primary_key, line_index, line_list) in list_of_secondary_keys:
+                self.eos_options[primary_key] = nfo.get_expected_token_value_at(primary_key, line_index, line_list)
+        for secondary_key in keyword_matcher(list_of_secondary_keys).find_all(single_line):
+            self.eos_options[primary_key] = secondary_key
+            for tertiary_key in PVT_EOSOPTIONS_TERTIARY_MATCHER.find_all(single_line):
+                if isinstance(self.eos_options[primary_key], str):  # Convert to tuple
+                    self.eos_options[primary_key] = (secondary_key, {})
 
-                            secondary_eos_option = self.eos_options[primary_key]
-                            if not isinstance(secondary_eos_option, tuple) or \
-                                    not isinstance(secondary_eos_option[1], dict):
-                                raise ValueError(f"EOS secondary key invalid: {secondary_key}")
-                            secondary_eos_option[1][tertiary_key] = float(
-                                nfo.get_expected_token_value(tertiary_key, single_line, line_list))
+                secondary_eos_option = self.eos_options[primary_key]
+                if not isinstance(secondary_eos_option, tuple) or \
+                        not isinstance(secondary_eos_option[1], dict):
+                    raise ValueError(f"EOS secondary key invalid: {secondary_key}")
+                secondary_eos_option[1][tertiary_key] = float(
+                    nfo.get_expected_token_value_at(tertiary_key, line_index, line_list))
 
     def __find_pvt_table_starting_index(self, table_key: str, single_line: str, line_list: list[str],
                                         table_indices: dict[str, list[int]],
@@ -227,9 +233,9 @@ class NexusPVTMethod(DynamicProperty):
                 table_name = 'UNSATOIL'
                 full_table_name = table_name + '_' + table_key
             if nfo.check_token(table_name, single_line) and nfo.check_token(table_key, single_line):
-                if nfo.get_token_value(table_key, single_line, line_list) is None:
+                if nfo.get_token_value_at(table_key, l_index, line_list) is None:
                     raise ValueError(f'Property {table_key} does not have a numerical value.')
-                unsat_obj[table_key].append(nfo.get_expected_token_value(table_key, single_line, line_list))
+                unsat_obj[table_key].append(nfo.get_expected_token_value_at(table_key, l_index, line_list))
                 if full_table_name in table_indices_dict.keys():
                     table_indices_dict[full_table_name][unsat_obj[table_key][-1]] = [l_index + 1, len(line_list)]
                 else:
@@ -274,10 +280,8 @@ class NexusPVTMethod(DynamicProperty):
                 table_name = 'UNSATOIL'
                 full_table_name = table_name + '_' + table_key
         # if not table_has_endkeyword and [i for i in single_line.split() if i in PVT_KEYWORDS]:
-        if not table_has_endkeyword:
-            for keyword in PVT_KEYWORDS:
-                if nfo.check_token(keyword, single_line):
-                    end_flag_found = True
+        if not table_has_endkeyword and PVT_KEYWORD_MATCHER.found_in(single_line):
+            end_flag_found = True
         if table_has_endkeyword and nfo.check_token('END' + table_name, single_line):
             end_flag_found = True
         if (full_table_name in table_indices.keys() or full_table_name in table_indices_dict.keys()) and \
@@ -313,28 +317,37 @@ class NexusPVTMethod(DynamicProperty):
         for indx in PVT_UNSAT_TABLE_INDICES:
             pvt_unsat_keys[indx] = []
 
+        pvt_type_keywords = KeywordMatcher(PVT_TYPE_KEYWORDS)
+        fluid_param_keywords = KeywordMatcher(PVT_BLACKOIL_PRIMARY_KEYWORDS)
+        primary_word_keywords = KeywordMatcher(PVT_EOSOPTIONS_PRIMARY_WORDS)
+        float_keywords = KeywordMatcher(PVT_EOSOPTIONS_PRIMARY_KEYS_FLOAT)
+        int_keywords = KeywordMatcher(PVT_EOSOPTIONS_PRIMARY_KEYS_INT)
+        primary_keys2populate = ['TRANSITION', 'TRANS_TEST', 'PHASEID']
+        primary_keys2populate_defaults = ['TEST', 'INCRP', '']
+        primary_keys2populate_keywords = KeywordMatcher(primary_keys2populate)
+        secondary_keys = [PVT_EOSOPTIONS_TRANS_KEYS, PVT_EOSOPTIONS_TRANS_TEST_KEYS, PVT_EOSOPTIONS_PHASEID_KEYS]
+        table_header_row_keywords = KeywordMatcher(['PRES', 'DP', 'RV', 'INDEX', 'COMPONENT'])
+
         line_indx = 0
         for line in file_as_list:
 
             # Determine PVT type, i.e., BLACKOIL, WATEROIL, EOS, etc.
-            for pvt_type in PVT_TYPE_KEYWORDS:
-                if nfo.check_token(pvt_type, line):
-                    self.pvt_type = pvt_type
+            for pvt_type in pvt_type_keywords.find_all(line):
+                self.pvt_type = pvt_type
 
             # Extract blackoil fluid density parameters
-            for fluid_param in PVT_BLACKOIL_PRIMARY_KEYWORDS:
-                if nfo.check_token(fluid_param, line):
-                    self.properties[fluid_param] = float(nfo.get_expected_token_value(
-                        fluid_param, line, file_as_list, custom_message=f"Property {fluid_param} does \
-                        not have a numerical value."))
+            for fluid_param in fluid_param_keywords.find_all(line):
+                self.properties[fluid_param] = float(nfo.get_expected_token_value_at(
+                    fluid_param, line_indx, file_as_list, custom_message=f"Property {fluid_param} does \
+                    not have a numerical value."))
             if nfo.check_token('DRYGAS_MFP', line):
                 self.properties['DRYGAS_MFP'] = True
 
             # For EOS or compositional models, get required parameters
             if nfo.check_token('NHC', line):  # Get number of components
-                self.eos_nhc = int(nfo.get_expected_token_value('NHC', line,
-                                                                file_as_list,
-                                                                custom_message="Property NHC does not \
+                self.eos_nhc = int(nfo.get_expected_token_value_at('NHC', line_indx,
+                                                                   file_as_list,
+                                                                   custom_message="Property NHC does not \
                                                                 have a numerical value."))
             if nfo.check_token('COMPONENTS', line):  # Get NHC components
                 elems = line.split()
@@ -342,54 +355,47 @@ class NexusPVTMethod(DynamicProperty):
                 if self.eos_nhc and self.eos_nhc > 0:
                     self.eos_components = elems[components_index + 1:components_index + 1 + int(self.eos_nhc)]
             if nfo.check_token('TEMP', line):  # Get default EOS temperature
-                self.eos_temp = float(nfo.get_expected_token_value(
-                    'TEMP', line, file_as_list, custom_message="Property TEMP does not have a numerical value."))
+                self.eos_temp = float(nfo.get_expected_token_value_at(
+                    'TEMP', line_indx, file_as_list, custom_message="Property TEMP does not have a numerical value."))
 
             # Check for EOS options
             if nfo.check_token('EOSOPTIONS', line):
-                if nfo.get_expected_token_value('EOSOPTIONS', line, file_as_list) in PVT_EOS_METHODS:
-                    self.eos_options['EOS_METHOD'] = nfo.get_expected_token_value('EOSOPTIONS', line, file_as_list)
+                if nfo.get_expected_token_value_at('EOSOPTIONS', line_indx, file_as_list) in PVT_EOS_METHODS:
+                    self.eos_options['EOS_METHOD'] = nfo.get_expected_token_value_at('EOSOPTIONS', line_indx,
+                                                                                     file_as_list)
                 else:
                     self.eos_options['EOS_METHOD'] = 'PR'
             # Find EOS single-word options, like CAPILLARYFLASH and add to list
-            if [i for i in line.split() if i in PVT_EOSOPTIONS_PRIMARY_WORDS]:
+            primary_words = primary_word_keywords.find_all(line)
+            if primary_words:
                 if 'EOS_OPT_PRIMARY_LIST' not in self.eos_options.keys():
                     self.eos_options['EOS_OPT_PRIMARY_LIST'] = []
                 if not isinstance(self.eos_options['EOS_OPT_PRIMARY_LIST'], list):
                     raise ValueError(f"EOS_OPT_PRIMARY_LIST should be a list, instead \
                                      got {self.eos_options['EOS_OPT_PRIMARY_LIST']}")
-                self.eos_options['EOS_OPT_PRIMARY_LIST'].extend([i for i in line.split() if i
-                                                                 in PVT_EOSOPTIONS_PRIMARY_WORDS])
+                self.eos_options['EOS_OPT_PRIMARY_LIST'].extend(primary_words)
             # Find EOS key-value pairs, like LI_FACT 0.9 or FUGERR 5
-            if [i for i in line.split() if i in PVT_EOSOPTIONS_PRIMARY_KEYS_FLOAT]:
-                for key in PVT_EOSOPTIONS_PRIMARY_KEYS_FLOAT:
-                    if nfo.check_token(key, line):
-                        self.eos_options[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
-            if [i for i in line.split() if i in PVT_EOSOPTIONS_PRIMARY_KEYS_INT]:
-                for key in PVT_EOSOPTIONS_PRIMARY_KEYS_INT:
-                    if nfo.check_token(key, line):
-                        self.eos_options[key] = int(nfo.get_expected_token_value(key, line, file_as_list))
+            for key in float_keywords.find_all(line):
+                self.eos_options[key] = float(nfo.get_expected_token_value_at(key, line_indx, file_as_list))
+            for key in int_keywords.find_all(line):
+                self.eos_options[key] = int(nfo.get_expected_token_value_at(key, line_indx, file_as_list))
             # Read TRANSITION, TRANS_TEST and PHASEID eos options, if present
-            primary_keys2populate = ['TRANSITION', 'TRANS_TEST', 'PHASEID']
-            primary_keys2populate_defaults = ['TEST', 'INCRP', '']
-            secondary_keys = [PVT_EOSOPTIONS_TRANS_KEYS, PVT_EOSOPTIONS_TRANS_TEST_KEYS, PVT_EOSOPTIONS_PHASEID_KEYS]
-            if [i for i in line.split() if i in primary_keys2populate]:
+            if primary_keys2populate_keywords.found_in(line):
                 trans_flag = True
             if trans_flag:
                 for index in range(len(primary_keys2populate)):
                     pkey = primary_keys2populate[index]
                     p2key = primary_keys2populate_defaults[index]
                     sec_key = secondary_keys[index]
-                    self.__populate_eos_opts_to_tertiary_keys(pkey, p2key, line, file_as_list, sec_key)
+                    self.__populate_eos_opts_to_tertiary_keys(pkey, p2key, line, file_as_list, sec_key, line_indx)
             # Read TRANS_OPTIMIZATION eos options, if present
             if nfo.check_token('TRANS_OPTIMIZATION', line):
                 new_dict: dict[str, float] = {}
-                for tert_key in PVT_EOSOPTIONS_TERTIARY_KEYS:
-                    if nfo.check_token(tert_key, line):
-                        potential_value = float(nfo.get_expected_token_value(tert_key, line, file_as_list))
-                        if isinstance(potential_value, float):
-                            new_dict[tert_key] = potential_value
-                            self.eos_options['TRANS_OPTIMIZATION'] = new_dict
+                for tert_key in PVT_EOSOPTIONS_TERTIARY_MATCHER.find_all(line):
+                    potential_value = float(nfo.get_expected_token_value_at(tert_key, line_indx, file_as_list))
+                    if isinstance(potential_value, float):
+                        new_dict[tert_key] = potential_value
+                        self.eos_options['TRANS_OPTIMIZATION'] = new_dict
 
             # Identify beginning and ending line indices for different kinds tables in PVT file
             if start_reading_table:  # Figure out ending line indices for tables
@@ -426,11 +432,7 @@ class NexusPVTMethod(DynamicProperty):
             if table_found:
                 continue
             # Check if this line represents the header of a PVT table
-            table_header_row_options = ['PRES', 'DP', 'RV', 'INDEX', 'COMPONENT']
-            header_row_flag = False
-            for hr in table_header_row_options:
-                if nfo.check_token(hr, line):
-                    header_row_flag = True
+            header_row_flag = table_header_row_keywords.found_in(line)
             reading_a_table_flag = False
             for table_name in PVT_ALL_TABLE_KEYWORDS:
                 if table_being_read[table_name]:
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.relpm_keywords import RELPM_TABLE_KEYWORDS, RELPM_KEYWORDS_VALUE_FLOAT
 from ResSimpy.Nexus.NexusKeywords.relpm_keywords import RELPM_SINGLE_KEYWORDS, RELPM_HYSTERESIS_PRIMARY_KEYWORDS
@@ -12,6 +11,10 @@ from ResSimpy.DynamicProperty import DynamicProperty
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union, get_empty_hysteresis_dict
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -50,6 +53,7 @@ class NexusRelPermMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with relative permeability and capillary pressure data, in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         # Handle non-hysteresis relperm and capillary pressure parameters
         relperm_dict = self.properties
@@ -140,7 +144,7 @@ class NexusRelPermMethod(DynamicProperty):
         return printable_str
 
     def __populate_optional_str_keywords(self, keyword: str, keyword_value_options: list[str], single_line: str,
-                                         line_list: list[str]) -> None:
+                                         line_list: list[str], line_index: int) -> None:
         """Utility function to populate rel perm keywords that have optional string values, e.g., IFT, JFUNC, etc.
 
         Args:
@@ -149,9 +153,10 @@ class NexusRelPermMethod(DynamicProperty):
             keyword_value_options (list[str]): primary keyword optional values, e.g., [METHOD1, METHOD2] for IFT
             single_line (str): single line as read from input RELPM file
             line_list (list[str]): list of strings that comprise input RELPM file
+            line_index (int): index of single_line in line_list
         """
         if nfo.check_token(keyword, single_line):
-            key_val = nfo.get_token_value(keyword, single_line, line_list)
+            key_val = nfo.get_token_value_at(keyword, line_index, line_list)
             if key_val in keyword_value_options:
                 self.properties[keyword] = key_val
             else:
@@ -181,19 +186,20 @@ class NexusRelPermMethod(DynamicProperty):
         recon_dict: dict[str, Union[float, pd.DataFrame]] = {}
         found_reconstruct = False
 
+        single_keywords = KeywordMatcher(RELPM_SINGLE_KEYWORDS)
+        float_keywords = KeywordMatcher(RELPM_KEYWORDS_VALUE_FLOAT)
+        table_keywords = KeywordMatcher(RELPM_TABLE_KEYWORDS)
+        end_keywords = KeywordMatcher(RELPM_KEYWORDS)
+
         line_indx = 0
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Find standalone relperm keywords
-            if [i for i in line.split() if i in RELPM_SINGLE_KEYWORDS]:
-                for word in RELPM_SINGLE_KEYWORDS:
-                    if nfo.check_token(word, line):
-                        self.properties[word] = ''
+            for word in single_keywords.find_all(line):
+                self.properties[word] = ''
             # Find relperm key-value pairs, such as SOMOPT2 0.05
-            if [i for i in line.split() if i in RELPM_KEYWORDS_VALUE_FLOAT]:
-                for key in RELPM_KEYWORDS_VALUE_FLOAT:
-                    if nfo.check_token(key, line):
-                        self.properties[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
+            for key in float_keywords.find_all(line):
+                self.properties[key] = float(nfo.get_expected_token_value_at(key, line_index, file_as_list))
             # Handle certain specific relperm options
             optional_keyword_dict = {
                 'JFUNC': ['KX', 'KY', 'KXKY'],
@@ -204,13 +210,13 @@ class NexusRelPermMethod(DynamicProperty):
                 'DERIVATIVES': ['ANALYTICAL', 'NUMERICAL']
                 }
             for opt_key, opt_vals in optional_keyword_dict.items():
-                self.__populate_optional_str_keywords(opt_key, opt_vals, line, file_as_list)
+                self.__populate_optional_str_keywords(opt_key, opt_vals, line, file_as_list, line_index)
             # Handle tabular reconstruction
             if nfo.check_token('RECONSTRUCT', line):
                 found_reconstruct = True
             for recon_key in ['NSGDIM', 'NSWDIM']:
                 if nfo.check_token(recon_key, line) and found_reconstruct:
-                    recon_dict[recon_key] = int(nfo.get_expected_token_value(recon_key, line, file_as_list))
+                    recon_dict[recon_key] = int(nfo.get_expected_token_value_at(recon_key, line_index, file_as_list))
             if found_reconstruct:
                 self.properties['RECONSTRUCT'] = recon_dict
 
@@ -237,18 +243,13 @@ class NexusRelPermMethod(DynamicProperty):
             # Find ending index of relperm tables
             # if start_reading_table:
             for table_keyword in RELPM_TABLE_KEYWORDS:
-                if table_being_read[table_keyword]:
-                    for potential_endkeyword in RELPM_KEYWORDS:
-                        if nfo.check_token(potential_endkeyword, line):
-                            relpm_table_indices[table_keyword][1] = line_indx
-                            table_being_read[table_keyword] = False
-                            break
+                if table_being_read[table_keyword] and end_keywords.found_in(line):
+                    relpm_table_indices[table_keyword][1] = line_indx
+                    table_being_read[table_keyword] = False
             # Find the starting index of relperm tables
-            if [i for i in line.split() if i in RELPM_TABLE_KEYWORDS]:
-                for table_keyword in RELPM_TABLE_KEYWORDS:
-                    if nfo.check_token(table_keyword, line):
-                        relpm_table_indices[table_keyword] = [line_indx + 1, len(file_as_list)]
-                        table_being_read[table_keyword] = True
+            for table_keyword in table_keywords.find_all(line):
+                relpm_table_indices[table_keyword] = [line_indx + 1, len(file_as_list)]
+                table_being_read[table_keyword] = True
 
             line_indx += 1
 
@@ -260,37 +261,39 @@ class NexusRelPermMethod(DynamicProperty):
         # Read nondarcy parameters from nondarcy section, if present:
         for key in nondarcy_indices.keys():
             nondarcy_dict: dict[str, Union[float, pd.DataFrame]] = {}
-            for line in file_as_list[nondarcy_indices[key][0]:nondarcy_indices[key][1]]:
+            for line_index, line in enumerate(file_as_list[nondarcy_indices[key][0]:nondarcy_indices[key][1]],
+                                              start=nondarcy_indices[key][0]):
                 for param in RELPM_NONDARCY_PARAMS:
                     if nfo.check_token(param, line):
-                        nondarcy_dict[param] = float(nfo.get_expected_token_value(param, line, file_as_list))
+                        nondarcy_dict[param] = float(nfo.get_expected_token_value_at(param, line_index, file_as_list))
             self.properties[key] = nondarcy_dict
 
         # Read hysteresis section, if present
         if len(hysteresis_section_indices) > 0:
-            for line in file_as_list[hysteresis_section_indices[0]:hysteresis_section_indices[1]]:
+            for line_index, line in enumerate(file_as_list[hysteresis_section_indices[0]:hysteresis_section_indices[1]],
+                                              start=hysteresis_section_indices[0]):
                 if [i for i in line.split() if i in ['NONE', 'NOCHK_HYS']]:
                     for hyst_keyword in ['NONE', 'NOCHK_HYS']:
                         if nfo.check_token(hyst_keyword, line):
                             self.hysteresis_params[hyst_keyword] = ''
-                if nfo.check_token('KRW', line) and nfo.get_token_value('KRW', line, file_as_list) == 'USER':
+                if nfo.check_token('KRW', line) and nfo.get_token_value_at('KRW', line_index, file_as_list) == 'USER':
                     self.hysteresis_params['KRW'] = 'USER'
                 if [i for i in line.split() if i in ['KRG', 'KROW']]:
                     for hyst_keyword in ['KRG', 'KROW']:
                         if nfo.check_token(hyst_keyword, line):
-                            hyst_keyword_primary_key = nfo.get_token_value(hyst_keyword, line, file_as_list)
+                            hyst_keyword_primary_key = nfo.get_token_value_at(hyst_keyword, line_index, file_as_list)
                             if hyst_keyword_primary_key == 'USER':
                                 self.hysteresis_params[hyst_keyword] = 'USER'
                             elif hyst_keyword_primary_key in ['LINEAR', 'SCALED', 'CARLSON', 'KILLOUGH']:
                                 hyst_dict: dict[str, Union[str, float, dict[str, Union[str, float]]]] = {}
                                 hyst_subdict: dict[str, Union[str, float]] = {}
                                 if nfo.check_token('MAXTRAP', line):
-                                    hyst_subdict['MAXTRAP'] = float(nfo.get_expected_token_value('MAXTRAP',
-                                                                                                 line, file_as_list))
+                                    hyst_subdict['MAXTRAP'] = float(nfo.get_expected_token_value_at(
+                                        'MAXTRAP', line_index, file_as_list))
                                     hyst_dict[hyst_keyword_primary_key] = hyst_subdict
                                 if nfo.check_token('EXP', line):
-                                    hyst_subdict['EXP'] = float(nfo.get_expected_token_value('EXP',
-                                                                                             line, file_as_list))
+                                    hyst_subdict['EXP'] = float(nfo.get_expected_token_value_at(
+                                        'EXP', line_index, file_as_list))
                                     hyst_dict[hyst_keyword_primary_key] = hyst_subdict
                                 if nfo.check_token('NOMOD', line):
                                     hyst_subdict['NOMOD'] = ''
@@ -304,8 +307,8 @@ class NexusRelPermMethod(DynamicProperty):
                             for hyst_keyword_primary_key in ['MAXSW', 'MINSG', 'ETA', 'LAND', 'ALPHA', 'AFAC']:
                                 if nfo.check_token(hyst_keyword_primary_key, line):
                                     hyst_pc_dict[hyst_keyword_primary_key] = \
-                                        float(nfo.get_expected_token_value(hyst_keyword_primary_key,
-                                                                           line, file_as_list))
+                                        float(nfo.get_expected_token_value_at(hyst_keyword_primary_key,
+                                                                              line_index, file_as_list))
                             # Search for single keyword options
                             for hyst_keyword_primary_key in ['TRAPSCALE', 'NOWATHYS', 'NOGASHYS', 'NOOILHYS']:
                                 if nfo.check_token(hyst_keyword_primary_key, line):
@@ -315,4 +318,4 @@ class NexusRelPermMethod(DynamicProperty):
                     for hyst_keyword in ['TOLREV', 'TOLHYS']:
                         if nfo.check_token(hyst_keyword, line):
                             self.hysteresis_params[hyst_keyword] = float(
-                                nfo.get_expected_token_value(hyst_keyword, line, file_as_list))
+                                nfo.get_expected_token_value_at(hyst_keyword, line_index, file_as_list))
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.rock_keywords import ROCK_ALL_TABLE_KEYWORDS, ROCK_KEYWORDS_VALUE_FLOAT
 from ResSimpy.Nexus.NexusKeywords.rock_keywords import ROCK_SINGLE_KEYWORDS, ROCK_KEYWORDS_VALUE_STR
@@ -11,6 +10,10 @@ from ResSimpy.DynamicProperty import DynamicProperty
 from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
@@ -41,6 +44,7 @@ class NexusRockMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with rock properties data, in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         rock_dict = self.properties
         for key, value in rock_dict.items():
@@ -87,27 +91,26 @@ class NexusRockMethod(DynamicProperty):
         for table_name in ROCK_ALL_TABLE_KEYWORDS:
             table_being_read[table_name] = False
 
+        float_keywords = KeywordMatcher(ROCK_KEYWORDS_VALUE_FLOAT)
+        single_keywords = KeywordMatcher(ROCK_SINGLE_KEYWORDS)
+        str_keywords = KeywordMatcher(ROCK_KEYWORDS_VALUE_STR)
+        end_keywords = KeywordMatcher(ROCK_KEYWORDS)
+
         line_indx = 0
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Find ROCK key-value pairs, such as PREF 2000 or CR 1e-6
-            if [i for i in line.split() if i in ROCK_KEYWORDS_VALUE_FLOAT]:
-                for key in ROCK_KEYWORDS_VALUE_FLOAT:
-                    if nfo.check_token(key, line):
-                        self.properties[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
+            for key in float_keywords.find_all(line):
+                self.properties[key] = float(nfo.get_expected_token_value_at(key, line_index, file_as_list))
             # Find standalone rock property keywords, such as COMPR or KPMULT
-            if [i for i in line.split() if i in ROCK_SINGLE_KEYWORDS]:
-                for word in ROCK_SINGLE_KEYWORDS:
-                    if nfo.check_token(word, line):
-                        self.properties[word] = ''
+            for word in single_keywords.find_all(line):
+                self.properties[word] = ''
             # Handle REVERSIBLE or IRREVERSIBLE keywords
-            if [i for i in line.split() if i in ROCK_KEYWORDS_VALUE_STR]:
-                for key in ROCK_KEYWORDS_VALUE_STR:
-                    if nfo.check_token(key, line):
-                        if nfo.get_token_value(key, line, file_as_list) in ROCK_REV_IRREV_OPTIONS:
-                            self.properties[key] = nfo.get_expected_token_value(key, line, file_as_list)
-                        else:
-                            self.properties[key] = ''
+            for key in str_keywords.find_all(line):
+                if nfo.get_token_value_at(key, line_index, file_as_list) in ROCK_REV_IRREV_OPTIONS:
+                    self.properties[key] = nfo.get_expected_token_value_at(key, line_index, file_as_list)
+                else:
+                    self.properties[key] = ''
             # Find starting index of rock compaction table
             if nfo.check_token('CMT', line):
                 cmt_indices = [line_indx + 1, len(file_as_list)]
@@ -116,26 +119,20 @@ class NexusRockMethod(DynamicProperty):
                 line_indx += 1
                 continue
             # Find ending index of rock compaction table
-            if start_reading_table and table_being_read['CMT']:
-                for potential_endkeyword in ROCK_KEYWORDS:
-                    if nfo.check_token(potential_endkeyword, line):
-                        cmt_indices[1] = line_indx
-                        start_reading_table = False
-                        table_being_read['CMT'] = False
-                        break
+            if start_reading_table and table_being_read['CMT'] and end_keywords.found_in(line):
+                cmt_indices[1] = line_indx
+                start_reading_table = False
+                table_being_read['CMT'] = False
             # Find ending index of a water-induced rock compaction table
-            if start_reading_table and table_being_read['WIRCT']:
-                for potential_endkeyword in ROCK_KEYWORDS:
-                    if nfo.check_token(potential_endkeyword, line):
-                        wirct_indices_dict['WIRCT'][swinit_key][1] = line_indx
-                        start_reading_table = False
-                        table_being_read['WIRCT'] = False
-                        break
+            if start_reading_table and table_being_read['WIRCT'] and end_keywords.found_in(line):
+                wirct_indices_dict['WIRCT'][swinit_key][1] = line_indx
+                start_reading_table = False
+                table_being_read['WIRCT'] = False
             # Find starting index of a water-induced rock compaction table
             if nfo.check_token('WIRCT', line):
                 wirct_indices_dict['WIRCT'] = {}
             if nfo.check_token('SWINIT', line):
-                swinit_key = nfo.get_expected_token_value('SWINIT', line, file_as_list)
+                swinit_key = nfo.get_expected_token_value_at('SWINIT', line_index, file_as_list)
                 wirct_indices_dict['WIRCT'][swinit_key] = [line_indx+1, len(file_as_list)]
                 table_being_read['WIRCT'] = True
                 start_reading_table = True
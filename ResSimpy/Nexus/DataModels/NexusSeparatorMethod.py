@@ -1,16 +1,19 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
 from ResSimpy.Nexus.NexusKeywords.separator_keywords import SEPARATOR_KEYS_INT, SEPARATOR_KEYS_FLOAT
 from ResSimpy.Nexus.NexusKeywords.separator_keywords import SEPARATOR_KEYWORDS
 from ResSimpy.DynamicProperty import DynamicProperty
 from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
 class NexusSeparatorMethod(DynamicProperty):
@@ -44,6 +47,7 @@ class NexusSeparatorMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with separator data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         sep_dict = self.properties
         for key, value in sep_dict.items():
@@ -83,8 +87,12 @@ class NexusSeparatorMethod(DynamicProperty):
         # Flag to tell when to start reading a table
         start_reading_table: bool = False
 
+        float_keywords = KeywordMatcher(SEPARATOR_KEYS_FLOAT)
+        int_keywords = KeywordMatcher(SEPARATOR_KEYS_INT)
+        end_keywords = KeywordMatcher(SEPARATOR_KEYWORDS)
+
         line_indx = 0
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Determine separator type, i.e., EOS multistage, gas plant data or black oil
             if nfo.check_token('TEMP', line):  # EOS multistage separator table
@@ -108,14 +116,10 @@ class NexusSeparatorMethod(DynamicProperty):
                 continue
 
             # Find SEPARATOR key-value pairs, such as WATERMETHOD 1 or PRES_STD 14.7
-            if [i for i in line.split() if i in SEPARATOR_KEYS_FLOAT]:
-                for key in SEPARATOR_KEYS_FLOAT:
-                    if nfo.check_token(key, line):
-                        self.properties[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
-            if [i for i in line.split() if i in SEPARATOR_KEYS_INT]:
-                for key in SEPARATOR_KEYS_INT:
-                    if nfo.check_token(key, line):
-                        self.properties[key] = int(nfo.get_expected_token_value(key, line, file_as_list))
+            for key in float_keywords.find_all(line):
+                self.properties[key] = float(nfo.get_expected_token_value_at(key, line_index, file_as_list))
+            for key in int_keywords.find_all(line):
+                self.properties[key] = int(nfo.get_expected_token_value_at(key, line_index, file_as_list))
 
             # Find starting index for black oil separator table
             if self.separator_type == 'BLACKOIL':
@@ -127,12 +131,9 @@ class NexusSeparatorMethod(DynamicProperty):
 
             # Find ending index for EOS multistage and black oil separator tables
             if start_reading_table:
-                if self.separator_type in ['EOS', 'BLACKOIL']:
-                    for keyword in SEPARATOR_KEYWORDS:
-                        if nfo.check_token(keyword, line):
-                            sep_table_indices[1] = line_indx
-                            start_reading_table = False
-                            break
+                if self.separator_type in ['EOS', 'BLACKOIL'] and end_keywords.found_in(line):
+                    sep_table_indices[1] = line_indx
+                    start_reading_table = False
 
             # Find starting and ending indices for gas plant separator table
             if self.separator_type == 'GASPLANT':
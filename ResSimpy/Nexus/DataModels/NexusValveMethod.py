@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.valve_keywords import VALVE_TABLE_KEYWORDS, VALVE_RATE_KEYWORDS
 from ResSimpy.DynamicProperty import DynamicProperty
@@ -10,6 +9,9 @@ from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass(kw_only=True, repr=False)  # Doesn't need to write an _init_, _eq_ methods, etc.
 class NexusValveMethod(DynamicProperty):
@@ -39,6 +41,7 @@ class NexusValveMethod(DynamicProperty):
 
     def to_string(self) -> str:
         """Create string with valve data in Nexus file format."""
+        import pandas as pd
         printable_str = ''
         valve_dict = self.properties
         for key, value in valve_dict.items():
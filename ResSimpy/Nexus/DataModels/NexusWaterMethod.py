@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.DynamicProperty import DynamicProperty
 from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
@@ -10,6 +9,9 @@ from ResSimpy.Utils.factory_methods import get_empty_dict_union, get_empty_list_
 import ResSimpy.Nexus.nexus_file_operations as nfo
 from ResSimpy.Utils.invert_nexus_map import invert_nexus_map
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass  # Doesn't need to write an _init_, _eq_ methods, etc.
 class NexusWaterParams:
@@ -145,11 +147,11 @@ class NexusWaterMethod(DynamicProperty):
         found_params = False  # Flag inidicating if identified any WATER keywords
         temp: Optional[float] = None  # Variable to hold temperature for property section
         sal: Optional[float] = None  # Variable to hold salinity for property section
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Read in reference pressure
             if nfo.check_token('PREF', line):  # Reference pressure
-                self.reference_pressure = float(nfo.get_expected_token_value('PREF', line, file_as_list))
+                self.reference_pressure = float(nfo.get_expected_token_value_at('PREF', line_index, file_as_list))
 
             # Check if reading properties
             if nfo.check_token('CW', line):
@@ -174,13 +176,13 @@ class NexusWaterMethod(DynamicProperty):
 
             # Read in relevant water properties in line
             if nfo.check_token('TEMP', line):
-                temp = float(nfo.get_expected_token_value('TEMP', line, file_as_list))
+                temp = float(nfo.get_expected_token_value_at('TEMP', line_index, file_as_list))
             if nfo.check_token('SALINITY', line):
-                sal = float(nfo.get_expected_token_value('SALINITY', line, file_as_list))
+                sal = float(nfo.get_expected_token_value_at('SALINITY', line_index, file_as_list))
             for key in water_props_dict.keys():
                 if nfo.check_token(key, line):
                     found_params = True
-                    water_props_dict[key] = float(nfo.get_expected_token_value(key, line, file_as_list))
+                    water_props_dict[key] = float(nfo.get_expected_token_value_at(key, line_index, file_as_list))
 
             line_indx += 1
 
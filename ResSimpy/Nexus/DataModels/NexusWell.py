@@ -1,26 +1,82 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Sequence, Union
+from typing import Any, MutableSequence, Optional, Sequence, TYPE_CHECKING, Union
 from uuid import UUID
 
 from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
+from ResSimpy.Nexus.DataModels.NexusCompletionStore import NexusCompletionList, completion_columns
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Utils.generic_repr import generic_repr
 from ResSimpy.Well import Well
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class NexusWell(Well):
-    __completions: list[NexusCompletion]
+    __completions: MutableSequence[NexusCompletion]
 
     def __init__(self, well_name: str, completions: Sequence[NexusCompletion], units: UnitSystem) -> None:
-        if not isinstance(completions, list):
+        # completions loaded from a file are kept in the columnar store they were loaded into
+        if not isinstance(completions, list | NexusCompletionList):
             completions = list(completions)
-        self.__completions: list[NexusCompletion] = completions
+        self.__completions: MutableSequence[NexusCompletion] = completions
+        self.__completions_version: int = 0
+        # DataFrame of the completions and the completions_key it was made for
+        self.__completions_df: Optional[tuple[tuple[int, int], pd.DataFrame]] = None
         super().__init__(well_name=well_name, completions=completions, units=units)
 
     def __repr__(self) -> str:
-        return generic_repr(self)
+        return generic_repr(self, exclude_attributes=['_NexusWell__completions_df',
+                                                      '_NexusWell__completions_version'])
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the cached DataFrame is rebuilt when next requested rather than pickled
+        state = self.__dict__.copy()
+        state['_NexusWell__completions_df'] = None
+        return state
+
+    def get_completions_df(self) -> pd.DataFrame:
+        """Returns a DataFrame of the completions of the well, with a column for each property set on any of them.
+
+        The DataFrame is built a column at a time and cached until the completions are changed through the well or
+        NexusWells, so it can be requested repeatedly at little cost. Changes made directly to a completion object
+        are not picked up until the well's completions are next changed.
+
+        Returns:
+            pd.DataFrame: the well name, units and properties of each completion, one row per completion.
+        """
+        return self._get_cached_completions_df().copy()
+
+    def _get_cached_completions_df(self) -> pd.DataFrame:
+        """Returns the cached DataFrame of the completions, building it if the completions have changed."""
+        import pandas as pd
+
+        if self.__completions_df is not None and self.__completions_df[0] == self._completions_key:
+            return self.__completions_df[1]
+        columns = completion_columns(self.__completions)
+        completions_df = pd.DataFrame({'well_name': self.well_name, 'units': self.units.name, **columns},
+                                      index=pd.RangeIndex(len(self.__completions)))
+        completions_df = completions_df.dropna(axis=1, how='all')
+        self.__completions_df = (self._completions_key, completions_df)
+        return completions_df
+
+    @property
+    def _completions_key(self) -> tuple[int, int]:
+        """Changes whenever the completions are changed through the well, or completions are added or removed."""
+        return self.__completions_version, len(self.__completions)
+
+    def __completions_changed(self) -> None:
+        """Drops the cached DataFrame of the completions, called whenever the completions are changed."""
+        self.__completions_version += 1
+        self.__completions_df = None
+
+    def _get_completion_values(self, attribute: str) -> list[None | float | int | str]:
+        """Returns the value of an attribute for each completion, without creating completions held in a store."""
+        if isinstance(self.__completions, NexusCompletionList):
+            return self.__completions.get_values(attribute)
+        return [getattr(completion, attribute) for completion in self.__completions]
 
     @property
     def perforations(self) -> Sequence[NexusCompletion]:
@@ -149,6 +205,8 @@ class NexusWell(Well):
 
     def get_completion_by_id(self, id: UUID) -> NexusCompletion:
         """Returns the completion that matches the id provided."""
+        if isinstance(self.__completions, NexusCompletionList):
+            return self.__completions[self.__completions.index_of_id(id)]
         for completion in self.__completions:
             if completion.id == id:
                 return completion
@@ -170,14 +228,19 @@ class NexusWell(Well):
         if completion_index is None:
             completion_index = len(self.__completions)
         self.__completions.insert(completion_index, new_completion)
+        self.__completions_changed()
         return new_completion
 
     def _remove_completion_from_memory(self, completion_to_remove: NexusCompletion | UUID) -> None:
         if isinstance(completion_to_remove, NexusCompletion):
             completion_to_remove = self.find_completion(completion_to_remove)
             completion_to_remove = completion_to_remove.id
-        completion_index_to_remove = [x.id for x in self.__completions].index(completion_to_remove)
+        if isinstance(self.__completions, NexusCompletionList):
+            completion_index_to_remove = self.__completions.index_of_id(completion_to_remove)
+        else:
+            completion_index_to_remove = [x.id for x in self.__completions].index(completion_to_remove)
         self.__completions.pop(completion_index_to_remove)
+        self.__completions_changed()
 
     def _modify_completion_in_memory(self, new_completion_properties: dict[str, Union[None, float, int, str]],
                                      completion_to_modify: NexusCompletion | UUID,
@@ -187,6 +250,7 @@ class NexusWell(Well):
         else:
             completion = self.get_completion_by_id(completion_to_modify)
         completion.update(new_completion_properties)
+        self.__completions_changed()
 
     def _modify_completions_in_memory(self, new_completion_properties: dict[str, Union[None, float, int, str]],
                                       completions_to_modify: list[NexusCompletion | UUID]) -> None:
@@ -196,6 +260,7 @@ class NexusWell(Well):
                 modify_this_completion.update(new_completion_properties)
             else:
                 completion.update(new_completion_properties)
+        self.__completions_changed()
 
     def _remove_completions_from_memory(self, completions_to_remove: Sequence[NexusCompletion | UUID]) -> None:
         # TODO improve comparison of dates with datetime libs
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import copy
-import pandas as pd
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
@@ -11,9 +10,9 @@ from ResSimpy.Nexus.structured_grid_operations import StructuredGridOperations
 import ResSimpy.Nexus.nexus_file_operations as nfo
 import ResSimpy.Nexus.array_function_operations as afo
 
-from resqpy.olio.read_nexus_fault import load_nexus_fault_mult_table_from_list
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
 
@@ -117,7 +116,7 @@ class NexusGrid(Grid):
             raise ValueError("Grid file not found, cannot load grid properties")
 
         file_as_list = self.__grid_file_contents
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
 
             # Load in the basic properties
             properties_to_load = [
@@ -141,13 +140,13 @@ class NexusGrid(Grid):
             for token_property in properties_to_load:
                 for modifier in token_property.modifiers:
                     StructuredGridOperations.load_token_value_if_present(
-                        token_property.token, modifier, token_property.property, line, file_as_list, ['INCLUDE'])
+                        token_property.token, modifier, token_property.property, line, file_as_list, ['INCLUDE'],
+                        line_index=line_index)
 
             # Load in grid dimensions
             if nfo.check_token('NX', line):
                 # Check that the format of the grid is NX followed by NY followed by NZ
-                current_line = file_as_list[file_as_list.index(line)]
-                remaining_line = current_line[current_line.index('NX') + 2:]
+                remaining_line = line[line.index('NX') + 2:]
                 if nfo.get_next_value(0, [remaining_line], remaining_line) != 'NY':
                     continue
                 remaining_line = remaining_line[remaining_line.index('NY') + 2:]
@@ -157,7 +156,7 @@ class NexusGrid(Grid):
                 # Avoid loading in a comment
                 if "!" in line and line.index("!") < line.index('NX'):
                     continue
-                next_line = file_as_list[file_as_list.index(line) + 1]
+                next_line = file_as_list[line_index + 1]
                 first_value, next_line = move_next_value(next_line)
                 second_value, next_line = move_next_value(next_line)
                 third_value, next_line = move_next_value(next_line)
@@ -264,6 +263,9 @@ class NexusGrid(Grid):
 
     def load_faults(self) -> None:
         """Function to read faults in Nexus grid file defined using MULT and FNAME keywords."""
+        # resqpy is slow to import so is only imported when faults are loaded
+        import pandas as pd
+        from resqpy.olio.read_nexus_fault import load_nexus_fault_mult_table_from_list
         file_content_as_list = self.__grid_file_contents
         if file_content_as_list is None:
             raise ValueError('Grid file contents have not been loaded')
@@ -277,14 +279,14 @@ class NexusGrid(Grid):
             f_names = df['NAME'].unique()
             f_mults = [1.] * len(f_names)
             mult_dict = dict(zip(f_names, f_mults))
-            for line in file_content_as_list:
+            for line_index, line in enumerate(file_content_as_list):
                 if nfo.check_token('MULTFL', line):
-                    fname = str(nfo.get_expected_token_value(
-                        'MULTFL', line, file_content_as_list,
+                    fname = str(nfo.get_expected_token_value_at(
+                        'MULTFL', line_index, file_content_as_list,
                         custom_message=f'{line} does not have a fault name following MULTFL'))
                     if fname in df['NAME'].unique():
-                        tmult = float(str(nfo.get_expected_token_value(
-                            fname, line, file_content_as_list,
+                        tmult = float(str(nfo.get_expected_token_value_at(
+                            fname, line_index, file_content_as_list,
                             custom_message=f'MULTFL {fname} does not have a numerical tmult value')))
                         mult_dict[fname] *= tmult
             mult_df = pd.DataFrame.from_dict(mult_dict, orient='index').reset_index()
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+# Enum representing the kinds of change reported when monitoring a running simulation
+class SimulationEventType(str, Enum):
+    JOB_ID = 'JOB_ID'
+    STATUS = 'STATUS'
+    PROGRESS = 'PROGRESS'
+    ERRORS_WARNINGS = 'ERRORS_WARNINGS'
+    FINISHED = 'FINISHED'
+    CHECK_FAILED = 'CHECK_FAILED'
@@ -1,3 +1,3 @@
 """Nexus enums Module, containing the Nexus specific enums."""
 
-__all__ = ['DateFormatEnum', 'UnitsEnum']
+__all__ = ['DateFormatEnum', 'SimulationEventEnum', 'UnitsEnum']
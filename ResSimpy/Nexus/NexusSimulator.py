@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import os
 import warnings
-from typing import Any, Union, Optional
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Iterable, Union, Optional
 
-import resqpy.model as rq
 from datetime import datetime
 import ResSimpy.Nexus.nexus_file_operations as nfo
 from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
@@ -28,14 +28,34 @@ from ResSimpy.Nexus.NexusWells import NexusWells
 from ResSimpy.Nexus.runcontrol_operations import SimControls
 from ResSimpy.Nexus.logfile_operations import Logging
 from ResSimpy.Nexus.structured_grid_operations import StructuredGridOperations
+from ResSimpy.Nexus.include_file_reader import IncludeFileReader
+from ResSimpy.Nexus.nexus_parse_cache import NexusParseCache
+from ResSimpy.Nexus.file_content_cache import FileContentCache
 from ResSimpy.Simulator import Simulator
 
+# The attribute the dynamic property methods are stored in and the class used to load them, for each attribute of
+# FcsNexusFile holding dynamic property method files
+_DYNAMIC_PROPERTY_METHODS: dict[str, tuple[str, Callable[..., Any]]] = {
+    'pvt_files': ('_pvt', NexusPVTMethods),
+    'separator_files': ('_separator', NexusSeparatorMethods),
+    'water_files': ('_water', NexusWaterMethods),
+    'equil_files': ('_equil', NexusEquilMethods),
+    'rock_files': ('_rock', NexusRockMethods),
+    'relperm_files': ('_relperm', NexusRelPermMethods),
+    'valve_files': ('_valve', NexusValveMethods),
+    'aquifer_files': ('_aquifer', NexusAquiferMethods),
+    'hyd_files': ('_hydraulics', NexusHydraulicsMethods),
+    'gas_lift_files': ('_gaslift', NexusGasliftMethods),
+}
+
 
 class NexusSimulator(Simulator):
 
     def __init__(self, origin: Optional[str] = None, destination: Optional[str] = None,
                  root_name: Optional[str] = None, nexus_data_name: str = "data", write_times: bool = False,
-                 manual_fcs_tidy_call: bool = False, lazy_loading: bool = True) -> None:
+                 manual_fcs_tidy_call: bool = False, lazy_loading: bool = True,
+                 max_workers: Optional[int] = None, cache_dir: Optional[str] = None,
+                 sections: Optional[Iterable[str]] = None, content_cache_bytes: Optional[int] = None) -> None:
         """Nexus simulator class. Inherits from the Simulator super class.
 
         Args:
@@ -46,6 +66,19 @@ class NexusSimulator(Simulator):
                 cards in. Defaults to True.
             manual_fcs_tidy_call (bool, optional): Determines whether fcs_tidy should be called - Currently not used. \
                 Defaults to False.
+            lazy_loading (bool, optional): If True, only loads the objects in the model when they are first \
+                accessed. Defaults to True.
+            max_workers (Optional[int], optional): maximum number of model files to read from disk at the same time \
+                when loading the model. Defaults to None, which reads the files one after another.
+            cache_dir (Optional[str], optional): directory to store the structure of the model files in, so that \
+                loading the same model again skips reading and parsing any files that haven't changed. Only point \
+                this at a directory writable by trusted users. Defaults to None, which doesn't use a cache.
+            sections (Optional[Iterable[str]], optional): fcs keywords of the model files to read when the model is \
+                loaded, e.g. {'WELLS', 'RUNCONTROL'}. The other model files are only read when first accessed, for \
+                example through model.pvt or model.network. Defaults to None, which reads all the model files.
+            content_cache_bytes (Optional[int], optional): approximate limit on the memory used by the content of the \
+                include files of the model. Unmodified include files are unloaded, least recently used first, and read \
+                from disk again when next needed. Defaults to None, which keeps the content of every file in memory.
 
         Attributes:
             run_control_file_path (Optional[str]): file path to the run control file - derived from the fcs file
@@ -93,27 +126,17 @@ class NexusSimulator(Simulator):
         self.__manual_fcs_tidy_call: bool = manual_fcs_tidy_call
 
         self.__default_units: UnitSystem = UnitSystem.ENGLISH  # The Nexus default
-        #
-        self._network: NexusNetwork = NexusNetwork(model=self)
-        self._wells: NexusWells = NexusWells(self)
-        self._grid: Optional[NexusGrid] = None
-        # Model dynamic properties
-        self._pvt: NexusPVTMethods = NexusPVTMethods()
-        self._separator: NexusSeparatorMethods = NexusSeparatorMethods()
-        self._water: NexusWaterMethods = NexusWaterMethods()
-        self._equil: NexusEquilMethods = NexusEquilMethods()
-        self._rock: NexusRockMethods = NexusRockMethods()
-        self._relperm: NexusRelPermMethods = NexusRelPermMethods()
-        self._valve: NexusValveMethods = NexusValveMethods()
-        self._aquifer: NexusAquiferMethods = NexusAquiferMethods()
-        self._hydraulics: NexusHydraulicsMethods = NexusHydraulicsMethods()
-        self._gaslift: NexusGasliftMethods = NexusGasliftMethods()
+        self.__initialise_model_objects()
         # Nexus operations modules
-        self._sim_controls: SimControls = SimControls(self)
         self.reporting: Reporting = Reporting(self)
         self._structured_grid_operations: StructuredGridOperations = StructuredGridOperations(self)
         self.logging: Logging = Logging(self)
         self.__lazy_loading: bool = lazy_loading
+        self.__max_workers: Optional[int] = max_workers
+        self.__parse_cache: Optional[NexusParseCache] = None if cache_dir is None else NexusParseCache(cache_dir)
+        self.__sections: Optional[set[str]] = None if sections is None else {x.upper() for x in sections}
+        self.__content_cache: Optional[FileContentCache] = None if content_cache_bytes is None else \
+            FileContentCache(content_cache_bytes)
 
         if destination is not None and destination != '':
             self.set_output_path(path=destination.strip())
@@ -125,6 +148,24 @@ class NexusSimulator(Simulator):
         # Load in the model
         self.__load_fcs_file()
 
+    def __initialise_model_objects(self) -> None:
+        """Creates empty instances of all the objects loaded from the model files."""
+        self._network: NexusNetwork = NexusNetwork(model=self)
+        self._wells: NexusWells = NexusWells(self)
+        self._grid: Optional[NexusGrid] = None
+        # Model dynamic properties
+        self._pvt: NexusPVTMethods = NexusPVTMethods()
+        self._separator: NexusSeparatorMethods = NexusSeparatorMethods()
+        self._water: NexusWaterMethods = NexusWaterMethods()
+        self._equil: NexusEquilMethods = NexusEquilMethods()
+        self._rock: NexusRockMethods = NexusRockMethods()
+        self._relperm: NexusRelPermMethods = NexusRelPermMethods()
+        self._valve: NexusValveMethods = NexusValveMethods()
+        self._aquifer: NexusAquiferMethods = NexusAquiferMethods()
+        self._hydraulics: NexusHydraulicsMethods = NexusHydraulicsMethods()
+        self._gaslift: NexusGasliftMethods = NexusGasliftMethods()
+        self._sim_controls: SimControls = SimControls(self)
+
     def remove_temp_from_properties(self):
         """Updates model values if the files are moved from a temp directory
         Replaces the first instance of temp/ in the file paths in the nexus simulation file paths.
@@ -149,6 +190,95 @@ class NexusSimulator(Simulator):
         self.__new_fcs_file_path = self.__new_fcs_file_path.replace('temp/', '', 1)
         self.model_files.surface_files[1].location = self.model_files.surface_files[1].location.replace('temp/', '', 1)
 
+    def refresh(self) -> list[NexusFile]:
+        """Reloads the parts of the model whose files have been modified, created or deleted on disk since the model \
+        was loaded.
+
+        Only the files that have changed, and the files that include them, are read and parsed again. Unchanged include
+        files are kept as they are. Only the objects loaded from the model files containing those files, such as the
+        wells, network, grid or property methods, are reset and are loaded again when next accessed. The wells and
+        network are also reset if the runcontrol file changes as they depend on the start date. If the fcs file or any
+        file it includes has changed then the whole model is loaded again. Any changes made in memory to a file that is
+        reloaded are discarded. The model's entry in the parse cache, if there is one, is removed.
+
+        Returns:
+            list[NexusFile]: the files found to have changed on disk, as they were before the refresh.
+        """
+        changed_fcs_files = self.model_files.find_fcs_files_changed_on_disk()
+        if changed_fcs_files:
+            self.date_format = DateFormat.MM_DD_YYYY
+            self.__run_units = UnitSystem.ENGLISH
+            self.__default_units = UnitSystem.ENGLISH
+            self._start_date = ''
+            self.__initialise_model_objects()
+            self.__load_fcs_file()
+            return changed_fcs_files
+
+        changed_files: list[NexusFile] = []
+        reloaded_attributes: set[str] = set()
+        unloaded_attributes = {self.__section_attribute(x) for x in self.model_files.unloaded_sections}
+        with IncludeFileReader(max_workers=self.__max_workers) as file_reader:
+            for files_attribute, model_file in self.model_files.iterate_model_files_with_attribute():
+                if files_attribute in unloaded_attributes:
+                    continue
+                changed_model_files = model_file.find_files_changed_on_disk()
+                if not changed_model_files or model_file.location is None:
+                    continue
+                changed_files.extend(changed_model_files)
+                reloaded_file = model_file.reload_files_changed_on_disk(changed_model_files, file_reader=file_reader)
+                self.model_files.replace_model_file(model_file, reloaded_file)
+                reloaded_attributes.add(files_attribute)
+
+        if changed_files and self.__parse_cache is not None:
+            # the files that weren't reloaded may have been changed in memory, so they can't be stored in the cache
+            self.__parse_cache.remove(self.__new_fcs_file_path)
+        self.__reload_model_objects(reloaded_attributes)
+        self.__add_files_to_content_cache()
+        return changed_files
+
+    def __reload_model_objects(self, reloaded_attributes: set[str]) -> None:
+        """Resets the objects loaded from the model files held in the given attributes of the model files."""
+        if 'runcontrol_file' in reloaded_attributes and self.model_files.runcontrol_file is not None:
+            self._start_date = ''
+            self.run_control_file_path = self.model_files.runcontrol_file.location
+            self._sim_controls.load_run_control_file()
+            reloaded_attributes = reloaded_attributes | {'well_files', 'surface_files'}
+        if 'structured_grid_file' in reloaded_attributes and self.model_files.structured_grid_file is not None:
+            self._grid = NexusGrid.load_structured_grid_file(self.model_files.structured_grid_file,
+                                                             lazy_loading=self.__lazy_loading)
+        if 'well_files' in reloaded_attributes:
+            self._wells = NexusWells(self)
+        if 'surface_files' in reloaded_attributes:
+            self._network = NexusNetwork(model=self)
+        for files_attribute in reloaded_attributes.intersection(_DYNAMIC_PROPERTY_METHODS):
+            self.__load_dynamic_property_methods(files_attribute)
+
+    @staticmethod
+    def __section_attribute(section: str) -> str:
+        """Returns the attribute of the model files holding the files for an fcs keyword."""
+        return {**FcsNexusFile.fcs_keyword_map_single(), **FcsNexusFile.fcs_keyword_map_multi()}[section]
+
+    def __load_section(self, section: str) -> None:
+        """Reads the model files for an fcs keyword if they were skipped when the model was loaded, then loads the \
+        objects that depend on them.
+        """
+        if section not in self.model_files.unloaded_sections:
+            return
+        # wells and the network use the start date from the runcontrol file
+        if section in ('WELLS', 'SURFACE'):
+            self.__load_section('RUNCONTROL')
+        with IncludeFileReader(max_workers=self.__max_workers) as file_reader:
+            self.model_files.load_section(section, file_reader=file_reader)
+        self.__reload_model_objects({self.__section_attribute(section)})
+        self.__add_files_to_content_cache()
+
+    def __load_all_sections(self) -> None:
+        """Reads the model files of every section skipped when the model was loaded, for example before writing \
+        the model out.
+        """
+        for section in sorted(self.model_files.unloaded_sections):
+            self.__load_section(section)
+
     def get_simulation_status(self, from_startup: bool = False) -> Optional[str]:
         return self.logging.get_simulation_status(from_startup)
 
@@ -164,8 +294,75 @@ class NexusSimulator(Simulator):
 
     @property
     def network(self) -> NexusNetwork:
+        self.__load_section('SURFACE')
         return self._network
 
+    @property
+    def wells(self) -> NexusWells:
+        self.__load_section('WELLS')
+        return self._wells
+
+    @property
+    def grid(self) -> Optional[NexusGrid]:
+        self.__load_section('STRUCTURED_GRID')
+        return self._grid
+
+    @property
+    def pvt(self) -> NexusPVTMethods:
+        self.__load_section('PVT')
+        return self._pvt
+
+    @property
+    def separator(self) -> NexusSeparatorMethods:
+        self.__load_section('SEPARATOR')
+        return self._separator
+
+    @property
+    def water(self) -> NexusWaterMethods:
+        self.__load_section('WATER')
+        return self._water
+
+    @property
+    def equil(self) -> NexusEquilMethods:
+        self.__load_section('EQUIL')
+        return self._equil
+
+    @property
+    def rock(self) -> NexusRockMethods:
+        self.__load_section('ROCK')
+        return self._rock
+
+    @property
+    def relperm(self) -> NexusRelPermMethods:
+        self.__load_section('RELPM')
+        return self._relperm
+
+    @property
+    def valve(self) -> NexusValveMethods:
+        self.__load_section('VALVE')
+        return self._valve
+
+    @property
+    def aquifer(self) -> NexusAquiferMethods:
+        self.__load_section('AQUIFER')
+        return self._aquifer
+
+    @property
+    def hydraulics(self) -> NexusHydraulicsMethods:
+        self.__load_section('HYD')
+        return self._hydraulics
+
+    @property
+    def gaslift(self) -> NexusGasliftMethods:
+        self.__load_section('GASLIFT')
+        return self._gaslift
+
+    def batch_edit(self) -> AbstractContextManager[FcsNexusFile]:
+        """Context manager for making many changes to the model, such as adding or removing thousands of \
+        completions, with each model file flattened at most once rather than once per change.
+        """
+        return self.model_files.batch_edit()
+
     @property
     def structured_grid_path(self):
         """Returns the location of the structured grid file."""
@@ -242,6 +439,8 @@ class NexusSimulator(Simulator):
             # If we're checking the units of a RESQML model, read it in and get the units. Otherwise, read the units
             # from the fcs file
             if os.path.splitext(model)[1] == '.epc':
+                # resqpy is slow to import so is only imported when a RESQML model is checked
+                import resqpy.model as rq
                 resqpy_model = rq.Model(epc_file=model)
 
                 # Load in the RESQML grid
@@ -294,10 +493,10 @@ class NexusSimulator(Simulator):
             if fcs_file is None:
                 warnings.warn(UserWarning(f'No file found for {model}'))
                 continue
-            for line in fcs_file:
+            for line_index, line in enumerate(fcs_file):
                 if nfo.check_token("SURFACE Network 1", line):
-                    surface_filename = nfo.get_expected_token_value(token="SURFACE Network 1", token_line=line,
-                                                                    file_list=fcs_file)
+                    surface_filename = nfo.get_expected_token_value_at(token="SURFACE Network 1", line_index=line_index,
+                                                                       file_list=fcs_file)
                     break
 
             if surface_filename is not None:
@@ -407,6 +606,34 @@ class NexusSimulator(Simulator):
         if self.__destination is not None and os.path.dirname(self._origin) != os.path.dirname(self.__destination):
             self._origin = self.__destination + "/" + os.path.basename(self.__original_fcs_file_path)
 
+    def __load_fcs_structure(self) -> FcsNexusFile:
+        """Loads the structure of the model files, using the parse cache if there is one."""
+        if self.__parse_cache is not None:
+            cached_structure = self.__parse_cache.load(self.__new_fcs_file_path)
+            if cached_structure is not None:
+                return cached_structure
+
+        with IncludeFileReader(max_workers=self.__max_workers) as file_reader:
+            model_files = FcsNexusFile.generate_fcs_structure(self.__new_fcs_file_path, file_reader=file_reader,
+                                                              sections=self.__sections)
+
+        if self.__parse_cache is not None:
+            # flatten the files before storing them so that the flattened files and their indexes are cached too
+            for model_file in model_files.iterate_model_files():
+                if model_file.file_content_as_list is not None:
+                    _ = model_file.get_flat_list_str_file
+            self.__parse_cache.store(self.__new_fcs_file_path, model_files, file_reader.read_paths)
+        return model_files
+
+    def __load_dynamic_property_methods(self, files_attribute: str) -> None:
+        """Creates the dynamic property methods from the model files stored in files_attribute of the model files."""
+        property_attribute, property_methods_class = _DYNAMIC_PROPERTY_METHODS[files_attribute]
+        files: Optional[dict[int, NexusFile]] = getattr(self.model_files, files_attribute)
+        if files is not None and len(files) > 0:
+            setattr(self, property_attribute, property_methods_class(files=files))
+        else:
+            setattr(self, property_attribute, property_methods_class())
+
     def __load_fcs_file(self):
         """Loads in the information from the supplied FCS file into the class instance.
         Loads in the paths for runcontrol, structured grid and the first surface network.
@@ -414,94 +641,36 @@ class NexusSimulator(Simulator):
         Attempts to load the run_control_file.
         Loads the wellspec and dynamic property files.
         """
-        # fcs_content_with_includes is used to scan only the fcs file and files specifically called with the INCLUDE
-        # token in front of it to prevent it from reading through all the other files. We need this here to extract the
-        # fcs properties only. The FcsFile structure is then generated and stored in the object (with all the nesting of
-        # the NexusFiles as self.model_files (e.g. STRUCTURED_GRID, RUNCONTROL etc)
-        fcs_content_with_includes = NexusFile.generate_file_include_structure(
-            self.__new_fcs_file_path).get_flat_list_str_file
-        self._model_files = FcsNexusFile.generate_fcs_structure(self.__new_fcs_file_path)
-        if fcs_content_with_includes is None:
-            raise ValueError(f'FCS file not found, no content for {self.__new_fcs_file_path}')
-        for line in fcs_content_with_includes:
-            if nfo.check_token('DATEFORMAT', line) or nfo.check_token('DATE_FORMAT', line):
-                format_token = 'DATEFORMAT' if nfo.check_token('DATEFORMAT', line) else 'DATE_FORMAT'
-                value = nfo.get_token_value(format_token, line, fcs_content_with_includes)
-                if value is not None:
-                    self.date_format = DateFormat.DD_MM_YYYY if value == 'DD/MM/YYYY' else DateFormat.MM_DD_YYYY
-
-                self._sim_controls.date_format_string = "%m/%d/%Y" if self.date_format is DateFormat.MM_DD_YYYY \
-                    else "%d/%m/%Y"
-            elif nfo.check_token('RUN_UNITS', line):
-                value = nfo.get_token_value('RUN_UNITS', line, fcs_content_with_includes)
-                if value is not None:
-                    self.__run_units = UnitSystem(value.upper())
-            elif nfo.check_token('DEFAULT_UNITS', line):
-                value = nfo.get_token_value('DEFAULT_UNITS', line, fcs_content_with_includes)
-                if value is not None:
-                    self.__default_units = UnitSystem(value.upper())
+        # The FcsFile structure is generated and stored in the object (with all the nesting of the NexusFiles as
+        # self.model_files (e.g. STRUCTURED_GRID, RUNCONTROL etc), reading the global settings of the fcs file in the
+        # same pass.
+        self._model_files = self.__load_fcs_structure()
+        if self.model_files.date_format is not None:
+            self.date_format = self.model_files.date_format
+            self._sim_controls.date_format_string = "%m/%d/%Y" if self.date_format is DateFormat.MM_DD_YYYY \
+                else "%d/%m/%Y"
+        if self.model_files.run_units is not None:
+            self.__run_units = self.model_files.run_units
+        if self.model_files.default_units is not None:
+            self.__default_units = self.model_files.default_units
 
         # Load in the other files
 
-        # === Load in dynamic properties ===
-        # Read in PVT properties from Nexus PVT method files
-        if self.model_files.pvt_files is not None and \
-                len(self.model_files.pvt_files) > 0:
-            self._pvt = NexusPVTMethods(files=self.model_files.pvt_files)
-
-        # Read in separator properties from Nexus separator method files
-        if self.model_files.separator_files is not None and \
-                len(self.model_files.separator_files) > 0:
-            self._separator = NexusSeparatorMethods(files=self.model_files.separator_files)
-
-        # Read in water properties from Nexus water method files
-        if self.model_files.water_files is not None and \
-                len(self.model_files.water_files) > 0:
-            self._water = NexusWaterMethods(files=self.model_files.water_files)
-
-        # Read in equilibration properties from Nexus equil method files
-        if self.model_files.equil_files is not None and \
-                len(self.model_files.equil_files) > 0:
-            self._equil = NexusEquilMethods(files=self.model_files.equil_files)
-
-        # Read in rock properties from Nexus rock method files
-        if self.model_files.rock_files is not None and \
-                len(self.model_files.rock_files) > 0:
-            self._rock = NexusRockMethods(files=self.model_files.rock_files)
-
-        # Read in relative permeability and capillary pressure properties from Nexus relperm method files
-        if self.model_files.relperm_files is not None and \
-                len(self.model_files.relperm_files) > 0:
-            self._relperm = NexusRelPermMethods(files=self.model_files.relperm_files)
-
-        # Read in valve and choke properties from Nexus valve method files
-        if self.model_files.valve_files is not None and \
-                len(self.model_files.valve_files) > 0:
-            self._valve = NexusValveMethods(files=self.model_files.valve_files)
-
-        # Read in aquifer properties from Nexus aquifer method files
-        if self.model_files.aquifer_files is not None and \
-                len(self.model_files.aquifer_files) > 0:
-            self._aquifer = NexusAquiferMethods(files=self.model_files.aquifer_files)
-
-        # Read in hydraulics properties from Nexus hyd method files
-        if self.model_files.hyd_files is not None and \
-                len(self.model_files.hyd_files) > 0:
-            self._hydraulics = NexusHydraulicsMethods(files=self.model_files.hyd_files)
-
-        # Read in gaslift properties from Nexus gaslift method files
-        if self.model_files.gas_lift_files is not None and \
-                len(self.model_files.gas_lift_files) > 0:
-            self._gaslift = NexusGasliftMethods(files=self.model_files.gas_lift_files)
+        # model files in sections that weren't requested are loaded when first accessed
+        unloaded_attributes = {self.__section_attribute(x) for x in self.model_files.unloaded_sections}
 
+        # === Load in dynamic properties ===
+        for files_attribute in _DYNAMIC_PROPERTY_METHODS:
+            if files_attribute not in unloaded_attributes:
+                self.__load_dynamic_property_methods(files_attribute)
         # === End of dynamic properties loading ===
 
         # Load in Runcontrol
-        if self.model_files.runcontrol_file is not None:
+        if self.model_files.runcontrol_file is not None and 'runcontrol_file' not in unloaded_attributes:
             self.run_control_file_path = self.model_files.runcontrol_file.location
             self._sim_controls.load_run_control_file()
 
-        if self.model_files.structured_grid_file is not None:
+        if self.model_files.structured_grid_file is not None and 'structured_grid_file' not in unloaded_attributes:
             self._grid = NexusGrid.load_structured_grid_file(self.model_files.structured_grid_file,
                                                              lazy_loading=self.__lazy_loading)
 
@@ -513,6 +682,13 @@ class NexusSimulator(Simulator):
                     warnings.warn(f'Well file location has not been found for {well_file}')
                     continue
 
+        self.__add_files_to_content_cache()
+
+    def __add_files_to_content_cache(self) -> None:
+        """Puts the include files of the model files in the content cache, if the model has one."""
+        if self.__content_cache is not None:
+            self.__content_cache.add_files(self.model_files.iterate_model_files())
+
     @staticmethod
     def update_file_value(file_path: str, token: str, new_value: str, add_to_start: bool = False) -> None:
         """Updates a value in a file if it is present and in the format {TOKEN} {VALUE}. If the token
@@ -616,6 +792,7 @@ class NexusSimulator(Simulator):
         section = section.upper()
         keyword = keyword.upper()
         operation = operation.lower()
+        self.__load_section(section)
 
         if section == "RUNCONTROL":
             if keyword == "TIME":
@@ -640,6 +817,7 @@ class NexusSimulator(Simulator):
         """
         section = section.upper()
         keyword = keyword.upper()
+        self.__load_section(section)
         if section == "RUNCONTROL":
             if keyword == "TIME":
                 return self._sim_controls.times
@@ -650,9 +828,10 @@ class NexusSimulator(Simulator):
 
     def get_structured_grid_dict(self) -> dict[str, Any]:
         """Convert the structured grid info to a dictionary and pass it to the front end."""
-        if self._grid is None:
+        grid = self.grid
+        if grid is None:
             return {}
-        return self._grid.to_dict()
+        return grid.to_dict()
 
     def get_abs_structured_grid_path(self, filename: str):
         """Returns the absolute path to the Structured Grid file."""
@@ -673,7 +852,7 @@ class NexusSimulator(Simulator):
 
     def load_network(self):
         """Populates nodes and connections from a surface file."""
-        self._network.load()
+        self.network.load()
 
     def write_out_new_simulator(self, new_file_path: str, new_include_file_location: str,
                                 write_out_all_files: bool = True, preserve_file_names: bool = True) -> None:
@@ -687,7 +866,7 @@ class NexusSimulator(Simulator):
             preserve_file_names (bool): Defaults to False. If True will derive names from the existing fcs_file.
             If False will derive new names from the new fcs file name and the property it represents in Nexus.
         """
-
+        self.__load_all_sections()
         self.model_files.update_model_files(new_file_path=new_file_path,
                                             new_include_file_location=new_include_file_location,
                                             write_out_all_files=write_out_all_files,
@@ -696,6 +875,7 @@ class NexusSimulator(Simulator):
 
     def update_simulator_files(self) -> None:
         """Updates the simulator with any changes to the included files. Overwrites existing files."""
+        self.__load_all_sections()
         self.model_files.update_model_files(new_file_path=None, new_include_file_location=None,
                                             write_out_all_files=False, preserve_file_names=True,
                                             overwrite_include_files=True)
@@ -5,10 +5,11 @@ from functools import cmp_to_key
 from typing import Sequence, Optional, TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
-
 from ResSimpy.Enums.HowEnum import OperationEnum
+from ResSimpy.Nexus.completion_cell_index import CompletionCellIndex
+from ResSimpy.Nexus.completion_date_index import CompletionDateIndex, CompletionPeriod
 from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
+from ResSimpy.Nexus.DataModels.NexusCompletionStore import COMPLETION_COLUMN_NAMES
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusWell import NexusWell
 from ResSimpy.Nexus.NexusKeywords.wells_keywords import WELLS_KEYWORDS
@@ -19,6 +20,7 @@ import ResSimpy.Nexus.nexus_file_operations as nfo
 from ResSimpy.Utils.invert_nexus_map import attribute_name_to_nexus_keyword
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
 
@@ -32,6 +34,10 @@ class NexusWells(Wells):
         self.__model = model
         self.__wells = []
         self.__add_object_operations = AddObjectOperations(NexusCompletion, self.table_header, self.table_footer, model)
+        # DataFrame of all the wells and the date index into it, along with the state of the wells they were made for
+        self.__wells_df: Optional[tuple[list[tuple[int, int, int]], pd.DataFrame]] = None
+        self.__date_index: Optional[tuple[list[tuple[int, int, int]], CompletionDateIndex]] = None
+        self.__cell_index: Optional[tuple[list[tuple[int, int, int]], CompletionCellIndex]] = None
         super().__init__()
 
     @property
@@ -57,23 +63,160 @@ class NexusWells(Wells):
         return next(wells_to_return, None)
 
     def get_wells_df(self) -> pd.DataFrame:
-        # loop through wells and completions to output a table
+        """Returns a DataFrame of the completions of every well, built from the cached DataFrame of each well."""
+        return self.__get_cached_wells_df().copy()
+
+    def __wells_state(self) -> list[tuple[int, int, int]]:
+        """Changes whenever a well is added or removed, or the completions of a well are changed."""
+        return [(id(well), *well._completions_key) for well in self.__wells]
+
+    def __get_cached_wells_df(self) -> pd.DataFrame:
+        import pandas as pd
         if not self.__wells_loaded:
             self.load_wells()
 
-        store_dictionaries = []
-        for well in self.__wells:
-            for completion in well.completions:
-                completion_props: dict[str, None | float | int | str] = {
-                    'well_name': well.well_name,
-                    'units': well.units.name,
-                    }
-                completion_props.update(completion.to_dict())
-                store_dictionaries.append(completion_props)
-        df_store = pd.DataFrame(store_dictionaries)
-        df_store = df_store.dropna(axis=1, how='all')
+        wells_state = self.__wells_state()
+        if self.__wells_df is not None and self.__wells_df[0] == wells_state:
+            return self.__wells_df[1]
+        well_dfs = [well._get_cached_completions_df() for well in self.__wells]
+        if not well_dfs:
+            df_store = pd.DataFrame()
+        else:
+            df_store = pd.concat(well_dfs, ignore_index=True)
+            df_store = df_store.dropna(axis=1, how='all')
+            # concatenating puts columns missing from the first wells at the end, so put them back in order
+            column_order = ['well_name', 'units', *COMPLETION_COLUMN_NAMES]
+            df_store = df_store[[x for x in column_order if x in df_store.columns] +
+                                [x for x in df_store.columns if x not in column_order]]
+        self.__wells_df = (wells_state, df_store)
         return df_store
 
+    def __get_date_index(self) -> CompletionDateIndex:
+        """Returns the index of completion dates into the wells DataFrame, rebuilding it if the wells have changed."""
+        if not self.__wells_loaded:
+            self.load_wells()
+
+        wells_state = self.__wells_state()
+        if self.__date_index is not None and self.__date_index[0] == wells_state:
+            return self.__date_index[1]
+        # convert each distinct date once, as the same dates are shared by many completions
+        date_numbers: dict[None | float | int | str, float] = {}
+        periods: list[CompletionPeriod] = []
+        first_row = 0
+        for well in self.__wells:
+            dates = well._get_completion_values('date')
+            for date in dates:
+                if date not in date_numbers:
+                    date_numbers[date] = self.__model._sim_controls.convert_date_to_number(str(date))
+            periods += CompletionDateIndex.periods_for_well([date_numbers[x] for x in dates], first_row)
+            first_row += len(dates)
+        date_index = CompletionDateIndex(periods)
+        self.__date_index = (wells_state, date_index)
+        return date_index
+
+    def state_at(self, date: str) -> pd.DataFrame:
+        """Returns the completions of every well in place at a date.
+
+        The completions in place for a well are those defined at the latest date on or before the given date where
+        the well's completions were changed. Wells whose first completions are after the date are left out.
+
+        Args:
+            date (str): date to get the completions at, in the date format of the model.
+
+        Returns:
+            pd.DataFrame: the completions in place, with the same columns as get_wells_df.
+        """
+        date_index = self.__get_date_index()
+        rows = date_index.rows_at(self.__model._sim_controls.convert_date_to_number(date))
+        return self.__get_cached_wells_df().iloc[rows].reset_index(drop=True)
+
+    def completions_between(self, start_date: str, end_date: str) -> pd.DataFrame:
+        """Returns the completions of every well defined between two dates, including those on either date.
+
+        Args:
+            start_date (str): first date, in the date format of the model.
+            end_date (str): last date, in the date format of the model.
+
+        Returns:
+            pd.DataFrame: the completions defined between the dates in date order, with the same columns as \
+                get_wells_df.
+        """
+        date_index = self.__get_date_index()
+        sim_controls = self.__model._sim_controls
+        rows = date_index.rows_between(sim_controls.convert_date_to_number(start_date),
+                                       sim_controls.convert_date_to_number(end_date))
+        return self.__get_cached_wells_df().iloc[rows].reset_index(drop=True)
+
+    def __get_cell_index(self) -> CompletionCellIndex:
+        """Returns the index of grid cells into the wells DataFrame, rebuilding it if the wells have changed."""
+        import numpy as np
+        if not self.__wells_loaded:
+            self.load_wells()
+
+        wells_state = self.__wells_state()
+        if self.__cell_index is not None and self.__cell_index[0] == wells_state:
+            return self.__cell_index[1]
+        cell_values: dict[str, list[None | float | int | str]] = {'i': [], 'j': [], 'k': []}
+        for well in self.__wells:
+            for attribute, values in cell_values.items():
+                values.extend(well._get_completion_values(attribute))
+        i, j, k = (np.array(cell_values[x], dtype=np.float64) for x in ('i', 'j', 'k'))
+        # only completions located by a structured grid cell can be looked up by cell
+        in_cell = ~(np.isnan(i) | np.isnan(j) | np.isnan(k))
+        cell_index = CompletionCellIndex(i[in_cell], j[in_cell], k[in_cell], np.flatnonzero(in_cell))
+        self.__cell_index = (wells_state, cell_index)
+        return cell_index
+
+    def completions_in_box(self, i_range: Optional[tuple[int, int]] = None,
+                           j_range: Optional[tuple[int, int]] = None, k_range: Optional[tuple[int, int]] = None,
+                           date: Optional[str] = None) -> pd.DataFrame:
+        """Returns the completions of every well in a box of grid cells.
+
+        Only completions with an i, j and k are found, so completions located by depth or cell number are left out.
+
+        Args:
+            i_range (Optional[tuple[int, int]]): first and last i index of the box. Defaults to every i index.
+            j_range (Optional[tuple[int, int]]): first and last j index of the box. Defaults to every j index.
+            k_range (Optional[tuple[int, int]]): first and last k index of the box. Defaults to every k index.
+            date (Optional[str]): if provided only returns the completions in place at this date, as in state_at.
+
+        Returns:
+            pd.DataFrame: the completions in the box, with the same columns as get_wells_df.
+        """
+        import numpy as np
+        rows = self.__get_cell_index().rows_in_box(i_range, j_range, k_range)
+        if date is not None:
+            date_rows = self.__get_date_index().rows_at(self.__model._sim_controls.convert_date_to_number(date))
+            rows = np.intersect1d(rows, np.array(date_rows, dtype=np.int64), assume_unique=True)
+        return self.__get_cached_wells_df().iloc[rows].reset_index(drop=True)
+
+    def completions_in_cell(self, i: int, j: int, k: int, date: Optional[str] = None) -> pd.DataFrame:
+        """Returns the completions of every well in a grid cell.
+
+        Args:
+            i (int): i index of the cell.
+            j (int): j index of the cell.
+            k (int): k index of the cell.
+            date (Optional[str]): if provided only returns the completions in place at this date, as in state_at.
+
+        Returns:
+            pd.DataFrame: the completions in the cell, with the same columns as get_wells_df.
+        """
+        return self.completions_in_box((i, i), (j, j), (k, k), date=date)
+
+    def completions_in_layers(self, first_layer: int, last_layer: int, date: Optional[str] = None) -> pd.DataFrame:
+        """Returns the completions of every well in a range of layers.
+
+        Args:
+            first_layer (int): first k index of the layers.
+            last_layer (int): last k index of the layers.
+            date (Optional[str]): if provided only returns the completions in place at this date, as in state_at.
+
+        Returns:
+            pd.DataFrame: the completions in the layers, with the same columns as get_wells_df.
+        """
+        return self.completions_in_box(k_range=(first_layer, last_layer), date=date)
+
     def load_wells(self) -> None:
         if self.__model.model_files.well_files is None:
             raise FileNotFoundError('No wells files found for current model.')
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import ResSimpy.Nexus.nexus_file_operations as nfo
-import pandas as pd
-from typing import Union
+from typing import TYPE_CHECKING, Union
 import warnings
 from ResSimpy.Nexus.NexusKeywords.structured_grid_keywords import GRID_ARRAY_KEYWORDS
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def collect_all_function_blocks(file_as_list: list[str]) -> list[list[str]]:
     """Collects all the function blocks within a grid file.
@@ -45,6 +47,7 @@ def create_function_parameters_df(function_list_to_parse: list[list[str]]) -> pd
     Returns:
         pandas.DataFrame: a dataframe holding each function's parameters in a row.
     """
+    import pandas as pd
 
     functions_df = pd.DataFrame(
         columns=['FUNCTION #', 'blocks [i1,i2,j1,j2,k1,k2]', 'region_type',
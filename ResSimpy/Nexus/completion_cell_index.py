@@ -0,0 +1,90 @@
+"""Index from structured grid cells to the well completions in them."""
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class CompletionCellIndex:
+    """Finds the completions in a cell, box of cells or range of layers of a structured grid.
+
+    Each completion's cell is packed into a single id, with i varying fastest and k slowest, and the ids are held
+    sorted so that the completions in a run of cells are found with a binary search using np.searchsorted. A box is
+    looked up as one run of cells for each row of cells in it. If the box covers every i index it is looked up as one
+    run per layer instead, and as a single run if it also covers every j index.
+    """
+
+    def __init__(self, i: np.ndarray, j: np.ndarray, k: np.ndarray, rows: np.ndarray) -> None:
+        """Initialises the CompletionCellIndex class.
+
+        Args:
+            i (np.ndarray): i index of the cell of each completion.
+            j (np.ndarray): j index of the cell of each completion.
+            k (np.ndarray): k index of the cell of each completion.
+            rows (np.ndarray): row of the wells DataFrame holding each completion.
+        """
+        import numpy as np
+
+        i = np.asarray(i, dtype=np.int64)
+        j = np.asarray(j, dtype=np.int64)
+        k = np.asarray(k, dtype=np.int64)
+        self.i_count: int = int(i.max()) + 1 if len(i) > 0 else 1
+        self.j_count: int = int(j.max()) + 1 if len(j) > 0 else 1
+        self.k_count: int = int(k.max()) + 1 if len(k) > 0 else 1
+        cell_ids = self.__cell_ids(i, j, k)
+        order = np.argsort(cell_ids, kind='stable')
+        self.__cell_ids_sorted: np.ndarray = cell_ids[order]
+        self.__rows: np.ndarray = np.asarray(rows, dtype=np.int64)[order]
+
+    def __cell_ids(self, i: np.ndarray, j: np.ndarray, k: np.ndarray) -> np.ndarray:
+        return (k * self.j_count + j) * self.i_count + i
+
+    def rows_in_box(self, i_range: Optional[tuple[int, int]] = None, j_range: Optional[tuple[int, int]] = None,
+                    k_range: Optional[tuple[int, int]] = None) -> np.ndarray:
+        """Returns the rows of the completions in a box of cells, in row order.
+
+        Args:
+            i_range (Optional[tuple[int, int]]): first and last i index of the box. Defaults to every i index.
+            j_range (Optional[tuple[int, int]]): first and last j index of the box. Defaults to every j index.
+            k_range (Optional[tuple[int, int]]): first and last k index of the box. Defaults to every k index.
+
+        Returns:
+            np.ndarray: rows of the wells DataFrame holding the completions in the box.
+        """
+        import numpy as np
+
+        i_first, i_last = self.__clip_range(i_range, self.i_count)
+        j_first, j_last = self.__clip_range(j_range, self.j_count)
+        k_first, k_last = self.__clip_range(k_range, self.k_count)
+        if i_first > i_last or j_first > j_last or k_first > k_last:
+            return np.empty(0, dtype=np.int64)
+
+        # find the runs of consecutive cell ids covering the box
+        whole_rows = i_first == 0 and i_last == self.i_count - 1
+        if whole_rows and j_first == 0 and j_last == self.j_count - 1:
+            j_values, k_values = np.array([0]), np.array([k_first])
+            j_end, k_end = np.array([self.j_count - 1]), np.array([k_last])
+        elif whole_rows:
+            k_values = np.arange(k_first, k_last + 1)
+            j_values, j_end, k_end = np.full_like(k_values, j_first), np.full_like(k_values, j_last), k_values
+        else:
+            j_grid, k_grid = np.meshgrid(np.arange(j_first, j_last + 1), np.arange(k_first, k_last + 1))
+            j_values, k_values = j_grid.ravel(), k_grid.ravel()
+            j_end, k_end = j_values, k_values
+        first_ids = self.__cell_ids(np.full_like(j_values, i_first), j_values, k_values)
+        last_ids = self.__cell_ids(np.full_like(j_end, i_last), j_end, k_end)
+        starts = np.searchsorted(self.__cell_ids_sorted, first_ids, side='left')
+        ends = np.searchsorted(self.__cell_ids_sorted, last_ids, side='right')
+        runs = [self.__rows[start:end] for start, end in zip(starts, ends) if end > start]
+        if not runs:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(runs))
+
+    @staticmethod
+    def __clip_range(index_range: Optional[tuple[int, int]], count: int) -> tuple[int, int]:
+        """Limits a range of cell indices to those that could hold a completion."""
+        if index_range is None:
+            return 0, count - 1
+        return max(index_range[0], 0), min(index_range[1], count - 1)
@@ -0,0 +1,132 @@
+"""Interval index over the periods for which each set of well completions is in place."""
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+
+@dataclass
+class CompletionPeriod:
+    """The completions of a well defined at a single date, which are in place until the well's next change.
+
+    Attributes:
+        start (float): date the completions were defined at, as a number of days from the model start date.
+        end (float): date of the next change to the completions of the well, or inf if there isn't one.
+        rows (list[int]): rows of the wells DataFrame holding the completions.
+    """
+    start: float
+    end: float
+    rows: list[int] = field(default_factory=list)
+
+
+class _IntervalNode:
+    """Node of a centred interval tree, holding the periods that contain its centre."""
+
+    def __init__(self, center: float, periods: list[CompletionPeriod]) -> None:
+        self.center = center
+        self.by_start = sorted(periods, key=lambda x: x.start)
+        self.by_end = sorted(periods, key=lambda x: x.end, reverse=True)
+        self.left: Optional[_IntervalNode] = None
+        self.right: Optional[_IntervalNode] = None
+
+
+class CompletionDateIndex:
+    """Finds the completions in place at a date, or defined between two dates, for all wells at once.
+
+    Periods are held both sorted by start date, for finding the changes between two dates, and in a centred interval
+    tree, for finding the periods containing a date. Both queries take O(log n + k) for n periods and k results.
+    """
+
+    def __init__(self, periods: Sequence[CompletionPeriod]) -> None:
+        """Initialises the CompletionDateIndex class.
+
+        Args:
+            periods (Sequence[CompletionPeriod]): the completion periods of every well.
+        """
+        self.__periods: list[CompletionPeriod] = sorted(periods, key=lambda x: x.start)
+        self.__starts: list[float] = [x.start for x in self.__periods]
+        self.__root: Optional[_IntervalNode] = self.__build_tree(self.__periods)
+
+    @staticmethod
+    def __build_tree(periods: list[CompletionPeriod]) -> Optional[_IntervalNode]:
+        """Builds the interval tree from periods sorted by start date."""
+        if not periods:
+            return None
+        root: Optional[_IntervalNode] = None
+        # (periods to split, parent node, whether the node is the left child)
+        to_build: list[tuple[list[CompletionPeriod], Optional[_IntervalNode], bool]] = [(periods, None, True)]
+        while to_build:
+            node_periods, parent, is_left = to_build.pop()
+            # using the start of a period as the centre means every node holds at least one period
+            center = node_periods[len(node_periods) // 2].start
+            node = _IntervalNode(center, [x for x in node_periods if x.start <= center < x.end])
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            left_periods = [x for x in node_periods if x.end <= center]
+            right_periods = [x for x in node_periods if x.start > center]
+            if left_periods:
+                to_build.append((left_periods, node, True))
+            if right_periods:
+                to_build.append((right_periods, node, False))
+        return root
+
+    def rows_at(self, date: float) -> list[int]:
+        """Returns the rows of the completions in place at a date, in row order.
+
+        Args:
+            date (float): date as a number of days from the model start date.
+        """
+        rows: list[int] = []
+        node = self.__root
+        while node is not None:
+            if date < node.center:
+                # every period at this node ends after the centre, so contains the date if it starts by then
+                for period in node.by_start:
+                    if period.start > date:
+                        break
+                    rows.extend(period.rows)
+                node = node.left
+            else:
+                # every period at this node starts by the centre, so contains the date if it ends after it
+                for period in node.by_end:
+                    if period.end <= date:
+                        break
+                    rows.extend(period.rows)
+                node = node.right
+        rows.sort()
+        return rows
+
+    def rows_between(self, start_date: float, end_date: float) -> list[int]:
+        """Returns the rows of the completions defined between two dates inclusive, in date order.
+
+        Args:
+            start_date (float): first date as a number of days from the model start date.
+            end_date (float): last date as a number of days from the model start date.
+        """
+        first = bisect.bisect_left(self.__starts, start_date)
+        last = bisect.bisect_right(self.__starts, end_date)
+        return [row for period in self.__periods[first:last] for row in period.rows]
+
+    @staticmethod
+    def periods_for_well(dates: Sequence[float], first_row: int) -> list[CompletionPeriod]:
+        """Splits the completions of a well into the periods between each change to its completions.
+
+        Args:
+            dates (Sequence[float]): date of each completion of the well, as a number of days from the model start.
+            first_row (int): row of the wells DataFrame holding the first completion of the well.
+
+        Returns:
+            list[CompletionPeriod]: one period for each distinct date, in date order.
+        """
+        rows_by_date: dict[float, list[int]] = {}
+        for position, date in enumerate(dates):
+            rows_by_date.setdefault(date, []).append(first_row + position)
+        starts = sorted(rows_by_date)
+        return [CompletionPeriod(start=start, end=starts[i + 1] if i + 1 < len(starts) else math.inf,
+                                 rows=rows_by_date[start]) for i, start in enumerate(starts)]
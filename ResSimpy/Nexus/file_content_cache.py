@@ -0,0 +1,95 @@
+"""Limits the memory used by the content of Nexus include files by unloading the least recently used ones."""
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Iterable, TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+
+
+class FileContentCache:
+    """Keeps the total size of the include file content held in memory within a budget.
+
+    Include files registered with the cache have their content unloaded, least recently used first, whenever the total
+    size of the content in memory goes over max_bytes. Unloaded content is read from disk again the next time the file
+    content is accessed. Files that have been modified in memory since they were read are never unloaded, so no
+    changes are lost, and don't count towards the budget. The size of a file is counted as the number of characters in
+    its lines.
+
+    The cache only holds weak references to the files, so files that are no longer used elsewhere are not kept alive.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialises the FileContentCache class.
+
+        Args:
+            max_bytes (int): total size of include file content to keep in memory.
+
+        Raises:
+            ValueError: if max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError(f'Maximum content cache size must not be negative, instead got {max_bytes}')
+        self.max_bytes: int = max_bytes
+        # size of the content of each file in memory, least recently used first
+        self.__entries: OrderedDict[UUID, tuple[weakref.ref[NexusFile], int]] = OrderedDict()
+        self.__total_bytes: int = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the content of the registered files currently held in memory."""
+        return self.__total_bytes
+
+    def add_files(self, files: Iterable[NexusFile]) -> None:
+        """Registers the include files at any depth of the given files with the cache.
+
+        The given files themselves are kept in memory, as they are accessed far more often than their include files.
+        Any flattened copies of the given files are dropped, so that they don't hold on to the include file content.
+
+        Args:
+            files (Iterable[NexusFile]): files to register the include files of, e.g. the model files of a model.
+        """
+        for file in files:
+            file._clear_flat_file_cache()
+            include_files = [] if file.include_objects is None else list(file.include_objects)
+            while include_files:
+                include_file = include_files.pop()
+                include_file._set_content_cache(self)
+                if include_file.include_objects is not None:
+                    include_files.extend(include_file.include_objects)
+
+    def record_access(self, file: NexusFile, content_size: int) -> None:
+        """Marks the content of a file as the most recently used, unloading other files if over budget.
+
+        Called by NexusFile whenever the content of a registered file is accessed while it matches the file on disk.
+
+        Args:
+            file (NexusFile): file whose content was accessed.
+            content_size (int): size of the content of the file.
+        """
+        with self.__lock:
+            entry = self.__entries.get(file.id, None)
+            if entry is None:
+                self.__entries[file.id] = (weakref.ref(file), content_size)
+                self.__total_bytes += content_size
+            else:
+                self.__entries.move_to_end(file.id)
+            self.__evict(keep=file.id)
+
+    def __evict(self, keep: UUID) -> None:
+        """Unloads the least recently used content until within budget, never unloading the file with id keep."""
+        for file_id in list(self.__entries):
+            if self.__total_bytes <= self.max_bytes:
+                return
+            if file_id == keep:
+                continue
+            file_ref, content_size = self.__entries.pop(file_id)
+            self.__total_bytes -= content_size
+            file = file_ref()
+            if file is not None:
+                file._evict_content()
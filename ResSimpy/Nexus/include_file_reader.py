@@ -0,0 +1,212 @@
+"""Reads Nexus files and their details from disk, optionally ahead of time on a pool of threads."""
+from __future__ import annotations
+
+import os
+import pathlib
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import Iterable, Optional
+
+import ResSimpy.Nexus.nexus_file_operations as nfo
+
+
+@dataclass(frozen=True)
+class FileReadResult:
+    """The content and details of a file read from disk.
+
+    Attributes:
+        file_as_list (Optional[list[str]]): lines of the file. None if the file could not be found.
+        linked_user (Optional[str]): user or owner of the file.
+        last_modified (Optional[datetime]): last modified date of the file.
+        modified_time (Optional[float]): last modified time of the file as returned by os.stat, used to tell \
+            whether the file has changed since it was read.
+        warning_messages (tuple[str, ...]): warnings raised while reading the file, to be raised by the caller.
+    """
+    file_as_list: Optional[list[str]]
+    linked_user: Optional[str] = None
+    last_modified: Optional[datetime] = None
+    modified_time: Optional[float] = None
+    warning_messages: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ParsedIncludeFile:
+    """The result of scanning the lines of a file for the files it includes.
+
+    Attributes:
+        file_as_list (list[str]): lines of the file with any line continuations joined.
+        include_locations (list[str]): full paths of all the files included.
+        include_files (list[tuple[str, bool]]): path as written in the file of each include file to load, and whether \
+            it is an array include file that is not loaded.
+        ends_with_embedded_array (bool): True if the scan stopped at an embedded grid array.
+    """
+    file_as_list: list[str]
+    include_locations: list[str]
+    include_files: list[tuple[str, bool]]
+    ends_with_embedded_array: bool
+
+
+def __get_pathlib_path_details(full_file_path: str, warning_messages: list[str]) -> Optional[str]:
+    if full_file_path == "" or full_file_path is None:
+        return None
+    pathlib_path = pathlib.Path(full_file_path)
+    owner: str = ''
+    group: str = ''
+    try:
+        owner = pathlib_path.owner()
+        group = pathlib_path.group()
+    except NotImplementedError:
+        # owner or group not supported on this system, continue without filling out that information
+        pass
+    except PermissionError:
+        # user doesn't have permission to access the file, continue without filling out that information
+        warning_messages.append(f'PermissionError when trying to access file at {full_file_path}')
+        pass
+    except FileNotFoundError:
+        # file not found, continue without filling out that information
+        warning_messages.append(f'FileNotFoundError when trying to access file at {full_file_path}')
+        pass
+
+    if owner is not None and group is not None:
+        return f"{owner}:{group}"
+    elif owner is not None:
+        return owner
+    return None
+
+
+def __get_modified_time_from_os_stat(full_file_path: str) -> Optional[float]:
+    if full_file_path == "" or full_file_path is None:
+        return None
+    stat_obj = os.stat(full_file_path)
+    return stat_obj.st_mtime
+
+
+def read_file(full_file_path: str) -> FileReadResult:
+    """Reads the lines of a file along with the owner and last modified date of the file.
+
+    Args:
+        full_file_path (str): path to the file to read.
+
+    Returns:
+        FileReadResult: the content and details of the file. The content is None if the file can't be found.
+    """
+    try:
+        file_as_list = nfo.load_file_as_list(full_file_path)
+    except FileNotFoundError:
+        return FileReadResult(file_as_list=None)
+
+    warning_messages: list[str] = []
+    user = __get_pathlib_path_details(full_file_path, warning_messages)
+    modified_time = __get_modified_time_from_os_stat(full_file_path)
+    last_changed = None if modified_time is None else datetime.fromtimestamp(modified_time, tz=timezone.utc)
+    return FileReadResult(file_as_list=file_as_list, linked_user=user, last_modified=last_changed,
+                          modified_time=modified_time, warning_messages=tuple(warning_messages))
+
+
+class IncludeFileReader:
+    """Reads files for NexusFile.generate_file_include_structure.
+
+    Each file is only read from disk once while loading, however many times it is included, unless it is modified in
+    the meantime. The reader also stores the result of scanning each file for its include files so that is only done
+    once per file.
+
+    With more than one worker, files are read on a thread pool as soon as they are found to be included, so that
+    waiting on the file system for many include files overlaps. The NexusFile structure itself is still built in order
+    on the calling thread, so the result is the same as reading every file one after another.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Initialises the IncludeFileReader class.
+
+        Args:
+            max_workers (Optional[int]): maximum number of files to read at the same time. Defaults to None, which
+                reads each file when it is needed on the calling thread.
+        """
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        if max_workers is not None and max_workers > 1:
+            self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ResSimpyFileReader')
+        self.__pending_reads: dict[str, Future[FileReadResult]] = {}
+        self.__read_files: dict[str, FileReadResult] = {}
+        # every path requested, in the order first requested, including any that could not be found
+        self.__read_paths: dict[str, None] = {}
+        self.__parsed_files: dict[tuple[str, Optional[float], bool, bool, bool], ParsedIncludeFile] = {}
+
+    def __enter__(self) -> IncludeFileReader:
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def prefetch(self, full_file_paths: Iterable[str]) -> None:
+        """Starts reading files that will be needed later. Does nothing if there is only one worker.
+
+        Args:
+            full_file_paths (Iterable[str]): paths to the files to start reading.
+        """
+        if self.__executor is None:
+            return
+        for full_file_path in full_file_paths:
+            if full_file_path not in self.__pending_reads and full_file_path not in self.__read_files:
+                self.__pending_reads[full_file_path] = self.__executor.submit(read_file, full_file_path)
+
+    def read(self, full_file_path: str) -> FileReadResult:
+        """Returns the content and details of a file, waiting for it to be read if it has already been requested.
+
+        Args:
+            full_file_path (str): path to the file to read.
+        """
+        self.__read_paths[full_file_path] = None
+        previous_result = self.__read_files.get(full_file_path, None)
+        if previous_result is not None and previous_result.modified_time == self.__modified_time(full_file_path):
+            result = previous_result
+        else:
+            pending_read = self.__pending_reads.pop(full_file_path, None)
+            result = read_file(full_file_path) if pending_read is None else pending_read.result()
+            if result.file_as_list is not None:
+                self.__read_files[full_file_path] = result
+        for message in result.warning_messages:
+            warnings.warn(message)
+        return result
+
+    @staticmethod
+    def __modified_time(full_file_path: str) -> Optional[float]:
+        """Returns the last modified time of a file, or None if the file no longer exists."""
+        try:
+            return os.stat(full_file_path).st_mtime
+        except FileNotFoundError:
+            return None
+
+    @property
+    def read_paths(self) -> list[str]:
+        """Paths of all the files that have been read, including any that could not be found."""
+        return list(self.__read_paths)
+
+    def get_parsed_file(self, full_file_path: str, modified_time: Optional[float], recursive: bool,
+                        skip_arrays: bool, top_level_file: bool) -> Optional[ParsedIncludeFile]:
+        """Returns the stored result of scanning a file for include files with the same settings, if there is one.
+
+        Args:
+            full_file_path (str): path to the file that was scanned.
+            modified_time (Optional[float]): last modified time of the file when it was read.
+            recursive (bool): recursive setting used in NexusFile.generate_file_include_structure.
+            skip_arrays (bool): skip_arrays setting used in NexusFile.generate_file_include_structure.
+            top_level_file (bool): top_level_file setting used in NexusFile.generate_file_include_structure.
+        """
+        return self.__parsed_files.get((full_file_path, modified_time, recursive, skip_arrays, top_level_file), None)
+
+    def store_parsed_file(self, full_file_path: str, modified_time: Optional[float], recursive: bool,
+                          skip_arrays: bool, top_level_file: bool, parsed_file: ParsedIncludeFile) -> None:
+        """Stores the result of scanning a file for include files. See get_parsed_file for the arguments."""
+        self.__parsed_files[(full_file_path, modified_time, recursive, skip_arrays, top_level_file)] = parsed_file
+
+    def close(self) -> None:
+        """Stops the workers, abandoning any files that were requested but never read."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+        self.__pending_reads = {}
+        self.__read_files = {}
+        self.__parsed_files = {}
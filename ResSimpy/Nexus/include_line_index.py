@@ -0,0 +1,102 @@
+"""Index mapping lines of a flattened Nexus file back to the file that each line comes from."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from itertools import pairwise
+from typing import Optional, Sequence
+from uuid import UUID
+
+from ResSimpy.Utils.fenwick_tree import FenwickTree
+
+# Length given to the final segment, which runs to the end of the file.
+_OPEN_ENDED_SEGMENT_LENGTH = 1 << 62
+
+
+class IncludeLineIndex:
+    """Maps an index in a flattened file to the file it came from and the index within that file.
+
+    The flattened file is split into segments, a new segment starting each time the flattened file moves into or out
+    of an include file. Segment lengths are stored in Fenwick trees so that lookups and updates after inserting or
+    removing lines take O(log n) time at any depth of include files.
+    """
+
+    def __init__(self, line_locations: Sequence[tuple[int, UUID]],
+                 segment_rows: Optional[Sequence[int]] = None) -> None:
+        """Initialises the IncludeLineIndex class.
+
+        Args:
+            line_locations (Sequence[tuple[int, UUID]]): the flattened index where each segment starts and the id of
+                the file the segment belongs to, in the order generated by NexusFile.iterate_line.
+            segment_rows (Optional[Sequence[int]]): the index within its own file of the first line of each segment,
+                in the same order as line_locations. This accounts for INCLUDE lines that don't appear in the
+                flattened file. If not provided the segments of each file are assumed to follow on from each other.
+        """
+        if len(line_locations) == 0:
+            raise ValueError("No include line locations found.")
+        order = sorted(range(len(line_locations)), key=lambda x: line_locations[x][0])
+        self.__owners: list[UUID] = [line_locations[x][1] for x in order]
+        starts = [line_locations[x][0] for x in order]
+        lengths = [next_start - start for start, next_start in pairwise(starts)] + [_OPEN_ENDED_SEGMENT_LENGTH]
+        self.__lengths = FenwickTree(lengths)
+
+        # The segments belonging to each file, and the index in the file of the first line of each segment
+        self.__owner_segments: dict[UUID, list[int]] = {}
+        for segment, obj_id in enumerate(self.__owners):
+            self.__owner_segments.setdefault(obj_id, []).append(segment)
+        if segment_rows is not None and len(segment_rows) == len(line_locations):
+            self.__segment_rows = [segment_rows[x] for x in order]
+        else:
+            self.__segment_rows = [0] * len(self.__owners)
+            for segments in self.__owner_segments.values():
+                for previous_segment, segment in pairwise(segments):
+                    self.__segment_rows[segment] = self.__segment_rows[previous_segment] + lengths[previous_segment]
+        # Lines added to or removed from a segment shift the lines of the later segments of the same file
+        self.__owner_row_shifts: dict[UUID, FenwickTree] = {
+            obj_id: FenwickTree([0] * len(segments)) for obj_id, segments in self.__owner_segments.items()}
+
+    def __segment_at(self, flattened_index: int) -> int:
+        """Returns the segment holding the flattened index.
+
+        Where several segments start on the same line, such as a file that is empty between two INCLUDE lines or an
+        include file whose first line is itself an INCLUDE, the empty segments are skipped so that the line belongs
+        to the innermost file holding it.
+        """
+        segment = self.__lengths.lower_bound(flattened_index)
+        if not (segment < len(self.__owners) and self.__lengths.prefix_sum(segment) == flattened_index):
+            return max(segment - 1, 0)
+        while segment < len(self.__owners) - 1 and self.__lengths[segment] == 0:
+            segment += 1
+        return segment
+
+    def find(self, flattened_index: int) -> tuple[UUID, int]:
+        """Finds which file a line in the flattened file belongs to.
+
+        Args:
+            flattened_index (int): index in the flattened file as list structure.
+
+        Returns:
+            tuple[UUID, int]: id of the file holding the line and the index of the line within that file.
+        """
+        segment = self.__segment_at(flattened_index)
+        obj_id = self.__owners[segment]
+        position_in_owner = bisect_left(self.__owner_segments[obj_id], segment)
+        segment_row = self.__segment_rows[segment] + self.__owner_row_shifts[obj_id].prefix_sum(position_in_owner + 1)
+        return obj_id, segment_row + flattened_index - self.__lengths.prefix_sum(segment)
+
+    def update_line_count(self, flattened_index: int, number_additional_lines: int) -> None:
+        """Updates the index after lines have been added to or removed from the file at flattened_index.
+
+        Args:
+            flattened_index (int): index in the flattened file where the lines were added or removed.
+            number_additional_lines (int): number of lines added, negative if lines were removed.
+        """
+        segment = self.__segment_at(flattened_index)
+        while number_additional_lines < 0 and self.__lengths[segment] < -number_additional_lines and \
+                segment < len(self.__owners) - 1:
+            # lines can't be removed from an empty segment, they come from the next segment holding any lines
+            segment += 1
+        self.__lengths.add(segment, number_additional_lines)
+        obj_id = self.__owners[segment]
+        next_position_in_owner = bisect_left(self.__owner_segments[obj_id], segment) + 1
+        if next_position_in_owner < len(self.__owner_segments[obj_id]):
+            self.__owner_row_shifts[obj_id].add(next_position_in_owner, number_additional_lines)
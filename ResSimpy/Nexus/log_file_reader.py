@@ -0,0 +1,217 @@
+"""Reads Nexus log files incrementally, so that checking on a simulation only reads what has been added to its log."""
+from __future__ import annotations
+
+import copy
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+import ResSimpy.Nexus.nexus_file_operations as nfo
+
+# Number of bytes read from each end of a large log file when only the status of the simulation is needed
+_LOG_FILE_END_BYTES = 1 << 20
+# Number of bytes from the start of a log file compared on each read to tell whether the file has been replaced
+_FINGERPRINT_BYTES = 1024
+
+
+@dataclass
+class LogFileContent:
+    """The details of a simulation run found in the lines of a Nexus log file.
+
+    Attributes:
+        case_name (str): name of the case to find the simulation times for.
+        start_time_line (Optional[str]): last line found marking the start of the simulation run.
+        end_time_line (Optional[str]): last line found marking the end of the simulation run.
+        job_number_line (Optional[str]): first line found with the job number of the simulation run.
+        errors_warnings_line (Optional[str]): last line found with the number of errors and warnings.
+        finished (bool): True if a line marking that Nexus has finished has been found.
+        last_time (Optional[str]): latest simulation time reached for the case, as written in the log file.
+    """
+    case_name: str
+    start_time_line: Optional[str] = None
+    end_time_line: Optional[str] = None
+    job_number_line: Optional[str] = None
+    errors_warnings_line: Optional[str] = None
+    finished: bool = False
+    last_time: Optional[str] = None
+    __read_in_times: bool = field(default=False, init=False, repr=False)
+    __time_heading_location: Optional[int] = field(default=None, init=False, repr=False)
+
+    def add_line(self, line: str) -> None:
+        """Updates the details with those found in the next line of the log file.
+
+        Args:
+            line (str): next line of the log file.
+        """
+        if nfo.check_token('start generic pdsh   prolog', line):
+            self.start_time_line = line
+        if nfo.check_token('end generic pdsh   epilog', line):
+            self.end_time_line = line
+        if self.job_number_line is None and 'Job number:' in line:
+            self.job_number_line = line
+        lower_case_line = line.lower()
+        if 'errors' in lower_case_line and 'warnings' in lower_case_line:
+            self.errors_warnings_line = line
+        if line == 'Nexus finished\n':
+            self.finished = True
+        self.__add_time_line(line)
+
+    def __add_time_line(self, line: str) -> None:
+        """Updates the latest simulation time from a line of the table of timesteps for the case."""
+        if f"Case Name = {self.case_name}" in line:
+            self.__read_in_times = True
+            return
+        if self.__read_in_times and nfo.check_token('TIME', line):
+            heading_location = 0
+            line_string = line
+            while len(line_string) > 0:
+                next_value = nfo.get_next_value(0, [line_string], line_string)
+                if next_value is None:
+                    break
+
+                line_string = line_string.replace(next_value, '', 1)
+                if next_value == 'TIME':
+                    self.__time_heading_location = heading_location
+                heading_location += 1
+
+        if self.__read_in_times and self.__time_heading_location is not None:
+            line_string = line
+            next_value = nfo.get_next_value(0, [line_string], line_string)
+            if next_value is not None and next_value.replace('.', '', 1).isdigit():
+                if self.__time_heading_location == 0 and \
+                        (self.last_time is None or float(next_value) > float(self.last_time)):
+                    self.last_time = next_value
+                for x in range(self.__time_heading_location):
+                    line_string = line_string.replace(next_value, '', 1)
+                    next_value = nfo.get_next_value(0, [line_string], line_string)
+                    if next_value is None:
+                        break
+                    # When we reach the time column, read in the time value.
+                    if x == (self.__time_heading_location - 1) and \
+                            (self.last_time is None or float(next_value) > float(self.last_time)):
+                        self.last_time = next_value
+
+
+@dataclass
+class _LogFileEntry:
+    """What has been read from a log file so far."""
+    content: LogFileContent
+    offset: int = 0
+    fingerprint: bytes = b''
+    incomplete_line: bytes = b''
+    read_to_end: bool = True
+
+
+def _decode_line(line: bytes) -> str:
+    return line.decode('utf-8', errors='replace').rstrip('\r') + '\n'
+
+
+class LogFileReader:
+    """Reads Nexus log files, remembering how far through each file it has read and what it has found so far.
+
+    The first time a log file is read every line is scanned. After that only the lines that have been added since the
+    previous read are scanned, so repeatedly checking on a running simulation doesn't read the whole log each time. If
+    the start of the file changes, for example because the simulation has been run again, the file is read again from
+    the beginning.
+
+    When only the status of a large log file that hasn't been read before is needed, just the start and the end of the
+    file are read, as that is where Nexus writes the details of the run.
+    """
+
+    def __init__(self, end_bytes: int = _LOG_FILE_END_BYTES) -> None:
+        """Initialises the LogFileReader class.
+
+        Args:
+            end_bytes (int): number of bytes read from each end of a large log file when only the status is needed.
+        """
+        self.__end_bytes = end_bytes
+        self.__entries: dict[str, _LogFileEntry] = {}
+
+    def read(self, log_file_path: str, case_name: str) -> LogFileContent:
+        """Reads everything added to a log file since it was last read.
+
+        Args:
+            log_file_path (str): path to the log file.
+            case_name (str): name of the case to find the simulation times for.
+
+        Returns:
+            LogFileContent: the details found in the whole of the log file, including any incomplete last line.
+        """
+        entry = self.__entries.get(log_file_path, None)
+        if entry is None or not entry.read_to_end or entry.content.case_name != case_name:
+            entry = _LogFileEntry(LogFileContent(case_name))
+
+        with open(log_file_path, 'rb') as f:
+            if entry.offset > 0 and f.read(len(entry.fingerprint)) != entry.fingerprint:
+                # the log file has been replaced since it was last read
+                entry = _LogFileEntry(LogFileContent(case_name))
+            f.seek(entry.offset)
+            new_bytes = f.read()
+        return self.__add_new_bytes(log_file_path, entry, new_bytes)
+
+    def read_status(self, log_file_path: str, case_name: str) -> LogFileContent:
+        """Reads enough of a log file to find the status of the simulation run.
+
+        Args:
+            log_file_path (str): path to the log file.
+            case_name (str): name of the case to find the simulation times for.
+
+        Returns:
+            LogFileContent: the details of the run found in the log file. The last_time is only filled in if the \
+                whole file has been read.
+        """
+        entry = self.__entries.get(log_file_path, None)
+        if entry is not None and not entry.read_to_end:
+            with open(log_file_path, 'rb') as f:
+                if f.read(len(entry.fingerprint)) == entry.fingerprint:
+                    return entry.content
+        elif entry is None:
+            with open(log_file_path, 'rb') as f:
+                start_bytes = f.read(self.__end_bytes)
+                if len(start_bytes) < self.__end_bytes:
+                    # small enough that the whole file has been read
+                    return self.__add_new_bytes(log_file_path, _LogFileEntry(LogFileContent(case_name)),
+                                                start_bytes)
+                f.seek(-self.__end_bytes, os.SEEK_END)
+                end_bytes = f.read()
+            entry = self.__read_ends(case_name, start_bytes, end_bytes)
+            if entry.content.finished:
+                self.__entries[log_file_path] = entry
+                return entry.content
+        # the simulation might still be running, so read the whole file so that later reads only read what is added
+        return self.read(log_file_path, case_name)
+
+    def __add_new_bytes(self, log_file_path: str, entry: _LogFileEntry, new_bytes: bytes) -> LogFileContent:
+        """Scans the lines completed by the bytes added to the end of a log file and stores the entry for the file."""
+        if len(entry.fingerprint) < _FINGERPRINT_BYTES:
+            entry.fingerprint = (entry.fingerprint + new_bytes)[:_FINGERPRINT_BYTES]
+        entry.offset += len(new_bytes)
+        lines = (entry.incomplete_line + new_bytes).split(b'\n')
+        entry.incomplete_line = lines.pop()
+        for line in lines:
+            entry.content.add_line(_decode_line(line))
+        self.__entries[log_file_path] = entry
+
+        if not entry.incomplete_line:
+            return entry.content
+        # the last line may still be being written, so it is read again next time along with the rest of the line
+        content = copy.copy(entry.content)
+        content.add_line(entry.incomplete_line.decode('utf-8', errors='replace'))
+        return content
+
+    @staticmethod
+    def __read_ends(case_name: str, start_bytes: bytes, end_bytes: bytes) -> _LogFileEntry:
+        """Scans the lines at the start and the end of a log file that is only partly read."""
+        content = LogFileContent(case_name)
+        # drop the lines cut through where reading stopped and started
+        for line in start_bytes.split(b'\n')[:-1]:
+            content.add_line(_decode_line(line))
+        end_lines = end_bytes.split(b'\n')[1:]
+        last_line = end_lines.pop()
+        for line in end_lines:
+            content.add_line(_decode_line(line))
+        if last_line:
+            content.add_line(last_line.decode('utf-8', errors='replace'))
+        # the times in the middle of the file haven't been read so the latest time found may not be right
+        content.last_time = None
+        return _LogFileEntry(content, fingerprint=start_bytes[:_FINGERPRINT_BYTES], read_to_end=False)
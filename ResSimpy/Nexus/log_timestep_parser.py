@@ -0,0 +1,110 @@
+"""Extracts the table of timesteps written to Nexus log files, for looking at how a simulation performed."""
+from __future__ import annotations
+
+import math
+import re
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Columns extracted from the table of timesteps, in order, with the headings they can be written under
+TIMESTEP_COLUMNS: dict[str, tuple[str, ...]] = {
+    'time': ('TIME',),
+    'timestep_size': ('DT', 'DELT', 'TSTEP', 'TSSIZE'),
+    'newton_iterations': ('NWT', 'NEWT', 'NEWTON'),
+    'cuts': ('CUTS', 'CUT'),
+    'cpu_time': ('CPU', 'CPUTIME', 'CPU_TIME'),
+}
+
+_CASE_NAME_PATTERN = re.compile(r'Case Name\s*=\s*(\S+)')
+_TIME_HEADING_PATTERN = re.compile(r'(?:^|\s)TIME(?:\s|$)', re.IGNORECASE)
+_TABLE_ROW_PATTERN = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?:\s|$)')
+
+TimestepRow = tuple[float, float, float, float, float]
+
+
+def _to_float(values: list[str], location: Optional[int]) -> float:
+    if location is None or location >= len(values):
+        return math.nan
+    try:
+        return float(values[location])
+    except ValueError:
+        return math.nan
+
+
+def iter_timesteps(log_file_lines: Iterable[str], case_name: Optional[str] = None) -> Iterator[TimestepRow]:
+    """Yields a row for each timestep in the tables of timesteps written to a Nexus log file.
+
+    Lines are read one at a time, so the log file doesn't need to be loaded into memory. Where the table has no timestep
+    size column the timestep size is the difference between the time of the timestep and the one before it.
+
+    Args:
+        log_file_lines (Iterable[str]): the lines of the log file, e.g. an open file.
+        case_name (Optional[str]): only read the tables for the case with this name. Defaults to reading the tables \
+            for all cases.
+
+    Returns:
+        Iterator[TimestepRow]: time, timestep size, number of Newton iterations, number of timestep cuts and cpu time \
+            for each timestep, in the order of TIMESTEP_COLUMNS. Values not in the table are nan.
+    """
+    read_in_times = False
+    column_locations: Optional[list[Optional[int]]] = None
+    previous_time = math.nan
+    for line in log_file_lines:
+        case_name_match = _CASE_NAME_PATTERN.search(line)
+        if case_name_match is not None:
+            read_in_times = case_name is None or case_name_match.group(1) == case_name
+            column_locations = None
+            previous_time = math.nan
+            continue
+        if not read_in_times:
+            continue
+        if _TIME_HEADING_PATTERN.search(line):
+            headings = line.upper().split()
+            column_locations = [next((headings.index(x) for x in aliases if x in headings), None)
+                                for aliases in TIMESTEP_COLUMNS.values()]
+            continue
+        if column_locations is None or not _TABLE_ROW_PATTERN.match(line):
+            continue
+        values = line.split()
+        time, timestep_size, newton_iterations, cuts, cpu_time = (_to_float(values, x) for x in column_locations)
+        if math.isnan(time):
+            continue
+        if column_locations[1] is None:
+            timestep_size = time - previous_time
+        previous_time = time
+        yield time, timestep_size, newton_iterations, cuts, cpu_time
+
+
+def read_timestep_array(log_file_path: str, case_name: Optional[str] = None) -> np.ndarray:
+    """Reads the tables of timesteps from a Nexus log file into a NumPy structured array.
+
+    Args:
+        log_file_path (str): path to the log file.
+        case_name (Optional[str]): only read the tables for the case with this name. Defaults to all cases.
+
+    Returns:
+        np.ndarray: structured array of float64 fields named as in TIMESTEP_COLUMNS, with one entry per timestep.
+    """
+    import numpy as np
+
+    dtype = np.dtype([(x, np.float64) for x in TIMESTEP_COLUMNS])
+    with open(log_file_path, 'r', errors='replace') as f:
+        return np.fromiter(iter_timesteps(f, case_name), dtype=dtype)
+
+
+def read_timestep_table(log_file_path: str, case_name: Optional[str] = None) -> pd.DataFrame:
+    """Reads the tables of timesteps from a Nexus log file into a DataFrame.
+
+    Args:
+        log_file_path (str): path to the log file.
+        case_name (Optional[str]): only read the tables for the case with this name. Defaults to all cases.
+
+    Returns:
+        pd.DataFrame: one row per timestep, with a float column for each of TIMESTEP_COLUMNS.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(read_timestep_array(log_file_path, case_name))
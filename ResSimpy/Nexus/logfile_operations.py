@@ -4,8 +4,11 @@ import os
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.log_file_reader import LogFileContent, LogFileReader
+from ResSimpy.Nexus.log_timestep_parser import read_timestep_table
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
 
@@ -20,12 +23,15 @@ class Logging:
                 to calculation engine
             __simulation_end_time (Optional[str]): Execution end time of the last time the simulation was run
             __previous_run_time (Optional[str]): Difference between simulation execution start time and end time.
+            __simulation_finished (bool): Whether the simulation had finished when the status was last checked.
         """
         self.__model = model
         self.__job_id: int = -1
         self.__simulation_start_time: Optional[str] = None
         self.__simulation_end_time: Optional[str] = None
         self.__previous_run_time: Optional[str] = None
+        self.__simulation_finished: bool = False
+        self.__log_file_reader: LogFileReader = LogFileReader()
 
     @staticmethod
     def get_simulation_time(line: str) -> str:
@@ -141,6 +147,10 @@ class Logging:
         """Get the job Id of a simulation run."""
         return self.__job_id
 
+    def is_simulation_finished(self) -> bool:
+        """Whether the latest simulation run had finished when its status was last checked."""
+        return self.__simulation_finished
+
     def __get_log_path(self, from_startup: bool = False) -> Optional[str]:
         """Returns the path of the log file for the simulation.
 
@@ -170,20 +180,17 @@ class Logging:
         else:
             return None
 
-    def __update_simulation_start_and_end_times(self, log_file_line_list: list[str]) -> None:
+    def __update_simulation_start_and_end_times(self, log_file_content: LogFileContent) -> None:
         """Updates the stored simulation execution start and end times from the log files.
 
         Args:
-            log_file_line_list (list[str]): log file information represented with a new entry per line of the file.
+            log_file_content (LogFileContent): details of the simulation run read from the log file.
         """
-        for line in log_file_line_list:
-            if nfo.check_token('start generic pdsh   prolog', line):
-                value = self.get_simulation_time(line)
-                self.__simulation_start_time = value
+        if log_file_content.start_time_line is not None:
+            self.__simulation_start_time = self.get_simulation_time(log_file_content.start_time_line)
 
-            if nfo.check_token('end generic pdsh   epilog', line):
-                value = self.get_simulation_time(line)
-                self.__simulation_end_time = value
+        if log_file_content.end_time_line is not None:
+            self.__simulation_end_time = self.get_simulation_time(log_file_content.end_time_line)
 
     def get_simulation_status(self, from_startup: bool = False) -> Optional[str]:
         """Gets the run status of the latest simulation run.
@@ -207,19 +214,18 @@ class Logging:
             raise NotImplementedError(
                 "Only retrieving status from a log file is supported at the moment")
         else:
-            log_file_line_list = nfo.load_file_as_list(log_file)
-            self.__update_simulation_start_and_end_times(log_file_line_list)
-            job_finished = 'Nexus finished\n' in log_file_line_list
-            if job_finished:
+            log_file_content = self.__log_file_reader.read_status(log_file, self.__model.root_name)
+            self.__update_simulation_start_and_end_times(log_file_content)
+            self.__simulation_finished = log_file_content.finished
+            if log_file_content.finished:
                 self.__previous_run_time = self.__get_start_end_difference() if from_startup \
                     else self.__previous_run_time
-                return self.get_errors_warnings_string(log_file_line_list=log_file_line_list)
-            else:
-                job_number_line = [
-                    x for x in log_file_line_list if 'Job number:' in x]
-                if len(job_number_line) > 0:
-                    self.__job_id = int(job_number_line[0].split(":")[1])
-                    return f"Job Running, ID: {self.__job_id}"
+                errors_warnings_lines = [] if log_file_content.errors_warnings_line is None else \
+                    [log_file_content.errors_warnings_line]
+                return self.get_errors_warnings_string(log_file_line_list=errors_warnings_lines)
+            elif log_file_content.job_number_line is not None:
+                self.__job_id = int(log_file_content.job_number_line.split(":")[1])
+                return f"Job Running, ID: {self.__job_id}"
         return None
 
     def __get_start_end_difference(self) -> Optional[str]:
@@ -264,44 +270,8 @@ class Logging:
         log_file_path = self.__get_log_path()
         if log_file_path is None:
             raise NotImplementedError("Only retrieving status from a log file is supported at the moment")
-        log_file = nfo.load_file_as_list(log_file_path)
-
-        read_in_times = False
-        time_heading_location = None
-        last_time = None
-        for line in log_file:
-            case_name_string = f"Case Name = {self.__model.root_name}"
-            if case_name_string in line:
-                read_in_times = True
-                continue
-            if read_in_times and nfo.check_token('TIME', line):
-                heading_location = 0
-                line_string = line
-                while len(line_string) > 0:
-                    next_value = nfo.get_next_value(0, [line_string], line_string)
-                    if next_value is None:
-                        break
-
-                    line_string = line_string.replace(next_value, '', 1)
-                    if next_value == 'TIME':
-                        time_heading_location = heading_location
-                    heading_location += 1
-
-            if read_in_times and time_heading_location is not None:
-                line_string = line
-                next_value = nfo.get_next_value(0, [line_string], line_string)
-                if next_value is not None and next_value.replace('.', '', 1).isdigit():
-                    if time_heading_location == 0 and (last_time is None or float(next_value) > float(last_time)):
-                        last_time = next_value
-                    for x in range(time_heading_location):
-                        line_string = line_string.replace(next_value, '', 1)
-                        next_value = nfo.get_next_value(0, [line_string], line_string)
-                        if next_value is None:
-                            break
-                        # When we reach the time column, read in the time value.
-                        if x == (time_heading_location - 1) and \
-                                (last_time is None or float(next_value) > float(last_time)):
-                            last_time = next_value
+        # only the lines added to the log since it was last read are scanned
+        last_time = self.__log_file_reader.read(log_file_path, self.__model.root_name).last_time
 
         if last_time is not None:
             days_completed = self.__model._sim_controls.convert_date_to_number(last_time)
@@ -311,3 +281,18 @@ class Logging:
             return round((days_completed / total_days) * 100, 1)
 
         return 0
+
+    def get_timestep_table(self) -> pd.DataFrame:
+        """Returns the time, timestep size, Newton iterations, timestep cuts and cpu time of each timestep of the \
+        simulation from the log file.
+
+        Raises:
+            NotImplementedError: Only retrieving timesteps from a log file is supported at the moment
+
+        Returns:
+            pd.DataFrame: one row per timestep for the case, with the columns in log_timestep_parser.TIMESTEP_COLUMNS.
+        """
+        log_file_path = self.__get_log_path()
+        if log_file_path is None:
+            raise NotImplementedError("Only retrieving timesteps from a log file is supported at the moment")
+        return read_timestep_table(log_file_path, case_name=self.__model.root_name)
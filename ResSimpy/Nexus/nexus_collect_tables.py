@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from ResSimpy.File import File
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.Network.NexusConstraint import NexusConstraint
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Nexus.nexus_constraint_operations import load_inline_constraints
-from ResSimpy.Nexus.nexus_file_operations import check_property_in_line, check_token, get_expected_token_value, \
-    check_list_tokens, load_table_to_objects
+from ResSimpy.Nexus.nexus_file_operations import check_property_in_line, check_token, get_expected_token_value_at, \
+    load_table_to_objects
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher
+from ResSimpy.Nexus.streamed_lines import StreamedLines
 
 
 def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str, Any], start_date: Optional[str],
@@ -36,26 +39,35 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
     nexus_object_results: dict[str, list[Any] | dict[str, list[NexusConstraint]]] = {x: [] for x in table_object_map}
     nexus_constraints: dict[str, list[NexusConstraint]] = {}
     nexus_object_results['CONSTRAINTS'] = nexus_constraints
-    file_as_list: list[str] = nexus_file.get_flat_list_str_file
+    # Read the file in a single pass, only keeping the lines from the start of the current table onwards
+    streamed_lines: Optional[StreamedLines] = None
+    file_as_list: Sequence[str]
+    if isinstance(nexus_file, NexusFile):
+        file_as_list = streamed_lines = StreamedLines(nexus_file.iterate_flat_lines())
+    else:
+        file_as_list = nexus_file.get_flat_list_str_file
     table_start: int = -1
     table_end: int = -1
     property_dict: dict = {}
     token_found: Optional[str] = None
     network_names: list[str] = []
+    table_keywords = KeywordMatcher(table_object_map.keys())
     for index, line in enumerate(file_as_list):
+        if streamed_lines is not None:
+            streamed_lines.release_before(index if table_start < 0 else table_start)
         # check for changes in unit system
-        check_property_in_line(line, property_dict, file_as_list)
+        check_property_in_line(line, property_dict, file_as_list, line_index=index)
         unit_system = property_dict.get('UNIT_SYSTEM', default_units)
         if not isinstance(unit_system, UnitSystem):
             raise TypeError(f"Value found for {unit_system=} of type {type(unit_system)} \
                                 not compatible, expected type UnitSystem Enum")
         if check_token('TIME', line):
-            current_date = get_expected_token_value(
-                token='TIME', token_line=line, file_list=file_as_list,
+            current_date = get_expected_token_value_at(
+                token='TIME', line_index=index, file_list=file_as_list,
                 custom_message=f"Cannot find the date associated with the TIME card in {line=} at line number {index}")
             continue
         if table_start < 0:
-            token_found = check_list_tokens(list(table_object_map.keys()), line)
+            token_found = table_keywords.find_first(line)
             if token_found is None or check_token('WELLCONTROL', line):
                 continue
             # if a token is found get the starting index of the table
@@ -77,8 +89,9 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
                 continue
             list_objects = None
             property_map = table_object_map[token_found].get_keyword_mapping()
+            table_lines = list(file_as_list[table_start:table_end])
             if token_found == 'CONSTRAINTS':
-                load_inline_constraints(file_as_list=file_as_list[table_start:table_end],
+                load_inline_constraints(file_as_list=table_lines,
                                         constraint=table_object_map[token_found],
                                         current_date=current_date,
                                         unit_system=unit_system,
@@ -90,7 +103,7 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
                                         )
 
             elif token_found == 'QMULT' or token_found == 'CONSTRAINT':
-                list_objects = load_table_to_objects(file_as_list=file_as_list[table_start:table_end],
+                list_objects = load_table_to_objects(file_as_list=table_lines,
                                                      row_object=table_object_map[token_found],
                                                      property_map=property_map,
                                                      current_date=current_date,
@@ -99,7 +112,7 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
                                                      preserve_previous_object_attributes=True)
 
             else:
-                list_objects = load_table_to_objects(file_as_list=file_as_list[table_start:table_end],
+                list_objects = load_table_to_objects(file_as_list=table_lines,
                                                      row_object=table_object_map[token_found],
                                                      property_map=property_map,
                                                      current_date=current_date,
@@ -4,7 +4,8 @@ from typing import Optional, TYPE_CHECKING
 
 from ResSimpy.Nexus.DataModels.Network.NexusConstraint import NexusConstraint
 from ResSimpy.Enums.UnitsEnum import UnitSystem
-from ResSimpy.Nexus.nexus_file_operations import get_next_value, correct_datatypes
+from ResSimpy.Nexus.nexus_file_operations import correct_datatypes
+from ResSimpy.Nexus.nexus_lexer import line_values
 from ResSimpy.Utils.invert_nexus_map import nexus_keyword_to_attribute_name
 import fnmatch
 if TYPE_CHECKING:
@@ -38,7 +39,8 @@ def load_inline_constraints(file_as_list: list[str], constraint: type[NexusConst
     for index, line in enumerate(file_as_list):
         properties_dict: dict[str, str | float | UnitSystem | None] = {'date': current_date, 'unit_system': unit_system}
         # first value in the line has to be the node/wellname
-        name = get_next_value(0, [line])
+        values = iter(line_values(line))
+        name = next(values, None)
         nones_overwrite = False
         constraint_names_to_add: list[str] = []
         if name is None:
@@ -53,8 +55,7 @@ def load_inline_constraints(file_as_list: list[str], constraint: type[NexusConst
         else:
             constraint_names_to_add.append(name)
 
-        trimmed_line = line.replace(name, "", 1)
-        next_value = get_next_value(0, [trimmed_line])
+        next_value = next(values, None)
         # loop through the line for each set of constraints
         while next_value is not None:
             token_value = next_value.upper()
@@ -65,16 +66,14 @@ def load_inline_constraints(file_as_list: list[str], constraint: type[NexusConst
                 break
             elif token_value == 'ACTIVATE' or token_value == 'DEACTIVATE':
                 properties_dict.update({'active_node': token_value == 'ACTIVATE'})
-                trimmed_line = trimmed_line.replace(next_value, "", 1)
-                next_value = get_next_value(0, [trimmed_line])
+                next_value = next(values, None)
                 if next_value is None:
                     break
                 token_value = next_value.upper()
 
-            trimmed_line = trimmed_line.replace(next_value, "", 1)
             # extract the attribute name for the given nexus constraint token
             attribute = property_map[token_value][0]
-            next_value = get_next_value(0, [trimmed_line])
+            next_value = next(values, None)
             if next_value is None:
                 raise ValueError(f'No value found after {token_value} in {line}')
             elif next_value == 'MULT':
@@ -86,8 +85,7 @@ def load_inline_constraints(file_as_list: list[str], constraint: type[NexusConst
 
             else:
                 properties_dict[attribute] = correct_datatypes(next_value, float)
-            trimmed_line = trimmed_line.replace(next_value, "", 1)
-            next_value = get_next_value(0, [trimmed_line])
+            next_value = next(values, None)
 
         # first check if there are any existing constraints created for the well this timestep
         for name_of_node in constraint_names_to_add:
@@ -3,19 +3,25 @@ from __future__ import annotations
 from enum import Enum
 from functools import partial
 from io import StringIO
-from typing import Optional, Union, Any
+from typing import TYPE_CHECKING, Optional, Sequence, Union, Any
 
-import pandas as pd
 from ResSimpy.Grid import VariableEntry
 from string import Template
 import re
 import os
 
 from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+from ResSimpy.Nexus.nexus_lexer import iter_line_tokens, keyword_matcher, line_values, KeywordMatcher
 from ResSimpy.Enums.UnitsEnum import UnitSystem, TemperatureUnits, SUnits
 from ResSimpy.Nexus.NexusKeywords.structured_grid_keywords import GRID_ARRAY_KEYWORDS
 from ResSimpy.Nexus.NexusKeywords.nexus_keywords import VALID_NEXUS_KEYWORDS
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+COMMON_INPUT_KEYWORDS = KeywordMatcher(['DESC', 'LABEL', 'DATEFORMAT', 'ENGLISH', 'METRIC', 'METKG/CM2', 'METBAR',
+                                        'LAB', 'SUNITS', 'KELVIN', 'RANKINE', 'FAHR', 'CELSIUS'])
+
 
 def nexus_token_found(line_to_check: str, valid_list: list[str] = VALID_NEXUS_KEYWORDS) -> bool:
     """Checks if a valid Nexus token has been found  in the supplied line.
@@ -112,35 +118,69 @@ def get_previous_value(file_as_list: list[str], search_before: Optional[str] = N
         search_before_location = file_as_list[0].upper().rfind(search_before)
         file_as_list[0] = file_as_list[0][0: search_before_location]
 
-    previous_value: str = ''
-
     for line in file_as_list:
-        string_to_search: str = line
-
         # Retrieve all of the values in the line, then return the last one found if one is found.
         # Otherwise search the next line
-        next_value = get_next_value(0, [string_to_search], ignore_values=ignore_values)
+        previous_value: Optional[str] = None
+        for token in iter_line_tokens(line):
+            if token.value == search_before:
+                break
+            if ignore_values is not None and token.value in ignore_values:
+                continue
+            previous_value = token.value
+
+        if previous_value is not None:
+            return previous_value
+
+    # Start of file reached, no values found
+    return None
+
 
-        while next_value is not None and search_before != next_value:
-            previous_value = next_value
-            string_to_search = string_to_search.replace(next_value, '')
-            next_value = get_next_value(0, [string_to_search], ignore_values=ignore_values)
+def get_previous_value_at(line_index: int, file_as_list: list[str], search_before: Optional[str] = None,
+                          ignore_values: Optional[list[str]] = None) -> Optional[str]:
+    """Gets the previous non blank value in a list of lines, starting from the line at line_index and working \
+    backwards. Unlike get_previous_value this doesn't copy or modify the list of lines.
 
-        if previous_value != '':
+    Args:
+        line_index (int): index of the line in file_as_list to start searching from.
+        file_as_list (list[str]): a list of strings containing each line of the file as a new entry.
+        search_before (Optional[str]): The string to start the search from in a backwards direction
+        ignore_values (Optional[list[str]], optional): a list of values that should be ignored if found. \
+                    Defaults to None.
+
+    Returns:
+        Optional[str]: Previous non blank value from the list, if none found returns None
+    """
+    for index in range(line_index, -1, -1):
+        line = file_as_list[index]
+        # If we are searching before a specific token, remove that and the rest of the line.
+        if index == line_index and search_before is not None:
+            line = line[0: line.upper().rfind(search_before)]
+
+        previous_value: Optional[str] = None
+        for token in iter_line_tokens(line):
+            if token.value == search_before:
+                break
+            if ignore_values is not None and token.value in ignore_values:
+                continue
+            previous_value = token.value
+
+        if previous_value is not None:
             return previous_value
 
     # Start of file reached, no values found
     return None
 
 
-def get_next_value(start_line_index: int, file_as_list: list[str], search_string: Optional[str] = None,
+def get_next_value(start_line_index: int, file_as_list: Sequence[str], search_string: Optional[str] = None,
                    ignore_values: Optional[list[str]] = None,
                    replace_with: Union[str, VariableEntry, None] = None) -> Optional[str]:
     """Gets the next non blank value in a list of lines.
 
     Args:
         start_line_index (int): line number to start reading file_as_list from
-        file_as_list (list[str]): a list of strings containing each line of the file as a new entry
+        file_as_list (Sequence[str]): a list of strings containing each line of the file as a new entry. Only read \
+            as far as needed to find the value, so can be lines streamed from the file such as StreamedLines.
         search_string (str): string to search from within the first indexed line
         ignore_values (Optional[list[str]], optional): a list of values that should be ignored if found. \
             Defaults to None.
@@ -150,96 +190,72 @@ def get_next_value(start_line_index: int, file_as_list: list[str], search_string
     Returns:
         Optional[str]: Next non blank value from the list, if none found returns None
     """
-    invalid_characters = ["\n", "\t", " ", "!", ","]
-    value_found = False
-    value = ''
     if search_string is None:
         search_string = file_as_list[start_line_index]
     line_index = start_line_index
-    while value_found is False and line_index <= len(file_as_list):
-        character_location = 0
-        new_search_string = False
-        line_already_skipped = False
+    while True:
         if len(search_string) > 2 and search_string.startswith("\"") and search_string.endswith("\""):
-            value += search_string[1:len(search_string)-1]
-            value_found = True
-        else:
-            for character in search_string:
-                # move lines once we hit a comment character or new line character,or are at the end of search string
-                if character == "!" or character == "\n" or (character_location == 0 and character == "C" and
-                                                             (len(search_string) == 1 or search_string[
-                                                              character_location + 1] == ' ')):
-                    line_index += 1
-                    line_already_skipped = True
-                    # If we've reached the end of the file, return None
-                    if line_index >= len(file_as_list):
-                        return None
-                    # Move to the next line down in file_as_list
-                    temp_search_string = file_as_list[line_index]
-                    if not isinstance(temp_search_string, str):
-                        raise ValueError(f'No valid value found, hit INCLUDE statement instead on line number \
-                            {line_index}')
-                    search_string = temp_search_string
-                    break
-                elif character not in invalid_characters:
-                    value_string = search_string[character_location: len(search_string)]
-                    for value_character in value_string:
-                        # If we've formed a string we're supposed to ignore, ignore it and get the next value
-                        if ignore_values is not None and value in ignore_values:
-                            search_string = search_string[character_location: len(search_string)]
-                            new_search_string = True
-                            value = ""
-
-                        if value_character not in invalid_characters:
-                            value += value_character
-
-                        character_location += 1
-
-                        # stop adding to the value once we hit an invalid_character
-                        if value_character in invalid_characters and value != '':
-                            break
-
-                    if value != "":
-                        value_found = True
-                        # Replace the original value with the new requested value
-                        if replace_with is not None:
-                            original_line = file_as_list[line_index]
-                            if not isinstance(original_line, str):
-                                raise ValueError(f'No valid value found, hit INCLUDE statement instead on line number \
-                                                {line_index}')
-                            new_line = original_line
-
-                            if isinstance(replace_with, str):
-                                new_value = replace_with
-                            elif isinstance(replace_with, VariableEntry):
-                                new_value = replace_with.value if replace_with.value is not None else ''
-                                if replace_with.modifier != 'VALUE':
-                                    new_line = new_line.replace('INCLUDE ', '')
-                                elif 'INCLUDE' not in original_line:
-                                    new_value = 'INCLUDE '+replace_with.value if replace_with.value is not None else ''
-                                # If we are replacing the first value from a mult, remove the space as well
-                                if replace_with.modifier == 'MULT' and replace_with.value == '':
-                                    value += ' '
-                            if new_value is None:
-                                raise ValueError(f'Value for replacing has returned a null value,\
-                                check replace_with input, {replace_with=}')
-                            new_line = new_line.replace(value, new_value, 1)
-                            file_as_list[line_index] = new_line
-
-                        break
-
-                if new_search_string is True:
-                    break
-
-                character_location += 1
-        if not line_already_skipped:
-            line_index += 1
-        if line_index <= len(file_as_list) - 1:
+            return search_string[1:len(search_string) - 1]
+
+        for token in iter_line_tokens(search_string, line_index):
+            # If we've found a value we're supposed to ignore, ignore it and get the next value
+            if ignore_values is not None and token.value in ignore_values:
+                continue
+            value = token.value
+            # Replace the original value with the new requested value
+            if replace_with is not None:
+                if not isinstance(file_as_list, list):
+                    raise TypeError(f'Values can only be replaced in a list of lines, got {type(file_as_list)}')
+                value = __replace_value_in_line(file_as_list, line_index, value, replace_with)
+            return value
+
+        # move to the next line once we hit a comment character or the end of the search string
+        line_index += 1
+        # If we've reached the end of the file, return None
+        try:
             search_string = file_as_list[line_index]
+        except IndexError:
+            return None
+        if not isinstance(search_string, str):
+            raise ValueError(f'No valid value found, hit INCLUDE statement instead on line number \
+                {line_index}')
 
-    if not value_found:
-        return None
 
+def __replace_value_in_line(file_as_list: list[str], line_index: int, value: str,
+                            replace_with: Union[str, VariableEntry]) -> str:
+    """Replaces the first instance of a value in a line of the file with a new value.
+
+    Args:
+        file_as_list (list[str]): a list of strings containing each line of the file as a new entry
+        line_index (int): index of the line containing the value
+        value (str): the value to replace
+        replace_with (Union[str, VariableEntry]): a value to replace the existing value with.
+
+    Returns:
+        str: the value that was replaced in the line.
+    """
+    original_line = file_as_list[line_index]
+    if not isinstance(original_line, str):
+        raise ValueError(f'No valid value found, hit INCLUDE statement instead on line number \
+                        {line_index}')
+    new_line = original_line
+
+    if isinstance(replace_with, str):
+        new_value = replace_with
+    elif isinstance(replace_with, VariableEntry):
+        new_value = replace_with.value if replace_with.value is not None else ''
+        if replace_with.modifier != 'VALUE':
+            new_line = new_line.replace('INCLUDE ', '')
+        elif 'INCLUDE' not in original_line:
+            new_value = 'INCLUDE '+replace_with.value if replace_with.value is not None else ''
+        # If we are replacing the first value from a mult, remove the space as well
+        if replace_with.modifier == 'MULT' and replace_with.value == '':
+            value += ' '
+    if new_value is None:
+        raise ValueError(f'Value for replacing has returned a null value,\
+        check replace_with input, {replace_with=}')
+    new_line = new_line.replace(value, new_value, 1)
+    file_as_list[line_index] = new_line
     return value
 
 
@@ -278,6 +294,9 @@ def get_token_value(token: str, token_line: str, file_list: list[str],
                     replace_with: Union[str, VariableEntry, None] = None) -> Optional[str]:
     """Gets the value following a token if supplied with a line containing the token.
 
+    Looks up the index of the token_line in the file_list, which is a linear search. Where the index of the line is
+    already known use get_token_value_at instead.
+
     Arguments:
         token (str): the token being searched for.
         token_line (str): string value of the line that the token was found in.
@@ -290,7 +309,28 @@ def get_token_value(token: str, token_line: str, file_list: list[str],
     Returns:
         Optional[str]: The value following the supplied token, if it is present.
     """
+    line_index = file_list.index(token_line)
+    return get_token_value_at(token, line_index, file_list, ignore_values, replace_with)
 
+
+def get_token_value_at(token: str, line_index: int, file_list: Sequence[str],
+                       ignore_values: Optional[list[str]] = None,
+                       replace_with: Union[str, VariableEntry, None] = None) -> Optional[str]:
+    """Gets the value following a token found on the line at the given index in the file.
+
+    Arguments:
+        token (str): the token being searched for.
+        line_index (int): index of the line in file_list that the token was found in.
+        file_list (Sequence[str]): a list of strings containing each line of the file as a new entry
+        ignore_values (list[str], optional): a list of values that should be ignored if found. \
+            Defaults to None.
+        replace_with (Union[str, VariableEntry, None], optional):  a value to replace the existing value with. \
+            Defaults to None.
+
+    Returns:
+        Optional[str]: The value following the supplied token, if it is present.
+    """
+    token_line = file_list[line_index]
     token_upper = token.upper()
     token_line_upper = token_line.upper()
 
@@ -300,14 +340,14 @@ def get_token_value(token: str, token_line: str, file_list: list[str],
 
     search_start = token_line_upper.index(token_upper) + len(token) + 1
     search_string = token_line[search_start: len(token_line)]
-    line_index = file_list.index(token_line)
 
     # If we have reached the end of the line, go to the next line to start our search
     if len(search_string) < 1:
         line_index += 1
-        if line_index >= len(file_list):
+        try:
+            search_string = file_list[line_index]
+        except IndexError:
             return None
-        search_string = file_list[line_index]
     if not isinstance(search_string, str):
         raise ValueError
     value = get_next_value(line_index, file_list, search_string, ignore_values, replace_with)
@@ -336,9 +376,36 @@ def get_expected_token_value(token: str, token_line: str, file_list: list[str],
     Raises:
         ValueError if a value is not found
     """
-    value = get_token_value(token, token_line, file_list, ignore_values, replace_with)
+    line_index = file_list.index(token_line)
+    return get_expected_token_value_at(token, line_index, file_list, ignore_values, replace_with, custom_message)
+
+
+def get_expected_token_value_at(token: str, line_index: int, file_list: Sequence[str],
+                                ignore_values: Optional[list[str]] = None,
+                                replace_with: Union[str, VariableEntry, None] = None,
+                                custom_message: Optional[str] = None) -> str:
+    """Function that returns the result of get_token_value_at if a value is found, otherwise it raises a ValueError.
+
+    Args:
+        token (str): the token being searched for.
+        line_index (int): index of the line in file_list that the token was found in.
+        file_list (Sequence[str]): a list of strings containing each line of the file as a new entry
+        ignore_values (list[str], optional): a list of values that should be ignored if found. \
+            Defaults to None.
+        replace_with (Union[str, VariableEntry, None], optional):  a value to replace the existing value with. \
+            Defaults to None.
+        custom_message Optional[str]: A custom error message if no value is found.
+
+    Returns:
+        str:  The value following the supplied token, if it is present.
+
+    Raises:
+        ValueError if a value is not found
+    """
+    value = get_token_value_at(token, line_index, file_list, ignore_values, replace_with)
 
     if value is None:
+        token_line = file_list[line_index]
         if custom_message is None:
             raise ValueError(f"No value found in the line after the expected token ({token}), line: {token_line}")
         else:
@@ -500,6 +567,7 @@ def read_table_to_df(file_as_list: list[str], keep_comments: bool = False, nohea
     Returns:
         pd.DataFrame: Created Pandas DataFrame representation of table to be read
     """
+    import pandas as pd
     df = pd.DataFrame()
     header: Union[str, None] = 'infer'
     if noheader:
@@ -588,75 +656,81 @@ def check_for_and_populate_common_input_data(
     Returns:
         dict: Dictionary including found common input data
     """
-    for line in file_as_list:
+    for index, line in enumerate(file_as_list):
         # Check for description
-        check_property_in_line(line, property_dict, file_as_list)
+        check_property_in_line(line, property_dict, file_as_list, line_index=index)
 
 
 def check_property_in_line(
         line: str,
         property_dict: dict[str, Union[str, int, float, Enum, list[str],
                                        pd.DataFrame, dict[str, Union[float, pd.DataFrame]]]],
-        file_as_list: list[str]) -> None:
+        file_as_list: Sequence[str], line_index: Optional[int] = None) -> None:
     """Given a line of Nexus input file content looking for common input data, e.g.,
     units such as ENGLISH or METRIC, temperature units such as FAHR or CELSIUS, DATEFORMAT, etc.,
     as defined in Nexus manual. If any found, include in provided property_dict and return.
 
     Args:
     line (str): line to search for the common input data
-    file_as_list (list[str]): Nexus input file content
+    file_as_list (Sequence[str]): Nexus input file content
     property_dict (dict): Dictionary in which to include common input data if found
+    line_index (Optional[int]): index of the line in file_as_list. If None the index is looked up from the line.
 
     Returns:
     dict: Dictionary including found common input data
     """
-    if check_token('DESC', line):
+    found_keywords = COMMON_INPUT_KEYWORDS.find_all(line)
+    if not found_keywords:
+        return
+    if line_index is None:
+        line_index = file_as_list.index(line)
+    if 'DESC' in found_keywords:
         if 'DESC' in property_dict.keys():
             if isinstance(property_dict['DESC'], list):
                 property_dict['DESC'].append(line.split('DESC')[1].strip())
         else:
             property_dict['DESC'] = [line.split('DESC')[1].strip()]
     # Check for label
-    if check_token('LABEL', line):
-        property_dict['LABEL'] = get_expected_token_value('LABEL', line, file_as_list,
-                                                          custom_message='Invalid file: LABEL value not provided')
+    if 'LABEL' in found_keywords:
+        property_dict['LABEL'] = get_expected_token_value_at('LABEL', line_index, file_as_list,
+                                                             custom_message='Invalid file: LABEL value not provided')
     # Check for dateformat
-    if check_token('DATEFORMAT', line):
-        date_format_value = get_expected_token_value('DATEFORMAT', line, file_as_list)
+    if 'DATEFORMAT' in found_keywords:
+        date_format_value = get_expected_token_value_at('DATEFORMAT', line_index, file_as_list)
         if date_format_value == 'MM/DD/YYYY':
             property_dict['DATEFORMAT'] = DateFormat.MM_DD_YYYY
         else:
             property_dict['DATEFORMAT'] = DateFormat.DD_MM_YYYY
     # Check unit system specification
-    if check_token('ENGLISH', line):
+    if 'ENGLISH' in found_keywords:
         property_dict['UNIT_SYSTEM'] = UnitSystem.ENGLISH
         property_dict['TEMP_UNIT'] = TemperatureUnits.FAHR
-    if check_token('METRIC', line):
+    if 'METRIC' in found_keywords:
         property_dict['UNIT_SYSTEM'] = UnitSystem.METRIC
         property_dict['TEMP_UNIT'] = TemperatureUnits.CELSIUS
-    if check_token('METKG/CM2', line):
+    if 'METKG/CM2' in found_keywords:
         property_dict['UNIT_SYSTEM'] = UnitSystem.METKGCM2
-    if check_token('METBAR', line):
+    if 'METBAR' in found_keywords:
         property_dict['UNIT_SYSTEM'] = UnitSystem.METBAR
         property_dict['TEMP_UNIT'] = TemperatureUnits.CELSIUS
-    if check_token('LAB', line):
+    if 'LAB' in found_keywords:
         property_dict['UNIT_SYSTEM'] = UnitSystem.LAB
         property_dict['TEMP_UNIT'] = TemperatureUnits.CELSIUS
     # Check to see if salinity unit is provided
-    if check_token('SUNITS', line):
-        s_units_value = get_expected_token_value('SUNITS', line, file_as_list)
+    if 'SUNITS' in found_keywords:
+        s_units_value = get_expected_token_value_at('SUNITS', line_index, file_as_list)
         if s_units_value == 'PPM':
             property_dict['SUNITS'] = SUnits.PPM
         else:
             property_dict['SUNITS'] = SUnits.MEQ_ML
     # Check to see if temperature units are provided
-    if check_token('KELVIN', line):
+    if 'KELVIN' in found_keywords:
         property_dict['TEMP_UNIT'] = TemperatureUnits.KELVIN
-    if check_token('RANKINE', line):
+    if 'RANKINE' in found_keywords:
         property_dict['TEMP_UNIT'] = TemperatureUnits.RANKINE
-    if check_token('FAHR', line):
+    if 'FAHR' in found_keywords:
         property_dict['TEMP_UNIT'] = TemperatureUnits.FAHR
-    if check_token('CELSIUS', line):
+    if 'CELSIUS' in found_keywords:
         property_dict['TEMP_UNIT'] = TemperatureUnits.CELSIUS
 
 
@@ -700,23 +774,12 @@ def get_table_header(file_as_list: list[str], header_values: dict[str, str]) ->
     """
     headers = []
     header_index = -1
+    header_keywords = KeywordMatcher(header_values)
     for index, line in enumerate(file_as_list):
-        for key in header_values:
-            if check_token(key, line):
-                header_line = line.upper()
-                header_index = index
-                # Map the headers
-                next_column_heading = get_next_value(start_line_index=0, file_as_list=[header_line])
-                trimmed_line = header_line
-
-                while next_column_heading is not None:
-                    headers.append(next_column_heading)
-                    trimmed_line = trimmed_line.replace(next_column_heading, "", 1)
-                    next_column_heading = get_next_value(0, [trimmed_line], trimmed_line)
-
-                if len(headers) > 0:
-                    break
-        if len(headers) > 0:
+        if header_keywords.found_in(line):
+            header_index = index
+            # Map the headers
+            headers.extend(line_values(line.upper()))
             break
     if header_index == -1:
         raise ValueError('No headers belonging to the header_values dictionary found within the provided file')
@@ -736,16 +799,9 @@ def table_line_reader(keyword_store: dict[str, None | int | float | str], header
     Returns:
         tuple[bool, dict[str, None | int | float | str]]: a dictionary with the found set of objects and lines
     """
-    trimmed_line = line
-    valid_line = True
-    for column in headers:
-        value = get_next_value(0, [trimmed_line], trimmed_line)
-        if value is None:
-            valid_line = False
-            break
-
-        keyword_store[column] = value
-        trimmed_line = trimmed_line.replace(value, "", 1)
+    values = line_values(line)
+    keyword_store.update(zip(headers, values))
+    valid_line = len(values) >= len(headers)
     return valid_line, keyword_store
 
 
@@ -824,18 +880,15 @@ def check_list_tokens(list_tokens: list[str], line: str) -> Optional[str]:
     """Checks a list of tokens for whether it exists in a string and returns the token that matched.
 
     Args:
-        list_tokens (list[str]): list of tokens to search for within the line
+        list_tokens (list[str]): list of tokens to search for within the line, in priority order
         line (str): line to search for tokens
 
     Returns:
-        Optional[str]: returns the token which was found otherwise returns None.
+        Optional[str]: returns the token which was found otherwise returns None. If more than one token is found \
+        the one earliest in list_tokens is returned.
 
     """
-    for x in list_tokens:
-        token_found = check_token(x, line)
-        if token_found:
-            return x
-    return None
+    return keyword_matcher(list_tokens).find_first(line)
 
 
 def correct_datatypes(value: None | float | str, dtype: type,
@@ -0,0 +1,196 @@
+"""Single pass lexer for Nexus input files.
+
+Splits lines of a Nexus file into the values they contain, recording where each value was found. The rules follow the
+way Nexus reads its input decks:
+
+- values are separated by spaces, tabs, new lines and commas.
+- an exclamation mark starts a comment which runs to the end of the line.
+- a line starting with a 'C' followed by a space (or a line containing only 'C') is a comment line.
+- text wrapped in double quotes is a single value, even if it contains separators or comment characters.
+- a trailing '>' continues the line onto the next line and is not a value in its own right.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+# Either the start of a comment (! or a new line) or a value. Quoted strings are only treated as a single value if
+# the closing quote is followed by a separator, otherwise the quote is part of an ordinary value.
+_TOKEN_PATTERN = re.compile(r'([!\n])|("[^"\n]*"(?=[ \t\n!,]|$)|[^ \t\n!,]+)')
+CONTINUATION_CHARACTER = '>'
+
+
+class NexusToken(NamedTuple):
+    """A single value found in a Nexus input file.
+
+    Attributes:
+        value (str): the text of the value, including any quotation marks.
+        line_index (int): index of the line in the file the value was found in.
+        start (int): column in the line where the value starts.
+        end (int): column in the line immediately after the end of the value.
+    """
+    value: str
+    line_index: int
+    start: int
+    end: int
+
+
+def is_comment_line(line: str) -> bool:
+    """Returns True if the whole line is a 'C' style comment line."""
+    return line.startswith('C') and (len(line) == 1 or line[1] == ' ')
+
+
+def iter_line_tokens(line: str, line_index: int = 0) -> Iterator[NexusToken]:
+    """Lazily yields the tokens found in a single line, stopping at the first comment.
+
+    Args:
+        line (str): the line to split into tokens.
+        line_index (int): index of the line in the file, stored on each of the tokens. Defaults to 0.
+
+    Yields:
+        NexusToken: each of the values in the line in the order they appear.
+    """
+    if is_comment_line(line):
+        return
+    held_continuation: Optional[NexusToken] = None
+    for match in _TOKEN_PATTERN.finditer(line):
+        if match.lastindex == 1:
+            break
+        if held_continuation is not None:
+            # the continuation character wasn't the last value on the line so treat it as an ordinary value
+            yield held_continuation
+            held_continuation = None
+        token = NexusToken(match.group(2), line_index, match.start(), match.end())
+        if token.value == CONTINUATION_CHARACTER:
+            held_continuation = token
+            continue
+        yield token
+
+
+def tokenize_line(line: str, line_index: int = 0) -> list[NexusToken]:
+    """Splits a single line into a list of tokens, ignoring anything in comments.
+
+    Args:
+        line (str): the line to split into tokens.
+        line_index (int): index of the line in the file, stored on each of the tokens. Defaults to 0.
+
+    Returns:
+        list[NexusToken]: the values in the line in the order they appear.
+    """
+    return list(iter_line_tokens(line, line_index))
+
+
+def line_values(line: str) -> list[str]:
+    """Returns just the values found in a line, ignoring anything in comments.
+
+    Args:
+        line (str): the line to split into values.
+
+    Returns:
+        list[str]: the values in the line in the order they appear.
+    """
+    return [token.value for token in iter_line_tokens(line)]
+
+
+def tokenize(file_as_list: Sequence[str], start_line_index: int = 0) -> Iterator[NexusToken]:
+    """Lazily yields every token in a file in a single pass, starting from the requested line.
+
+    Args:
+        file_as_list (Sequence[str]): a list of strings containing each line of the file as a new entry
+        start_line_index (int): line number to start reading file_as_list from. Defaults to 0.
+
+    Yields:
+        NexusToken: each of the values in the file in the order they appear.
+    """
+    for line_index in range(start_line_index, len(file_as_list)):
+        line = file_as_list[line_index]
+        if not isinstance(line, str):
+            raise ValueError(f'No valid value found, hit INCLUDE statement instead on line number {line_index}')
+        yield from iter_line_tokens(line, line_index)
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of keywords appear in a line using a single pass over the values in the line.
+
+    Keywords are matched against whole values case insensitively and anything in a comment is ignored, in the same
+    way as check_token. Build one matcher per set of keywords and reuse it across lines rather than calling
+    check_token once per keyword.
+
+    Attributes:
+        keywords (tuple[str, ...]): the keywords being searched for, in priority order.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """Initialises the KeywordMatcher class.
+
+        Args:
+            keywords (Iterable[str]): the keywords to search for. Where the same keyword appears more than once the
+                first occurrence is used.
+        """
+        self.keywords: tuple[str, ...] = tuple(keywords)
+        self.__lookup: dict[str, str] = {}
+        self.__priority: dict[str, int] = {}
+        for priority, keyword in enumerate(self.keywords):
+            upper_keyword = keyword.upper()
+            if upper_keyword not in self.__lookup:
+                self.__lookup[upper_keyword] = keyword
+                self.__priority[keyword] = priority
+        self.__upper_keywords = frozenset(self.__lookup)
+
+    def __repr__(self) -> str:
+        return f'KeywordMatcher({len(self.keywords)} keywords)'
+
+    def find_all(self, line: str) -> list[str]:
+        """Returns every keyword present in the line.
+
+        Args:
+            line (str): the line to search for keywords.
+
+        Returns:
+            list[str]: the keywords found, as written in the keyword list, in the order they appear in the line.
+                Each keyword is returned at most once.
+        """
+        found: list[str] = []
+        for token in iter_line_tokens(line):
+            upper_value = token.value.upper()
+            if upper_value in self.__upper_keywords:
+                keyword = self.__lookup[upper_value]
+                if keyword not in found:
+                    found.append(keyword)
+        return found
+
+    def find_first(self, line: str) -> Optional[str]:
+        """Returns the highest priority keyword present in the line.
+
+        Args:
+            line (str): the line to search for keywords.
+
+        Returns:
+            Optional[str]: the keyword found that is earliest in the keyword list, None if no keywords are found.
+        """
+        found = self.find_all(line)
+        if not found:
+            return None
+        return min(found, key=self.__priority.__getitem__)
+
+    def found_in(self, line: str) -> bool:
+        """Returns True if any of the keywords are present in the line."""
+        return any(token.value.upper() in self.__upper_keywords for token in iter_line_tokens(line))
+
+
+@lru_cache(maxsize=256)
+def __cached_keyword_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Returns a KeywordMatcher for the keywords, reusing a previously built matcher for the same keywords.
+
+    Args:
+        keywords (Iterable[str]): the keywords to search for, in priority order.
+
+    Returns:
+        KeywordMatcher: matcher for the supplied keywords.
+    """
+    return __cached_keyword_matcher(tuple(keywords))
@@ -0,0 +1,139 @@
+"""Stores the structure of loaded Nexus models on disk so that later loads can skip reading and parsing the files."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import warnings
+from typing import Any, Iterable, Optional
+
+from ResSimpy import __version__
+
+# Increase whenever the layout of the cache files or of the objects stored in them changes
+_CACHE_FORMAT_VERSION = 6
+
+# Size, last modified time in nanoseconds and sha256 hash of a file's content. All None if the file doesn't exist.
+_FileSignature = tuple[Optional[int], Optional[int], Optional[str]]
+
+
+class NexusParseCache:
+    """Persistent cache of parsed model structures, such as the FcsNexusFile and NexusFile trees, keyed by file path.
+
+    Each entry records the size, last modified time and content hash of every file that was read to build it. An entry
+    is only used if all of those files are unchanged. Where a file has been touched without changing its content the
+    content hash is compared, so the entry is still used. Any problem reading an entry is treated as a cache miss, so
+    the model is loaded from the files as normal.
+
+    Entries are stored with pickle, so the cache directory must only be writable by users that are trusted.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialises the NexusParseCache class.
+
+        Args:
+            cache_dir (str): directory to store the cache files in. Created if it doesn't exist.
+        """
+        self.cache_dir = cache_dir
+
+    def __entry_path(self, file_path: str) -> str:
+        key = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    @staticmethod
+    def __hash_file(file_path: str) -> str:
+        file_hash = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def __file_signature(file_path: str) -> _FileSignature:
+        try:
+            stat_obj = os.stat(file_path)
+            return stat_obj.st_size, stat_obj.st_mtime_ns, NexusParseCache.__hash_file(file_path)
+        except FileNotFoundError:
+            return None, None, None
+
+    @staticmethod
+    def __file_unchanged(file_path: str, signature: _FileSignature) -> bool:
+        size, modified_time, content_hash = signature
+        try:
+            stat_obj = os.stat(file_path)
+        except FileNotFoundError:
+            return size is None
+        if size is None or stat_obj.st_size != size:
+            return False
+        if stat_obj.st_mtime_ns == modified_time:
+            return True
+        return NexusParseCache.__hash_file(file_path) == content_hash
+
+    def __header(self, manifest: dict[str, _FileSignature]) -> dict[str, Any]:
+        return {'cache_format_version': _CACHE_FORMAT_VERSION, 'ressimpy_version': __version__, 'manifest': manifest}
+
+    def load(self, file_path: str) -> Optional[Any]:
+        """Returns the value stored for a file if none of the files used to create it have changed since.
+
+        Args:
+            file_path (str): path to the file the value was stored for, e.g. the fcs file of the model.
+
+        Returns:
+            Optional[Any]: the stored value, or None if there is no valid entry for the file.
+        """
+        entry_path = self.__entry_path(file_path)
+        if not os.path.isfile(entry_path):
+            return None
+        try:
+            with open(entry_path, 'rb') as f:
+                header = pickle.load(f)  # noqa: S301
+                if header.get('cache_format_version') != _CACHE_FORMAT_VERSION or \
+                        header.get('ressimpy_version') != __version__:
+                    return None
+                for source_file_path, signature in header['manifest'].items():
+                    if not self.__file_unchanged(source_file_path, signature):
+                        return None
+                return pickle.load(f)  # noqa: S301
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, KeyError,
+                TypeError, ValueError) as e:
+            # an entry written by a different version of the code or only partly written
+            warnings.warn(f'Ignoring unreadable parse cache entry {entry_path} for {file_path}: {e}')
+            return None
+
+    def store(self, file_path: str, value: Any, source_file_paths: Iterable[str]) -> None:
+        """Stores a value for a file along with the details of the files used to create it.
+
+        Args:
+            file_path (str): path to the file to store the value for, e.g. the fcs file of the model.
+            value (Any): value to store. Must be picklable.
+            source_file_paths (Iterable[str]): paths to all the files read to create the value, including any that \
+                could not be found.
+        """
+        manifest = {x: self.__file_signature(x) for x in source_file_paths}
+        entry_path = self.__entry_path(file_path)
+        temp_file_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+                temp_file_path = f.name
+                pickle.dump(self.__header(manifest), f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # replace the entry in one step so that other processes never read a partly written entry
+            os.replace(temp_file_path, entry_path)
+        except (OSError, pickle.PicklingError) as e:
+            warnings.warn(f'Unable to write parse cache entry for {file_path} to {self.cache_dir}: {e}')
+            if temp_file_path is not None and os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+
+    def remove(self, file_path: str) -> None:
+        """Removes the value stored for a file, if there is one.
+
+        Args:
+            file_path (str): path to the file the value was stored for, e.g. the fcs file of the model.
+        """
+        try:
+            os.remove(self.__entry_path(file_path))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            warnings.warn(f'Unable to remove parse cache entry for {file_path} from {self.cache_dir}: {e}')
@@ -48,10 +48,15 @@ class RemoveObjectOperations:
         remove_table = True
         # get all the indices for the tables:
         file_content = file.get_flat_list_str_file
-        start_node_keyword_index_to_remove = max([i for i, x in enumerate(file_content) if self.table_header in x and
-                                                  i < first_obj_index])
-        end_node_keyword_index_to_remove = min([i for i, x in enumerate(file_content) if self.table_footer in x and
-                                                i > last_obj_index])
+        # search outwards from the object for the nearest table header and footer rather than scanning the whole file
+        start_node_keyword_index_to_remove = next(
+            (i for i in range(min(first_obj_index, len(file_content)) - 1, -1, -1)
+             if self.table_header in file_content[i]), None)
+        end_node_keyword_index_to_remove = next(
+            (i for i in range(last_obj_index + 1, len(file_content)) if self.table_footer in file_content[i]), None)
+        if start_node_keyword_index_to_remove is None or end_node_keyword_index_to_remove is None:
+            raise ValueError(f'No {self.table_header} table found around the lines {first_obj_index} to '
+                             f'{last_obj_index} for the object with id: {obj_id}')
         # check there are any nodes left in the specified table
         if file.object_locations is None:
             raise ValueError(f'No object locations specified, cannot find id: {obj_id} in {file.object_locations}')
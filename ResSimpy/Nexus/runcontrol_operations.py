@@ -45,9 +45,9 @@ class SimControls:
                 empty list if no values found
         """
         times = []
-        for line in times_file:
+        for line_index, line in enumerate(times_file):
             if nfo.check_token('TIME', line):
-                value = nfo.get_token_value('TIME', line, times_file)
+                value = nfo.get_token_value_at('TIME', line_index, times_file)
                 if value is not None:
                     times.append(value)
 
@@ -256,9 +256,9 @@ class SimControls:
             raise ValueError(f"No file path provided for {self.__model.model_files.runcontrol_file.location=}")
 
         # set the start date
-        for line in run_control_file_content:
+        for line_index, line in enumerate(run_control_file_content):
             if nfo.check_token('START', line):
-                value = nfo.get_expected_token_value('START', line, run_control_file_content)
+                value = nfo.get_expected_token_value_at('START', line_index, run_control_file_content)
                 if value is not None:
                     self.__model.start_date = value
 
@@ -269,9 +269,9 @@ class SimControls:
             try:
                 self.__model.start_date = times[0]
             except IndexError:
-                for line in run_control_file_content:
+                for line_index, line in enumerate(run_control_file_content):
                     if nfo.check_token('TIME', line):
-                        value = nfo.get_expected_token_value('TIME', line, run_control_file_content)
+                        value = nfo.get_expected_token_value_at('TIME', line_index, run_control_file_content)
                         self.__model.start_date = value
                         warnings.warn(f'Setting start date to first time card found in the runcontrol file as: {value}')
                         break
@@ -0,0 +1,189 @@
+"""Monitors the log files of many running Nexus simulations at the same time."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, TYPE_CHECKING, Union
+
+from ResSimpy.Nexus.NexusEnums.SimulationEventEnum import SimulationEventType
+
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+
+@dataclass(frozen=True)
+class SimulationEvent:
+    """A change in the state of a monitored simulation.
+
+    Attributes:
+        model (NexusSimulator): the model that was run.
+        event_type (SimulationEventType): what has changed.
+        value (Union[str, int, float, bool]): the new value. The job ID for JOB_ID, the status string from \
+            get_simulation_status for STATUS, the percentage complete for PROGRESS, the errors and warnings string \
+            for ERRORS_WARNINGS, True for FINISHED and the error raised for CHECK_FAILED.
+    """
+    model: NexusSimulator
+    event_type: SimulationEventType
+    value: Union[str, int, float, bool]
+
+
+@dataclass(frozen=True)
+class _SimulationState:
+    """State of a simulation found from its log file."""
+    status: Optional[str] = None
+    job_id: Optional[int] = None
+    progress: Optional[float] = None
+    finished: bool = False
+
+
+class SimulationMonitor:
+    """Checks the log files of many running simulations at once, reporting each change as it is found.
+
+    The log files are read on a pool of threads so that waiting on the file system for one log doesn't hold up the
+    others. Each log is read incrementally, so a check only reads what has been written since the previous one. Logs
+    that haven't changed are checked less often, up to max_poll_interval between checks, and a simulation is no longer
+    checked once it has finished. If checking a log raises an error, such as the log being unreadable or malformed, a
+    CHECK_FAILED event is reported for that model and it is checked again later as if its log were unchanged, without
+    stopping the monitoring of the other models.
+
+    Example:
+        monitor = SimulationMonitor([model_1, model_2], poll_interval=10)
+        async for event in monitor.events():
+            print(event.model.root_name, event.event_type, event.value)
+    """
+
+    def __init__(self, models: Optional[Iterable[NexusSimulator]] = None, poll_interval: float = 5.0,
+                 max_poll_interval: float = 60.0, backoff_factor: float = 2.0,
+                 max_workers: Optional[int] = None) -> None:
+        """Initialises the SimulationMonitor class.
+
+        Args:
+            models (Optional[Iterable[NexusSimulator]]): models to monitor the latest runs of. More can be added with \
+                add_model.
+            poll_interval (float): seconds between checks of a log file that is changing.
+            max_poll_interval (float): longest time in seconds between checks of a log file that isn't changing.
+            backoff_factor (float): how much longer to wait before checking again each time a log file is found \
+                unchanged.
+            max_workers (Optional[int]): maximum number of log files to read at the same time. Defaults to the \
+                ThreadPoolExecutor default.
+
+        Raises:
+            ValueError: if the poll intervals or backoff factor are out of range.
+        """
+        if poll_interval < 0 or max_poll_interval < poll_interval:
+            raise ValueError(f'Poll interval must be between 0 and the max_poll_interval {max_poll_interval}, '
+                             f'instead got {poll_interval}')
+        if backoff_factor < 1:
+            raise ValueError(f'Backoff factor must be at least 1, instead got {backoff_factor}')
+        self.poll_interval: float = poll_interval
+        self.max_poll_interval: float = max_poll_interval
+        self.backoff_factor: float = backoff_factor
+        self.__max_workers: Optional[int] = max_workers
+        self.__models: list[NexusSimulator] = []
+        for model in [] if models is None else models:
+            self.add_model(model)
+
+    @property
+    def models(self) -> list[NexusSimulator]:
+        """Models being monitored."""
+        return list(self.__models)
+
+    def add_model(self, model: NexusSimulator) -> None:
+        """Adds a model to the models to monitor. Models added while events are being read are monitored the next \
+        time events are read.
+
+        Args:
+            model (NexusSimulator): model to monitor the latest run of.
+        """
+        if not any(x is model for x in self.__models):
+            self.__models.append(model)
+
+    @staticmethod
+    def __read_state(model: NexusSimulator) -> Optional[_SimulationState]:
+        """Reads the state of a simulation from its log file, returning None if there is no log file yet."""
+        try:
+            status = model.get_simulation_status()
+        except NotImplementedError:
+            # the simulation hasn't started writing its log file
+            return None
+        finished = model.logging.is_simulation_finished()
+        job_id = model.logging.get_job_id()
+        progress = None
+        if not finished:
+            try:
+                progress = model.get_simulation_progress()
+            except ValueError:
+                # the run control times aren't known so the progress can't be worked out
+                pass
+        return _SimulationState(status=status, job_id=None if job_id == -1 else job_id, progress=progress,
+                                finished=finished)
+
+    async def __poll(self, executor: ThreadPoolExecutor, model: NexusSimulator, delay: float) -> \
+            Optional[_SimulationState]:
+        await asyncio.sleep(delay)
+        return await asyncio.get_running_loop().run_in_executor(executor, self.__read_state, model)
+
+    @staticmethod
+    def __changes(model: NexusSimulator, previous_state: _SimulationState, state: _SimulationState) -> \
+            list[SimulationEvent]:
+        """Returns events for each of the differences between two states of a simulation."""
+        events = []
+        if state.job_id is not None and state.job_id != previous_state.job_id:
+            events.append(SimulationEvent(model, SimulationEventType.JOB_ID, state.job_id))
+        if state.status is not None and state.status != previous_state.status:
+            events.append(SimulationEvent(model, SimulationEventType.STATUS, state.status))
+        if state.progress is not None and state.progress != previous_state.progress:
+            events.append(SimulationEvent(model, SimulationEventType.PROGRESS, state.progress))
+        if state.finished:
+            if state.status is not None:
+                events.append(SimulationEvent(model, SimulationEventType.ERRORS_WARNINGS, state.status))
+            events.append(SimulationEvent(model, SimulationEventType.FINISHED, True))
+        return events
+
+    async def events(self) -> AsyncIterator[SimulationEvent]:
+        """Checks the log files of the models until all the simulations have finished, yielding each change found.
+
+        Yields:
+            SimulationEvent: the changes in the state of each simulation, in the order they are found.
+        """
+        previous_states: dict[int, _SimulationState] = {}
+        previous_errors: dict[int, str] = {}
+        poll_intervals: dict[int, float] = {}
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='ResSimpyMonitor') as executor:
+            polls = {asyncio.create_task(self.__poll(executor, model, 0.0)): model for model in self.__models}
+            try:
+                while polls:
+                    done, _ = await asyncio.wait(polls, return_when=asyncio.FIRST_COMPLETED)
+                    for poll in done:
+                        model = polls.pop(poll)
+                        state: Optional[_SimulationState] = None
+                        events: list[SimulationEvent] = []
+                        try:
+                            state = poll.result()
+                        except (OSError, ValueError, IndexError, KeyError, TypeError) as error:
+                            # one failed check mustn't stop the other models being monitored, so report it once
+                            # until the error changes and check the model again later
+                            message = f'{type(error).__name__}: {error}'
+                            if previous_errors.get(id(model)) != message:
+                                yield SimulationEvent(model, SimulationEventType.CHECK_FAILED, message)
+                            previous_errors[id(model)] = message
+                        else:
+                            previous_errors.pop(id(model), None)
+                        if state is not None:
+                            events = self.__changes(model, previous_states.get(id(model), _SimulationState()), state)
+                            previous_states[id(model)] = state
+                        for event in events:
+                            yield event
+                        if state is not None and state.finished:
+                            continue
+                        # check changing logs again soon, and wait longer each time a log is found unchanged or
+                        # can't be checked
+                        poll_interval = self.poll_interval if events else \
+                            min(poll_intervals.get(id(model), self.poll_interval) * self.backoff_factor,
+                                self.max_poll_interval)
+                        poll_intervals[id(model)] = poll_interval
+                        polls[asyncio.create_task(self.__poll(executor, model, poll_interval))] = model
+            finally:
+                for poll in polls:
+                    poll.cancel()
@@ -0,0 +1,81 @@
+"""Lines read one at a time from a stream that can still be looked up by their index, as in a list of lines."""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Sequence, overload
+
+
+class StreamedLines(Sequence[str]):
+    """Lines read from a stream, such as NexusFile.iterate_line, as they are needed.
+
+    Lines can be looked up by their index in the stream in the same way as in a list, so functions that look ahead for
+    a value on the following lines, such as get_expected_token_value_at, only read as far as they need to. Only the
+    lines from the earliest line still needed onwards are kept. Once the lines before an index are no longer needed
+    call release_before, after which looking them up raises an IndexError.
+
+    As the total number of lines isn't known until the stream has been read to the end, len returns the number of
+    lines read so far. Indexing past the last line read reads more of the stream, raising an IndexError only once the
+    end of the stream is reached.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        """Initialises the StreamedLines class.
+
+        Args:
+            lines (Iterable[str]): stream of lines to read from.
+        """
+        self.__lines_iterator: Iterator[str] = iter(lines)
+        self.__lines: list[str] = []
+        self.__start: int = 0
+
+    def __read_to(self, index: int) -> bool:
+        """Reads lines from the stream until the line at index has been read. Returns False if the stream ends first."""
+        while index >= self.__start + len(self.__lines):
+            try:
+                self.__lines.append(next(self.__lines_iterator))
+            except StopIteration:
+                return False
+        return True
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            if index.start is None or index.stop is None or index.step is not None:
+                raise ValueError(f'Only slices with a start and stop can be taken from streamed lines, got {index}')
+            if index.start < self.__start:
+                raise IndexError(f'Lines before {self.__start} have already been released, asked for {index}')
+            self.__read_to(index.stop - 1)
+            return self.__lines[index.start - self.__start:index.stop - self.__start]
+        if index < self.__start:
+            raise IndexError(f'Lines before {self.__start} have already been released, asked for line {index}')
+        if not self.__read_to(index):
+            raise IndexError(f'Line {index} is past the end of the stream')
+        return self.__lines[index - self.__start]
+
+    def __len__(self) -> int:
+        return self.__start + len(self.__lines)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the lines not yet released, reading the rest of the stream as it goes."""
+        index = self.__start
+        while self.__read_to(index):
+            yield self.__lines[index - self.__start]
+            index += 1
+
+    def release_before(self, index: int) -> None:
+        """Drops the lines before an index, as they are no longer needed.
+
+        Args:
+            index (int): index of the first line to keep. Lines that haven't been read yet are never dropped.
+        """
+        index = min(index, self.__start + len(self.__lines))
+        if index <= self.__start:
+            return
+        del self.__lines[:index - self.__start]
+        self.__start = index
@@ -14,7 +14,8 @@ class StructuredGridOperations:
     @staticmethod
     def load_token_value_if_present(token: str, modifier: str, token_property: VariableEntry,
                                     line: str, file_as_list: list[str],
-                                    ignore_values: Optional[list[str]] = None) -> None:
+                                    ignore_values: Optional[list[str]] = None,
+                                    line_index: Optional[int] = None) -> None:
         """Gets a token's value if there is one and loads it into the token_property.
 
         Args:
@@ -23,7 +24,10 @@ class StructuredGridOperations:
             modifier (str): any modifiers applied to the token e.g. 'MULT'
             token_property (VariableEntry): VariableEntry object to store the modifier and value pair into
             line (str): line to search for the token in
+            file_as_list (list[str]): a list of strings containing each line of the file as a new entry
             ignore_values (Optional[list[str]], optional): values to be ignored. Defaults to None.
+            line_index (Optional[int], optional): index of the line in file_as_list. Defaults to None which looks \
+                the index up from the line.
 
         Raises:
         ------
@@ -36,20 +40,25 @@ class StructuredGridOperations:
             ignore_values = []
         token_modifier = f"{token} {modifier}"
 
-        if nfo.check_token(token, line) and nfo.get_token_value(token, line, file_as_list) == modifier:
+        if not nfo.check_token(token, line):
+            return
+        if line_index is None:
+            line_index = file_as_list.index(line)
+        if nfo.get_token_value_at(token, line_index, file_as_list) == modifier:
             # If we are loading a multiple, load the two relevant values, otherwise just the next value
             if modifier == 'MULT':
-                numerical_value = nfo.get_expected_token_value(token_modifier, line, file_as_list, ignore_values=None)
+                numerical_value = nfo.get_expected_token_value_at(token_modifier, line_index, file_as_list,
+                                                                  ignore_values=None)
                 if numerical_value is None:
                     raise ValueError(
                         f'No numerical value found after {token_modifier} keyword in line: {line}')
-                value_to_multiply = nfo.get_token_value(token_modifier, line, file_as_list,
-                                                        ignore_values=[numerical_value])
+                value_to_multiply = nfo.get_token_value_at(token_modifier, line_index, file_as_list,
+                                                           ignore_values=[numerical_value])
                 if numerical_value is not None and value_to_multiply is not None:
                     token_property.modifier = 'MULT'
                     token_property.value = f"{numerical_value} {value_to_multiply}"
             else:
-                value = nfo.get_token_value(token_modifier, line, file_as_list, ignore_values=ignore_values)
+                value = nfo.get_token_value_at(token_modifier, line_index, file_as_list, ignore_values=ignore_values)
                 if value is None:
                     # Could be 'cut short' by us excluding the rest of a file
                     token_property.value = None
@@ -72,7 +81,7 @@ class StructuredGridOperations:
             None: modifies the file_as_list with the new property
         """
 
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
             old_token_modifier = f"{token_name} {old_property.modifier}"
             new_token_modifier = f"{token_name} {new_property.modifier}"
             ignore_values = ['INCLUDE'] if old_property.modifier == 'VALUE' else []
@@ -80,14 +89,14 @@ class StructuredGridOperations:
                 # If we are replacing a mult, replace the first value with a blank
                 if old_property.modifier == 'MULT':
                     dummy_value = VariableEntry('MULT', '')
-                    nfo.get_token_value(old_token_modifier, line, file_as_list, ignore_values=ignore_values,
-                                        replace_with=dummy_value)
+                    nfo.get_token_value_at(old_token_modifier, line_index, file_as_list, ignore_values=ignore_values,
+                                           replace_with=dummy_value)
 
-                nfo.get_token_value(old_token_modifier, line, file_as_list, ignore_values=ignore_values,
-                                    replace_with=new_property)
+                nfo.get_token_value_at(old_token_modifier, line_index, file_as_list, ignore_values=ignore_values,
+                                       replace_with=new_property)
 
-                new_line = line.replace(old_token_modifier, new_token_modifier, 1)
-                line_index = file_as_list.index(line)
+                # the value may have been replaced on the same line, so change the modifier in the updated line
+                new_line = file_as_list[line_index].replace(old_token_modifier, new_token_modifier, 1)
                 file_as_list[line_index] = new_line
 
     @staticmethod
@@ -178,12 +187,11 @@ class StructuredGridOperations:
                 Please provide a path to the structured grid")
         file_as_list = nfo.load_file_as_list(structured_grid_path)
 
-        for line in file_as_list:
+        for line_index, line in enumerate(file_as_list):
             if nfo.check_token(command_token, line):
-                start_index = file_as_list.index(line) - previous_lines \
-                    if file_as_list.index(line) - previous_lines > 0 else 0
-                end_index = file_as_list.index(line) + following_lines \
-                    if file_as_list.index(line) + following_lines < len(file_as_list) else len(file_as_list) - 1
+                start_index = line_index - previous_lines if line_index - previous_lines > 0 else 0
+                end_index = line_index + following_lines \
+                    if line_index + following_lines < len(file_as_list) else len(file_as_list) - 1
 
                 new_array = file_as_list[start_index: end_index]
                 new_array = [x.strip("'") for x in new_array]
@@ -3,11 +3,10 @@ from abc import ABC, abstractmethod
 from typing import Any, Sequence, Optional, TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
-
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.File import File
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.NexusNetwork import Network
 
 
@@ -3,9 +3,9 @@ from enum import Enum
 from typing import TYPE_CHECKING, Union
 from uuid import UUID
 
-import pandas as pd
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
     from ResSimpy.Nexus.DataModels.NexusWaterMethod import NexusWaterParams
 
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+
+class FenwickTree:
+    """Binary indexed tree holding a list of non-negative integers.
+
+    Supports changing a value and finding the sum of the first n values in O(log n), as well as finding how many
+    values are needed for their sum to reach a target.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """Initialises the FenwickTree class.
+
+        Args:
+            values (Iterable[int]): the initial values to store. Defaults to an empty tree.
+        """
+        self.__values: list[int] = list(values)
+        self.__tree: list[int] = [0, *self.__values]
+        size = len(self.__values)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self.__tree[parent] += self.__tree[i]
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __getitem__(self, index: int) -> int:
+        return self.__values[index]
+
+    def add(self, index: int, delta: int) -> None:
+        """Adds delta to the value stored at index.
+
+        Args:
+            index (int): position of the value to change.
+            delta (int): amount to add to the value.
+        """
+        self.__values[index] += delta
+        tree_index = index + 1
+        while tree_index < len(self.__tree):
+            self.__tree[tree_index] += delta
+            tree_index += tree_index & -tree_index
+
+    def prefix_sum(self, count: int) -> int:
+        """Returns the sum of the first count values.
+
+        Args:
+            count (int): number of values from the start of the tree to add up.
+        """
+        total = 0
+        tree_index = count
+        while tree_index > 0:
+            total += self.__tree[tree_index]
+            tree_index -= tree_index & -tree_index
+        return total
+
+    def lower_bound(self, target: int) -> int:
+        """Returns the smallest count for which prefix_sum(count) >= target, or len(self) if there isn't one.
+
+        Requires all the stored values to be non-negative.
+
+        Args:
+            target (int): the sum to search for.
+        """
+        if target <= 0:
+            return 0
+        position = 0
+        remaining = target
+        step = 1 << (len(self.__tree) - 1).bit_length()
+        while step > 0:
+            next_position = position + step
+            if next_position < len(self.__tree) and self.__tree[next_position] < remaining:
+                position = next_position
+                remaining -= self.__tree[next_position]
+            step >>= 1
+        return position + 1 if position < len(self.__values) else len(self.__values)
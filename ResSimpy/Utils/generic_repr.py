@@ -1,18 +1,20 @@
-from typing import Any
+from typing import Any, Iterable
 
 
-def generic_repr(input_class: Any) -> str:
+def generic_repr(input_class: Any, exclude_attributes: Iterable[str] = ()) -> str:
     """Creates a prettier object representation while removing attributes that are None from that
     representation.
 
     Args:
     ----
         input_class (Any): a class with attributes to summarise
+        exclude_attributes (Iterable[str]): names of attributes to leave out, such as cached values.
 
     Returns:
     -------
         (str): Pretty representation of the string.
     """
-    filtered_attrs = {k: v for k, v in vars(input_class).items() if v is not None}
+    excluded = set(exclude_attributes)
+    filtered_attrs = {k: v for k, v in vars(input_class).items() if v is not None and k not in excluded}
     attrs = ', '.join(f"{k}={v!r}" for k, v in filtered_attrs.items())
     return f"{input_class.__class__.__name__}({attrs})"
@@ -10,17 +10,17 @@ from ResSimpy.Enums.UnitsEnum import UnitSystem
 
 @dataclass
 class Well(ABC):
-    __completions: list[Completion]
+    __completions: Sequence[Completion]
     __well_name: str
     __units: UnitSystem
 
-    def __init__(self, well_name: str, completions: list[Completion], units: UnitSystem) -> None:
+    def __init__(self, well_name: str, completions: Sequence[Completion], units: UnitSystem) -> None:
         self.__well_name = well_name
         self.__completions = completions
         self.__units = units
 
     @property
-    def completions(self) -> list[Completion]:
+    def completions(self) -> Sequence[Completion]:
         return self.__completions
 
     @property
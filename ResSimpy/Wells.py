@@ -2,10 +2,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from abc import ABC
 
-import pandas as pd
-
 from ResSimpy.Well import Well
-from typing import Sequence, Optional
+from typing import TYPE_CHECKING, Sequence, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(kw_only=True)
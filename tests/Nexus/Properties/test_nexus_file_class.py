@@ -1,4 +1,5 @@
 import os
+import pickle
 import uuid
 import warnings
 
@@ -6,6 +7,9 @@ import pytest
 from pytest_mock import MockerFixture
 
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.DataModels.NexusObjectLocations import NexusObjectLocations
+from ResSimpy.Nexus.include_file_reader import IncludeFileReader
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
 from ResSimpy.Nexus.load_wells import load_wells
@@ -185,6 +189,110 @@ def test_generate_file_include_structure_origin_path(mocker, fixture_for_osstat_
     assert nexus_file == expected_nexus_file
 
 
+
+@pytest.mark.parametrize('max_workers', [None, 1, 4])
+def test_generate_file_include_structure_max_workers(mocker, fixture_for_osstat_pathlib, max_workers):
+    # Arrange
+    file_path = 'test_file_path.dat'
+    file_dict = {file_path: ''.join(f'main line {i} INCLUDE inc_file{i}.inc\n' for i in range(5))}
+    for i in range(5):
+        file_dict[f'inc_file{i}.inc'] = f'inc file {i}\nINCLUDE nested_file{i}.inc\n'
+        file_dict[f'nested_file{i}.inc'] = f'nested file {i}\n'
+    file_dict['nested_file3.inc'] = 'nested file 3\nPERMX VALUE\nINCLUDE nested_array.inc\n'
+
+    expected_include_objects = []
+    for i in range(5):
+        nested_include = NexusFile(location=f'nested_file{i}.inc', include_locations=[], origin=f'inc_file{i}.inc',
+                                   include_objects=None, file_content_as_list=[f'nested file {i}\n'])
+        expected_include_objects.append(
+            NexusFile(location=f'inc_file{i}.inc', include_locations=[f'nested_file{i}.inc'], origin=file_path,
+                      include_objects=[nested_include],
+                      file_content_as_list=[f'inc file {i}\n', f'INCLUDE nested_file{i}.inc\n']))
+    expected_include_objects[3].include_objects[0] = NexusFile(
+        location='nested_file3.inc', include_locations=['nested_array.inc'], origin='inc_file3.inc',
+        include_objects=[NexusFile(location='nested_array.inc', origin='nested_file3.inc', include_objects=None,
+                                   file_content_as_list=None)],
+        file_content_as_list=['nested file 3\n', 'PERMX VALUE\n', 'INCLUDE nested_array.inc\n'])
+
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict=file_dict).return_value
+        return mock_open
+
+    mocker.patch("builtins.open", mock_open_wrapper)
+    # Act
+    nexus_file = NexusFile.generate_file_include_structure(file_path, max_workers=max_workers)
+
+    # Assert
+    assert nexus_file.include_locations == [f'inc_file{i}.inc' for i in range(5)]
+    assert nexus_file.include_objects == expected_include_objects
+
+
+def test_generate_file_include_structure_reads_each_level_together(mocker, fixture_for_osstat_pathlib):
+    # Arrange
+    file_path = 'test_file_path.dat'
+    file_dict = {file_path: 'INCLUDE inc_file0.inc\nINCLUDE inc_file1.inc\n',
+                 'inc_file0.inc': 'INCLUDE nested_file0.inc\n',
+                 'inc_file1.inc': 'INCLUDE nested_file1.inc\nPERMX VALUE\nINCLUDE nested_array.inc\n',
+                 'nested_file0.inc': 'nested file 0\n',
+                 'nested_file1.inc': 'nested file 1\n'}
+
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict=file_dict).return_value
+        return mock_open
+
+    mocker.patch("builtins.open", mock_open_wrapper)
+    prefetched_paths = []
+    original_prefetch = IncludeFileReader.prefetch
+
+    def prefetch_wrapper(self, full_file_paths):
+        full_file_paths = list(full_file_paths)
+        prefetched_paths.append(full_file_paths)
+        original_prefetch(self, full_file_paths)
+
+    mocker.patch.object(IncludeFileReader, 'prefetch', prefetch_wrapper)
+
+    # Act
+    nexus_file = NexusFile.generate_file_include_structure(file_path, max_workers=4)
+
+    # Assert
+    assert prefetched_paths == [['inc_file0.inc', 'inc_file1.inc'], ['nested_file0.inc', 'nested_file1.inc'], []]
+    assert [x.location for x in nexus_file.include_objects] == ['inc_file0.inc', 'inc_file1.inc']
+    assert [x.location for x in nexus_file.include_objects[1].include_objects] == ['nested_file1.inc',
+                                                                                  'nested_array.inc']
+    assert nexus_file.include_objects[1].include_objects[0].file_content_as_list == ['nested file 1\n']
+    assert nexus_file.include_objects[1].include_objects[1].file_content_as_list == []
+
+
+def test_generate_file_include_structure_repeated_include(mocker, fixture_for_osstat_pathlib):
+    # Arrange
+    file_path = 'test_file_path.dat'
+    file_dict = {file_path: 'INCLUDE shared_file.inc\nINCLUDE other_file.inc\n',
+                 'other_file.inc': 'other file\nINCLUDE shared_file.inc\n',
+                 'shared_file.inc': 'shared line 1\nshared line 2\n'}
+
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict=file_dict).return_value
+        return mock_open
+
+    mocker.patch("builtins.open", mock_open_wrapper)
+    load_file_spy = mocker.spy(nfo, 'load_file_as_list')
+
+    # Act
+    nexus_file = NexusFile.generate_file_include_structure(file_path)
+    shared_file_1 = nexus_file.include_objects[0]
+    shared_file_2 = nexus_file.include_objects[1].include_objects[0]
+    shared_file_1.file_content_as_list[0] = 'edited line\n'
+
+    # Assert
+    assert [call.args[0] for call in load_file_spy.call_args_list] == [file_path, 'shared_file.inc',
+                                                                         'other_file.inc']
+    assert shared_file_1.origin == file_path
+    assert shared_file_2.origin == 'other_file.inc'
+    assert shared_file_1.id != shared_file_2.id
+    assert shared_file_1.file_content_as_list == ['edited line\n', 'shared line 2\n']
+    assert shared_file_2.file_content_as_list == ['shared line 1\n', 'shared line 2\n']
+    assert shared_file_1.file_content_as_list[1] is shared_file_2.file_content_as_list[1]
+
 def test_iterate_line(mocker):
     # Arrange
     mocker.patch.object(uuid, 'uuid4', side_effect=['uuid1', 'uuid2', 'parent_file'])
@@ -763,6 +871,60 @@ def test_update_object_locations(mocker, fixture_for_osstat_pathlib, test_file_c
     assert result == expected_results
 
 
+
+def test_update_object_locations_many_objects(mocker):
+    # Arrange
+    mocker.patch("builtins.open", mocker.mock_open())
+    nexus_file = NexusFile(location='somefile.dat', file_content_as_list=['line\n'] * 500)
+    nexus_file.object_locations = {f'uuid{i}': [2 * i] for i in range(200)}
+    expected_result = {f'uuid{i}': [2 * i + (3 if 2 * i >= 50 else 0) - (1 if 2 * i >= 98 else 0)]
+                       for i in range(200)}
+    expected_result['uuid0'] = [0, 60]
+    expected_result['new_uuid'] = [99]
+    del expected_result['uuid150']
+
+    # Act
+    nexus_file._NexusFile__update_object_locations(line_number=50, number_additional_lines=3)
+    nexus_file.add_object_locations('uuid0', [60])
+    nexus_file.add_object_locations('new_uuid', [100])
+    nexus_file._NexusFile__update_object_locations(line_number=100, number_additional_lines=-1)
+    del nexus_file.object_locations['uuid150']
+    result = nexus_file.object_locations
+
+    # Assert
+    assert isinstance(result, NexusObjectLocations)
+    assert result == expected_result
+    assert nexus_file.get_object_locations_for_id('uuid199') == [400]
+
+
+def test_object_locations_added_one_at_a_time():
+    # Arrange
+    locations = NexusObjectLocations()
+    expected_result = {}
+
+    # Act
+    for i in range(1000):
+        # add the objects in a different order to their line numbers
+        line_number = (i * 7) % 1000
+        locations[f'uuid{i}'] = [line_number]
+        expected_result[f'uuid{i}'] = [line_number]
+        if i % 100 == 99:
+            locations.update_line_numbers(line_number=500, number_additional_lines=2)
+            expected_result = {key: [x + 2 if x >= 500 else x for x in value]
+                               for key, value in expected_result.items()}
+    for i in range(0, 1000, 3):
+        del locations[f'uuid{i}']
+        del expected_result[f'uuid{i}']
+    locations.add('uuid1', [2000, 5])
+    expected_result['uuid1'] = sorted(expected_result['uuid1'] + [2000, 5])
+    locations.update_line_numbers(line_number=100, number_additional_lines=-1)
+    expected_result = {key: [x - 1 if x >= 100 else x for x in value] for key, value in expected_result.items()}
+
+    # Assert
+    assert dict(locations.items()) == expected_result
+    assert list(locations) == list(expected_result)
+    assert dict(pickle.loads(pickle.dumps(locations)).items()) == expected_result
+
 def test_add_to_file_as_list(mocker):
     # Arrange
     mocker.patch.object(uuid, 'uuid4', side_effect=['additional_obj_uuid', 'file_uuid', 'file_uuid', ])
@@ -797,6 +959,55 @@ def test_add_to_file_as_list(mocker):
     assert result.file_modified
 
 
+
+def test_add_to_file_as_list_in_place(mocker):
+    # Arrange
+    mocker.patch("builtins.open", mocker.mock_open())
+    include_file = NexusFile(location='inc_file.inc', file_content_as_list=['inc line 1\n', 'inc line 2\n'])
+    nexus_file = NexusFile(location='somefile.dat', include_objects=[include_file],
+                           file_content_as_list=['line 1\n', 'main INCLUDE inc_file.inc\n', 'line 3\n'])
+    nexus_file.get_flat_list_str_file
+    include_content = include_file.file_content_as_list
+    original_version = include_content.version
+
+    # Act
+    nexus_file.add_to_file_as_list(additional_content=['new line 1\n', 'new line 2\n'], index=3)
+
+    # Assert
+    assert include_file.file_content_as_list is include_content
+    assert include_content == ['inc line 1\n', 'new line 1\n', 'new line 2\n', 'inc line 2\n']
+    assert include_content.version != original_version
+
+
+def test_batch_edit(mocker):
+    # Arrange
+    mocker.patch("builtins.open", mocker.mock_open())
+    include_file = NexusFile(location='inc_file.inc', file_content_as_list=['inc line 1\n', 'inc line 2\n'])
+    nexus_file = NexusFile(location='somefile.dat', include_objects=[include_file],
+                           file_content_as_list=['line 1\n', 'main INCLUDE inc_file.inc\n', 'line 3\n'])
+    original_flat_file = nexus_file.get_flat_list_str_file
+    expected_flat_file = ['line 1\n', 'main ', 'inc line 1\n', 'new line 1\n', 'new line 2\n', 'line 3\n',
+                          'new line 3\n']
+    flatten_spy = mocker.spy(NexusFile, 'iterate_line')
+
+    # Act
+    with nexus_file.batch_edit():
+        nexus_file.add_to_file_as_list(additional_content=['new line 1\n', 'new line 2\n'], index=3)
+        nexus_file.remove_from_file_as_list(index=5)
+        nexus_file.add_to_file_as_list(additional_content=['new line 3\n'], index=6)
+        batch_flat_file = list(nexus_file.get_flat_list_str_file)
+    flat_file_after_batch = nexus_file.get_flat_list_str_file
+
+    # Assert
+    assert batch_flat_file == expected_flat_file
+    assert flat_file_after_batch == expected_flat_file
+    assert original_flat_file == ['line 1\n', 'main ', 'inc line 1\n', 'inc line 2\n', 'line 3\n']
+    assert include_file.file_content_as_list == ['inc line 1\n', 'new line 1\n', 'new line 2\n']
+    assert nexus_file.file_content_as_list == ['line 1\n', 'main INCLUDE inc_file.inc\n', 'line 3\n',
+                                               'new line 3\n']
+    # only flattened again once the batch has finished
+    assert flatten_spy.call_count == 2
+
 def test_remove_from_file_as_list(mocker):
     # Arrange
     mocker.patch.object(uuid, 'uuid4', side_effect=['remove_obj_uuid', 'file_uuid', 'file_uuid', ])
@@ -828,6 +1039,132 @@ def test_remove_from_file_as_list(mocker):
     assert nexus_file == expected_result
     assert nexus_file.file_modified
 
+
+def test_flat_file_cache(mocker):
+    # Arrange
+    include_file = NexusFile(location='inc_file1.inc', origin='test_file.dat',
+                             file_content_as_list=['inc line 1\n', 'inc line 2\n'])
+    nexus_file = NexusFile(location='test_file.dat', include_objects=[include_file],
+                           include_locations=['inc_file1.inc'],
+                           file_content_as_list=['first line\n', 'INCLUDE inc_file1.inc\n', 'last line\n'])
+    iterate_line_spy = mocker.spy(NexusFile, 'iterate_line')
+
+    # Act
+    first_flat_file = nexus_file.get_flat_list_str_file
+    second_flat_file = nexus_file.get_flat_list_str_file
+
+    # Assert
+    assert first_flat_file == ['first line\n', 'inc line 1\n', 'inc line 2\n', 'last line\n']
+    assert second_flat_file is first_flat_file
+    assert iterate_line_spy.call_count == 2  # the parent file and the include file, called once each
+
+    # Edits to the include file content are picked up
+    include_file.file_content_as_list[1] = 'edited inc line 2\n'
+    assert nexus_file.get_flat_list_str_file == ['first line\n', 'inc line 1\n', 'edited inc line 2\n',
+                                                 'last line\n']
+
+    # as are edits made through the NexusFile
+    nexus_file.add_to_file_as_list(additional_content=['new line\n'], index=1)
+    assert nexus_file.get_flat_list_str_file == ['first line\n', 'new line\n', 'inc line 1\n',
+                                                 'edited inc line 2\n', 'last line\n']
+    nexus_file.remove_from_file_as_list(index=1)
+    assert nexus_file.get_flat_list_str_file == ['first line\n', 'inc line 1\n', 'edited inc line 2\n',
+                                                 'last line\n']
+
+    # and replacing the content entirely
+    nexus_file.file_content_as_list = ['replaced\n']
+    assert nexus_file.get_flat_list_str_file == ['replaced\n']
+    assert nexus_file.line_locations == [(0, nexus_file.id)]
+
+
+
+def test_find_which_include_file_nested(mocker):
+    # Arrange
+    mocker.patch("builtins.open", mocker.mock_open())
+    include_file_3 = NexusFile(location='inc3.inc', file_content_as_list=['inc3 line 1\n', 'inc3 line 2\n'])
+    include_file_2 = NexusFile(location='inc2.inc', include_objects=[include_file_3],
+                               file_content_as_list=['inc2 line 1\n', 'inc2 INCLUDE inc3.inc\n', 'inc2 line 3\n'])
+    include_file_1 = NexusFile(location='inc1.inc', include_objects=[include_file_2],
+                               file_content_as_list=['inc1 line 1\n', 'inc1 INCLUDE inc2.inc\n', 'inc1 line 3\n'])
+    nexus_file = NexusFile(location='test_file.dat', include_objects=[include_file_1],
+                           file_content_as_list=['line 1\n', 'main INCLUDE inc1.inc\n', 'line 3\n'])
+    expected_locations = [(nexus_file, 0), (nexus_file, 1), (include_file_1, 0), (include_file_1, 1),
+                          (include_file_2, 0), (include_file_2, 1), (include_file_3, 0), (include_file_3, 1),
+                          (include_file_2, 2), (include_file_1, 2), (nexus_file, 2)]
+
+    # Act
+    flat_file = nexus_file.get_flat_list_str_file
+    result = [nexus_file.find_which_include_file(i) for i in range(len(flat_file))]
+
+    # Assert
+    assert len(flat_file) == len(expected_locations)
+    assert [(file.id, index) for file, index in result] == [(file.id, index) for file, index in expected_locations]
+
+    # the index keeps up with lines added and removed without needing to flatten the file again
+    nexus_file.add_to_file_as_list(additional_content=['new inc3 line\n', 'another new inc3 line\n'], index=7)
+    nexus_file.remove_from_file_as_list(index=7)
+    assert nexus_file.find_which_include_file(7) == (include_file_3, 1)
+    assert nexus_file.find_which_include_file(8) == (include_file_3, 2)
+    assert nexus_file.find_which_include_file(9) == (include_file_2, 2)
+    assert nexus_file.find_which_include_file(11) == (nexus_file, 2)
+    assert include_file_3.file_content_as_list == ['inc3 line 1\n', 'another new inc3 line\n', 'inc3 line 2\n']
+
+
+def test_find_which_include_file_back_to_back_includes(mocker):
+    # Arrange
+    mocker.patch("builtins.open", mocker.mock_open())
+    include_file_1 = NexusFile(location='inc1.inc', file_content_as_list=['inc1 line 1\n', 'inc1 line 2\n'])
+    include_file_2 = NexusFile(location='inc2.inc', file_content_as_list=['inc2 line 1\n', 'inc2 line 2\n'])
+    nexus_file = NexusFile(location='test_file.dat', include_objects=[include_file_1, include_file_2],
+                           file_content_as_list=['line 1\n', 'INCLUDE inc1.inc\n', 'INCLUDE inc2.inc\n', 'line 4\n'])
+    expected_locations = [(nexus_file, 0), (include_file_1, 0), (include_file_1, 1), (include_file_2, 0),
+                          (include_file_2, 1), (nexus_file, 3)]
+
+    # Act
+    flat_file = nexus_file.get_flat_list_str_file
+    result = [nexus_file.find_which_include_file(i) for i in range(len(flat_file))]
+
+    # Assert
+    assert len(flat_file) == len(expected_locations)
+    assert [(file.id, index) for file, index in result] == [(file.id, index) for file, index in expected_locations]
+
+    # edits to the first line of the second include file go to that file
+    nexus_file.add_to_file_as_list(additional_content=['new inc2 line\n'], index=3)
+    assert include_file_2.file_content_as_list == ['new inc2 line\n', 'inc2 line 1\n', 'inc2 line 2\n']
+    assert nexus_file.find_which_include_file(6) == (nexus_file, 3)
+    nexus_file.remove_from_file_as_list(index=3)
+    nexus_file.remove_from_file_as_list(index=3)
+    assert include_file_2.file_content_as_list == ['inc2 line 2\n']
+    assert include_file_1.file_content_as_list == ['inc1 line 1\n', 'inc1 line 2\n']
+    assert nexus_file.file_content_as_list == ['line 1\n', 'INCLUDE inc1.inc\n', 'INCLUDE inc2.inc\n', 'line 4\n']
+    assert nexus_file.find_which_include_file(4) == (nexus_file, 3)
+
+
+def test_find_which_include_file_include_on_first_line(mocker):
+    # Arrange
+    mocker.patch("builtins.open", mocker.mock_open())
+    include_file_2 = NexusFile(location='inc2.inc', file_content_as_list=['inc2 line 1\n'])
+    include_file_1 = NexusFile(location='inc1.inc', include_objects=[include_file_2],
+                               file_content_as_list=['INCLUDE inc2.inc\n', 'inc1 line 2\n'])
+    nexus_file = NexusFile(location='test_file.dat', include_objects=[include_file_1],
+                           file_content_as_list=['line 1\n', 'INCLUDE inc1.inc\n', 'line 3\n'])
+    expected_locations = [(nexus_file, 0), (include_file_2, 0), (include_file_1, 1), (nexus_file, 2)]
+
+    # Act
+    flat_file = nexus_file.get_flat_list_str_file
+    result = [nexus_file.find_which_include_file(i) for i in range(len(flat_file))]
+
+    # Assert
+    assert len(flat_file) == len(expected_locations)
+    assert [(file.id, index) for file, index in result] == [(file.id, index) for file, index in expected_locations]
+
+    nexus_file.remove_from_file_as_list(index=1)
+    assert include_file_2.file_content_as_list == []
+    assert include_file_1.file_content_as_list == ['INCLUDE inc2.inc\n', 'inc1 line 2\n']
+    assert nexus_file.find_which_include_file(1) == (include_file_1, 1)
+    assert nexus_file.find_which_include_file(2) == (nexus_file, 2)
+
+
 @pytest.mark.parametrize('file_content, expected_file_content', [
     (
         'test_file_content\nInCluDE oRigINAl_Include.inc\nend of the file\n',
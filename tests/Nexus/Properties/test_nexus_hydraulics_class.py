@@ -239,6 +239,26 @@ def test_read_hydraulics_properties_from_file(mocker, file_contents, expected_hy
             assert props[key] == expected_hydraulics_properties[key]
 
 
+
+@pytest.mark.parametrize("file_contents, expected_hydraulics_properties", [
+    ("DATUM 7000 DATGRAD GRAD\n", {'DATUM': 7000., 'DATGRAD': 'GRAD'}),
+    ("datgrad grad DATUM 7000 ! comment\n", {'DATUM': 7000., 'DATGRAD': 'grad'}),
+    ("WATINJ GRAD 0.433\nDATUM 7000 DATGRAD GRAD\n", {'DATUM': 7000., 'DATGRAD': 'GRAD', 'WATINJ': {'GRAD': 0.433}}),
+], ids=['datum first', 'datgrad first', 'after watinj'])
+def test_read_hydraulics_datum_and_datgrad_on_one_line(mocker, file_contents, expected_hydraulics_properties):
+    # Arrange
+    hyd_file = NexusFile(file_content_as_list=file_contents.splitlines(keepends=True))
+    hydraulics_obj = NexusHydraulicsMethod(file=hyd_file, input_number=1)
+    mocker.patch("builtins.open", mocker.mock_open(read_data=file_contents))
+
+    # Act
+    hydraulics_obj.read_properties()
+
+    # Assert
+    assert {key: hydraulics_obj.properties[key] for key in expected_hydraulics_properties} == \
+        expected_hydraulics_properties
+
+
 def test_nexus_hydraulics_repr():
     # Arrange
     hyd_file = NexusFile(location='test/file/hyd.dat')
@@ -74,7 +74,7 @@ def test_get_simulation_progress(mocker, fixture_for_osstat_pathlib, log_file_co
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
     run_control_file = "START 01/01/2000"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(mocker, filename, fcs_file, run_control_file, "",
@@ -135,7 +135,7 @@ def test_get_status_finished(mocker, fixture_for_osstat_pathlib, log_file_conten
     listdir_mock = mocker.MagicMock(return_value=['nexus_run.log', ''])
     mocker.patch("os.listdir", listdir_mock)
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -194,7 +194,7 @@ def test_get_base_case_run_time(mocker, fixture_for_osstat_pathlib, log_file_con
     """Test the 'retrieve previous time for run' functionality"""
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     # Returns the contents of a completed run when looking at the 'original' model
     def open_file_mock(filename, operation=None):
@@ -243,7 +243,7 @@ def test_get_simulation_start_time(mocker, fixture_for_osstat_pathlib, log_file_
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -280,7 +280,7 @@ def test_get_simulation_end_time(mocker, fixture_for_osstat_pathlib, log_file_co
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -325,7 +325,7 @@ def test_get_simulation_start_end_time(mocker, fixture_for_osstat_pathlib, log_f
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.Network.NexusWellhead import NexusWellhead
 from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusWell import NexusWell
+from ResSimpy.Nexus.DataModels.NexusRelPermEndPoint import NexusRelPermEndPoint
 from ResSimpy.Nexus.DataModels.NexusPVTMethod import NexusPVTMethod
 from ResSimpy.Nexus.DataModels.NexusSeparatorMethod import NexusSeparatorMethod
 from ResSimpy.Nexus.DataModels.NexusWaterMethod import NexusWaterMethod
@@ -25,6 +26,7 @@ from ResSimpy.Nexus.DataModels.Network.NexusNode import NexusNode
 from ResSimpy.Nexus.DataModels.Network.NexusNodeConnection import NexusNodeConnection
 from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
 from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+import ResSimpy.Nexus.nexus_file_operations as nfo
 from pytest_mock import MockerFixture
 from unittest.mock import Mock
 from ResSimpy.Enums.UnitsEnum import UnitSystem
@@ -1138,6 +1140,35 @@ def test_get_wells_df(mocker: MockerFixture, fixture_for_osstat_pathlib):
     pd.testing.assert_frame_equal(result, loaded_wells_df, check_like=True)
 
 
+def test_get_wells_df_column_order(mocker: MockerFixture, fixture_for_osstat_pathlib):
+    # Arrange
+    fcs_file_contents = """
+       WelLS sEt 1 my/wellspec/file.dat
+    """
+    mocker.patch("builtins.open", mocker.mock_open(read_data=fcs_file_contents))
+    loaded_wells = [
+        NexusWell(well_name='WELL1', units=UnitSystem.ENGLISH, completions=[
+            NexusCompletion(i=1, j=2, k=3, well_radius=4.5, date='01/01/2023', date_format=DateFormat.DD_MM_YYYY)]),
+        NexusWell(well_name='WELL2', units=UnitSystem.ENGLISH, completions=[
+            NexusCompletion(i=6, j=7, k=8, skin=1.5, well_radius=9.11, date='01/01/2023',
+                            date_format=DateFormat.DD_MM_YYYY,
+                            rel_perm_end_point=NexusRelPermEndPoint(swl=0.1))]),
+    ]
+    # the DataFrame built one completion at a time
+    expected_df = pd.DataFrame([{'well_name': well.well_name, 'units': well.units.name, **completion.to_dict()}
+                                for well in loaded_wells for completion in well.completions])
+    expected_df = expected_df.dropna(axis=1, how='all')
+    mocker.patch('ResSimpy.Nexus.NexusWells.load_wells', mocker.Mock(return_value=loaded_wells))
+    simulation = NexusSimulator(origin='nexus_run.fcs')
+
+    # Act
+    result = simulation.wells.get_wells_df()
+
+    # Assert
+    assert list(result.columns) == ['well_name', 'units', 'i', 'j', 'k', 'skin', 'well_radius', 'date', 'swl']
+    pd.testing.assert_frame_equal(result, expected_df)
+
+
 @pytest.mark.parametrize("fcs_file_contents", [
     ("""
        WelLS set 1 my/wellspec/file.dat
@@ -1776,3 +1807,157 @@ def test_load_surface_file(mocker, fixture_for_osstat_pathlib, fcs_file_contents
     assert result_wellbores == expected_wellbores
     assert result_constraints == expected_constraints
     spy.assert_called_once()
+
+
+def test_refresh(tmp_path):
+    # Arrange
+    def write_and_bump_modified_time(path, content):
+        path.write_text(content)
+        stat_obj = os.stat(path)
+        os.utime(path, ns=(stat_obj.st_atime_ns, stat_obj.st_mtime_ns + 10 ** 9))
+
+    fcs_path = tmp_path / 'model.fcs'
+    fcs_path.write_text('DESC test model\nDATEFORMAT DD/MM/YYYY\nRUNCONTROL run_control.dat\n'
+                        'RECURRENT_FILES\n WELLS Set 1 wells.dat\nPVT Method 1 pvt.dat\n')
+    (tmp_path / 'run_control.dat').write_text('START 01/01/2020\n')
+    (tmp_path / 'wells.dat').write_text('TIME 01/01/2020\nINCLUDE wells_inc.dat\n')
+    (tmp_path / 'wells_inc.dat').write_text('WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n')
+    (tmp_path / 'pvt.dat').write_text('BLACKOIL\n')
+    model = NexusSimulator(origin=str(fcs_path))
+    assert [x.well_name for x in model.wells.get_wells()] == ['well1']
+    original_pvt = model.pvt
+    original_wells_file = model.model_files.well_files[1]
+
+    # Act
+    no_changes = model.refresh()
+    write_and_bump_modified_time(tmp_path / 'wells_inc.dat', 'WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n'
+                                                             'WELLSPEC well2\nIW JW L RADW\n3 2 1 4.5\n')
+    changes = model.refresh()
+
+    # Assert
+    assert no_changes == []
+    assert [x.location for x in changes] == [str(tmp_path / 'wells_inc.dat')]
+    assert [x.well_name for x in model.wells.get_wells()] == ['well1', 'well2']
+    assert model.model_files.well_files[1] is not original_wells_file
+    assert original_wells_file not in model.model_files.include_objects
+    assert model.pvt is original_pvt
+    assert model.start_date == '01/01/2020'
+
+    # Act - changing the fcs file reloads the whole model
+    write_and_bump_modified_time(fcs_path, 'DESC test model\nDATEFORMAT MM/DD/YYYY\nRUNCONTROL run_control.dat\n'
+                                           'RECURRENT_FILES\n WELLS Set 1 wells.dat\nPVT Method 1 pvt.dat\n')
+    changes = model.refresh()
+
+    # Assert
+    assert [x.location for x in changes] == [str(fcs_path)]
+    assert model.date_format == DateFormat.MM_DD_YYYY
+    assert model.pvt is not original_pvt
+
+
+def test_refresh_reloads_only_changed_files(mocker, tmp_path):
+    # Arrange
+    fcs_path = tmp_path / 'model.fcs'
+    fcs_path.write_text('DESC test model\nDATEFORMAT DD/MM/YYYY\nRUNCONTROL run_control.dat\n'
+                        'RECURRENT_FILES\n WELLS Set 1 wells.dat\n')
+    (tmp_path / 'run_control.dat').write_text('START 01/01/2020\n')
+    (tmp_path / 'wells.dat').write_text('TIME 01/01/2020\nINCLUDE wells_1.dat\nINCLUDE wells_2.dat\n')
+    (tmp_path / 'wells_1.dat').write_text('WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n')
+    (tmp_path / 'wells_2.dat').write_text('WELLSPEC well2\nIW JW L RADW\n3 2 1 4.5\n')
+    cache_dir = tmp_path / 'cache'
+    model = NexusSimulator(origin=str(fcs_path), cache_dir=str(cache_dir))
+    unchanged_include = model.model_files.well_files[1].include_objects[1]
+    wells_1_path = tmp_path / 'wells_1.dat'
+    wells_1_path.write_text('WELLSPEC well3\nIW JW L RADW\n1 2 3 4.5\n')
+    stat_obj = os.stat(wells_1_path)
+    os.utime(wells_1_path, ns=(stat_obj.st_atime_ns, stat_obj.st_mtime_ns + 10 ** 9))
+    load_file_spy = mocker.spy(nfo, 'load_file_as_list')
+
+    # Act
+    changes = model.refresh()
+
+    # Assert
+    assert [os.path.basename(x.location) for x in changes] == ['wells_1.dat']
+    assert sorted(os.path.basename(x.args[0]) for x in load_file_spy.call_args_list) == ['wells.dat', 'wells_1.dat']
+    reloaded_includes = model.model_files.well_files[1].include_objects
+    assert reloaded_includes[1] is unchanged_include
+    assert reloaded_includes[0].file_content_as_list == ['WELLSPEC well3\n', 'IW JW L RADW\n', '1 2 3 4.5\n']
+    assert sorted(x.well_name for x in model.wells.get_wells()) == ['well2', 'well3']
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_load_selected_sections(mocker, tmp_path):
+    # Arrange
+    fcs_path = tmp_path / 'model.fcs'
+    fcs_path.write_text('DESC test model\nDATEFORMAT DD/MM/YYYY\nRUNCONTROL run_control.dat\n'
+                        'RECURRENT_FILES\n WELLS Set 1 wells.dat\nSURFACE Network 1 surface.dat\n'
+                        'PVT Method 1 pvt.dat\nSTRUCTURED_GRID grid.dat\n')
+    (tmp_path / 'run_control.dat').write_text('START 01/01/2020\n')
+    (tmp_path / 'wells.dat').write_text('TIME 01/01/2020\nWELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n')
+    (tmp_path / 'surface.dat').write_text('TIME 01/01/2020\n')
+    (tmp_path / 'pvt.dat').write_text('BLACKOIL\n')
+    (tmp_path / 'grid.dat').write_text('NX NY NZ\n1 1 1\n')
+    load_file_spy = mocker.spy(nfo, 'load_file_as_list')
+
+    def read_file_names():
+        return {os.path.basename(x.args[0]) for x in load_file_spy.call_args_list}
+
+    # Act
+    model = NexusSimulator(origin=str(fcs_path), sections={'wells', 'runcontrol'})
+    files_read_on_load = read_file_names()
+    wells = model.wells.get_wells()
+    files_read_for_wells = read_file_names()
+    pvt = model.pvt
+    refreshed_files = model.refresh()
+
+    # Assert
+    assert refreshed_files == []
+    assert files_read_on_load == {'model.fcs', 'run_control.dat', 'wells.dat'}
+    assert files_read_for_wells == files_read_on_load
+    assert [x.well_name for x in wells] == ['well1']
+    assert model.model_files.unloaded_sections == {'SURFACE', 'STRUCTURED_GRID'}
+    assert pvt.files[1].file_content_as_list == ['BLACKOIL\n']
+    assert read_file_names() == {'model.fcs', 'run_control.dat', 'wells.dat', 'pvt.dat'}
+    assert model.model_files.surface_files[1].file_content_as_list == []
+
+
+def test_write_out_partly_loaded_model(tmp_path):
+    # Arrange
+    fcs_path = tmp_path / 'model.fcs'
+    fcs_path.write_text('DESC test model\nDATEFORMAT DD/MM/YYYY\nRUNCONTROL run_control.dat\n'
+                        'RECURRENT_FILES\n WELLS Set 1 wells.dat\nSURFACE Network 1 surface.dat\n'
+                        'PVT Method 1 pvt.dat\n')
+    (tmp_path / 'run_control.dat').write_text('START 01/01/2020\n')
+    (tmp_path / 'wells.dat').write_text('TIME 01/01/2020\nWELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n')
+    (tmp_path / 'surface.dat').write_text('TIME 01/01/2020\nNODES\nNAME TYPE DEPTH\nnode1 WELLHEAD 100\nENDNODES\n')
+    (tmp_path / 'pvt.dat').write_text('BLACKOIL\nPSAT\n')
+    output_path = tmp_path / 'output'
+    output_path.mkdir()
+    model = NexusSimulator(origin=str(fcs_path), sections={'wells', 'runcontrol'})
+
+    # Act
+    model.write_out_new_simulator(str(output_path / 'new_model.fcs'), str(output_path), write_out_all_files=True)
+
+    # Assert
+    assert (output_path / 'pvt.dat').read_text() == 'BLACKOIL\nPSAT\n'
+    assert (output_path / 'surface.dat').read_text() == \
+        'TIME 01/01/2020\nNODES\nNAME TYPE DEPTH\nnode1 WELLHEAD 100\nENDNODES\n'
+    assert (output_path / 'wells.dat').read_text() == 'TIME 01/01/2020\nWELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n'
+    assert model.model_files.unloaded_sections == set()
+    assert model.pvt.files[1].file_content_as_list == ['BLACKOIL\n', 'PSAT\n']
+
+
+def test_load_network_loads_surface_section(tmp_path):
+    # Arrange
+    fcs_path = tmp_path / 'model.fcs'
+    fcs_path.write_text('DESC test model\nDATEFORMAT DD/MM/YYYY\nRUNCONTROL run_control.dat\n'
+                        'RECURRENT_FILES\nSURFACE Network 1 surface.dat\n')
+    (tmp_path / 'run_control.dat').write_text('START 01/01/2020\n')
+    (tmp_path / 'surface.dat').write_text('TIME 01/01/2020\nNODES\nNAME TYPE DEPTH\nnode1 WELLHEAD 100\nENDNODES\n')
+    model = NexusSimulator(origin=str(fcs_path), sections={'runcontrol'})
+
+    # Act
+    model.load_network()
+
+    # Assert
+    assert model.model_files.unloaded_sections == set()
+    assert [x.name for x in model.network.nodes.get_all()] == ['node1']
@@ -4,6 +4,7 @@ import pytest
 from ResSimpy.Grid import VariableEntry
 from ResSimpy.Nexus.DataModels.StructuredGrid import NexusGrid
 from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+from ResSimpy.Nexus.structured_grid_operations import StructuredGridOperations
 from tests.Nexus.nexus_simulator.test_nexus_simulator import mock_multiple_opens
 from tests.multifile_mocker import mock_multiple_files
 
@@ -364,6 +365,24 @@ def test_save_structured_grid_values(mocker, fixture_for_osstat_pathlib, new_por
     assert result.kz == new_kz
 
 
+@pytest.mark.parametrize("file_as_list, old_property, new_property, expected_file_as_list", [
+    (['KX VALUE 10\n'], VariableEntry("VALUE", "10"), VariableEntry("VALUE", "kx.inc"), ['KX VALUE INCLUDE kx.inc\n']),
+    (['NX NY NZ\n', 'KX MULT 2 KY\n'], VariableEntry("MULT", "2 KY"), VariableEntry("MULT", "3 KZ"),
+     ['NX NY NZ\n', 'KX MULT 3 KZ\n']),
+    (['KX MULT 2 KY\n'], VariableEntry("MULT", "2 KY"), VariableEntry("VALUE", "kx.inc"),
+     ['KX VALUE INCLUDE kx.inc\n']),
+    (['KX VALUE 10\n'], VariableEntry("VALUE", "10"), VariableEntry("MULT", "3 KY"), ['KX MULT 3 KY\n']),
+    (['KX VALUE\n', 'INCLUDE old.inc\n'], VariableEntry("VALUE", "old.inc"), VariableEntry("VALUE", "kx.inc"),
+     ['KX VALUE\n', 'INCLUDE kx.inc\n']),
+], ids=['value on same line', 'mult on same line', 'mult to value', 'value to mult', 'value on next line'])
+def test_replace_value(file_as_list, old_property, new_property, expected_file_as_list):
+    # Act
+    StructuredGridOperations.replace_value(file_as_list, old_property, new_property, 'KX')
+
+    # Assert
+    assert file_as_list == expected_file_as_list
+
+
 @pytest.mark.parametrize("structured_grid_file_contents, expected_text",
                          [
                              ("! Grid dimensions\nNX NY NZ\n1 2 3\ntest string\nDUMMY VALUE\n!ioeheih\ndummy text"
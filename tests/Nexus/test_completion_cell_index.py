@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from ResSimpy.Nexus.completion_cell_index import CompletionCellIndex
+
+
+@pytest.mark.parametrize('i_range, j_range, k_range', [
+    ((3, 3), (4, 4), (2, 2)),
+    ((2, 5), (1, 3), (1, 4)),
+    (None, None, (2, 3)),
+    (None, (2, 2), (1, 6)),
+    ((0, 100), (-5, 100), None),
+    ((7, 6), None, None),
+    ((20, 30), None, None),
+], ids=['cell', 'box', 'layers', 'rows of cells', 'box past the grid', 'empty range', 'outside the grid'])
+def test_rows_in_box_match_scanning_every_completion(i_range, j_range, k_range):
+    # Arrange
+    random_generator = np.random.default_rng(0)
+    i = random_generator.integers(1, 8, size=500)
+    j = random_generator.integers(1, 6, size=500)
+    k = random_generator.integers(1, 7, size=500)
+    rows = np.arange(1000, 1500)
+    cell_index = CompletionCellIndex(i, j, k, rows)
+    in_box = np.ones(500, dtype=bool)
+    for values, index_range in ((i, i_range), (j, j_range), (k, k_range)):
+        if index_range is not None:
+            in_box &= (values >= index_range[0]) & (values <= index_range[1])
+
+    # Act
+    result = cell_index.rows_in_box(i_range, j_range, k_range)
+
+    # Assert
+    np.testing.assert_array_equal(result, rows[in_box])
+
+
+def test_empty_index():
+    # Arrange
+    cell_index = CompletionCellIndex(np.array([]), np.array([]), np.array([]), np.array([]))
+
+    # Act
+    result = cell_index.rows_in_box((1, 1), (1, 1), (1, 1))
+
+    # Assert
+    assert len(result) == 0
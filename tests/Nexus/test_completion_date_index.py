@@ -0,0 +1,42 @@
+import math
+import random
+
+import pytest
+
+from ResSimpy.Nexus.completion_date_index import CompletionDateIndex, CompletionPeriod
+
+
+def test_periods_for_well():
+    # Arrange
+    dates = [31.0, 0.0, 31.0, 59.0, 0.0]
+    expected_periods = [CompletionPeriod(start=0.0, end=31.0, rows=[11, 14]),
+                        CompletionPeriod(start=31.0, end=59.0, rows=[10, 12]),
+                        CompletionPeriod(start=59.0, end=math.inf, rows=[13])]
+
+    # Act
+    result = CompletionDateIndex.periods_for_well(dates, first_row=10)
+
+    # Assert
+    assert result == expected_periods
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_rows_match_scanning_every_period(seed):
+    # Arrange
+    random_generator = random.Random(seed)
+    periods = []
+    first_row = 0
+    for _ in range(50):
+        dates = [float(random_generator.randint(0, 100)) for _ in range(random_generator.randint(1, 6))]
+        periods += CompletionDateIndex.periods_for_well(dates, first_row)
+        first_row += len(dates)
+    date_index = CompletionDateIndex(periods)
+
+    for date in [-1.0, 0.0, 13.0, 50.5, 100.0, 150.0]:
+        # Act
+        rows_at = date_index.rows_at(date)
+        rows_between = date_index.rows_between(date, date + 20)
+
+        # Assert
+        assert rows_at == sorted(row for x in periods if x.start <= date < x.end for row in x.rows)
+        assert sorted(rows_between) == sorted(row for x in periods if date <= x.start <= date + 20 for row in x.rows)
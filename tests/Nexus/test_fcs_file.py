@@ -4,6 +4,8 @@ from unittest.mock import Mock
 import pytest
 from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+from ResSimpy.Enums.UnitsEnum import UnitSystem
 from tests.multifile_mocker import mock_multiple_files
 from tests.utility_for_tests import generic_fcs, check_file_read_write_is_correct
 
@@ -113,7 +115,8 @@ def test_fcs_file_multiple_methods(mocker, fixture_for_osstat_pathlib):
     assert result == expected_fcs_file
 
 
-def test_fcs_file_all_methods(mocker, fixture_for_osstat_pathlib):
+@pytest.mark.parametrize('max_workers', [None, 3])
+def test_fcs_file_all_methods(mocker, fixture_for_osstat_pathlib, max_workers):
     # Currently this test doesn't cover ensuring that the include file object gets into the fcs file.
     # Arrange
     fcs_content = '''DESC reservoir1
@@ -191,13 +194,42 @@ def test_fcs_file_all_methods(mocker, fixture_for_osstat_pathlib):
                                     ('hyd.dat', None, None)]
 
     # Act
-    result = FcsNexusFile.generate_fcs_structure(fcs_file_path=fcs_path)
+    result = FcsNexusFile.generate_fcs_structure(fcs_file_path=fcs_path, max_workers=max_workers)
 
     # Assert
     assert result.file_content_as_list == expected_fcs_file.file_content_as_list
     assert result == expected_fcs_file
 
 
+@pytest.mark.parametrize('fcs_content, expected_date_format, expected_run_units, expected_default_units', [
+    ('DESC reservoir1\nRUN_UNITS ENGLISH\nDATEFORMAT DD/MM/YYYY\nDEFAULT_UNITS METRIC\n',
+     DateFormat.DD_MM_YYYY, UnitSystem.ENGLISH, UnitSystem.METRIC),
+    ('DESC reservoir1\nDATE_FORMAT MM/DD/YYYY\nINCLUDE settings.inc\n',
+     DateFormat.MM_DD_YYYY, UnitSystem.METKGCM2, None),
+    ('DESC reservoir1\n', None, None, None),
+], ids=['all settings', 'settings in include file', 'no settings'])
+def test_fcs_file_global_settings(mocker, fixture_for_osstat_pathlib, fcs_content, expected_date_format,
+                                  expected_run_units, expected_default_units):
+    # Arrange
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict={
+            'test_fcs.fcs': fcs_content,
+            'settings.inc': 'RUN_UNITS METKG/CM2',
+        }).return_value
+        return mock_open
+
+    mocker.patch("builtins.open", mock_open_wrapper)
+    mocker.patch("os.path.isfile", lambda x: True)
+
+    # Act
+    fcs_file = FcsNexusFile.generate_fcs_structure('test_fcs.fcs')
+
+    # Assert
+    assert fcs_file.date_format == expected_date_format
+    assert fcs_file.run_units == expected_run_units
+    assert fcs_file.default_units == expected_default_units
+
+
 def test_get_full_network(mocker):
     # Arrange
     fcs_content = '''DESC reservoir1
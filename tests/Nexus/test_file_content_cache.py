@@ -0,0 +1,85 @@
+import pickle
+
+import pytest
+
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.file_content_cache import FileContentCache
+
+
+@pytest.fixture
+def model_file_with_includes(tmp_path):
+    main_file_path = tmp_path / 'wells.dat'
+    main_file_path.write_text('TIME 01/01/2020\nINCLUDE inc_1.dat\nINCLUDE inc_2.dat\n')
+    (tmp_path / 'inc_1.dat').write_text('WELLSPEC well1\nIW JW L\n1 2 3\n')
+    (tmp_path / 'inc_2.dat').write_text('WELLSPEC well2\nIW JW L\n4 5 6\n')
+    return NexusFile.generate_file_include_structure(str(main_file_path))
+
+
+def test_least_recently_used_include_file_unloaded(model_file_with_includes):
+    # Arrange
+    expected_flat_file = list(model_file_with_includes.get_flat_list_str_file)
+    include_1, include_2 = model_file_with_includes.include_objects
+    include_file_size = len('WELLSPEC well1\nIW JW L\n1 2 3\n')
+    cache = FileContentCache(max_bytes=include_file_size)
+
+    # Act
+    cache.add_files([model_file_with_includes])
+    include_2_content = include_2.file_content_as_list
+    include_1_unloaded = include_1._NexusFile__file_content_as_list is None
+    flat_file = model_file_with_includes.get_flat_list_str_file
+
+    # Assert
+    assert include_1_unloaded
+    assert include_2_content == ['WELLSPEC well2\n', 'IW JW L\n', '4 5 6\n']
+    assert flat_file == expected_flat_file
+    assert cache.total_bytes == include_file_size
+
+
+def test_modified_include_file_not_unloaded(model_file_with_includes):
+    # Arrange
+    include_1, include_2 = model_file_with_includes.include_objects
+    cache = FileContentCache(max_bytes=0)
+    cache.add_files([model_file_with_includes])
+
+    # Act
+    include_1.file_content_as_list.append('7 8 9\n')
+    _ = include_2.file_content_as_list
+
+    # Assert
+    assert include_1._NexusFile__file_content_as_list == ['WELLSPEC well1\n', 'IW JW L\n', '1 2 3\n', '7 8 9\n']
+
+
+def test_unloaded_content_pickled(model_file_with_includes):
+    # Arrange
+    include_1, include_2 = model_file_with_includes.include_objects
+    cache = FileContentCache(max_bytes=0)
+    cache.add_files([model_file_with_includes])
+    _ = include_2.file_content_as_list
+
+    # Act
+    result = pickle.loads(pickle.dumps(model_file_with_includes))
+
+    # Assert
+    assert result.include_objects[0]._NexusFile__file_content_as_list == ['WELLSPEC well1\n', 'IW JW L\n', '1 2 3\n']
+    assert result.include_objects[0]._NexusFile__content_cache is None
+
+
+def test_include_file_changed_on_disk_warns(tmp_path, model_file_with_includes):
+    # Arrange
+    include_1, include_2 = model_file_with_includes.include_objects
+    cache = FileContentCache(max_bytes=0)
+    cache.add_files([model_file_with_includes])
+    _ = include_2.file_content_as_list
+    include_1.last_modified = None
+
+    # Act
+    with pytest.warns(UserWarning, match='has changed on disk'):
+        result = include_1.file_content_as_list
+
+    # Assert
+    assert result == ['WELLSPEC well1\n', 'IW JW L\n', '1 2 3\n']
+
+
+def test_negative_cache_size_raises():
+    with pytest.raises(ValueError):
+        FileContentCache(max_bytes=-1)
@@ -157,6 +157,45 @@ WELLMOD	RU001	DKH	CON	0
     assert result_wells == expected_wells
 
 
+def test_load_wells_blank_line_before_second_header(mocker, fixture_for_osstat_pathlib):
+    # Arrange
+    start_date = '01/01/2023'
+    date_format = DateFormat.DD_MM_YYYY
+
+    file_contents = """
+    WELLSPEC DEV1
+    IW JW L RADW
+    1  2  3  4.5
+
+    WELLSPEC DEV2
+
+    IW JW L RADW
+    6 7 8   9.11
+    """
+
+    expected_wells = [
+        NexusWell(well_name='DEV1', units=UnitSystem.ENGLISH, completions=[
+            NexusCompletion(i=1, j=2, k=3, well_radius=4.5, date=start_date, date_format=date_format)]),
+        NexusWell(well_name='DEV2', units=UnitSystem.ENGLISH, completions=[
+            NexusCompletion(i=6, j=7, k=8, well_radius=9.11, date=start_date, date_format=date_format)]),
+    ]
+
+    open_mock = mocker.mock_open(read_data=file_contents)
+    mocker.patch("builtins.open", open_mock)
+    wells_file = NexusFile.generate_file_include_structure('test/file/location.dat')
+    flat_list_mock = mocker.patch.object(NexusFile, 'get_flat_list_str_file', new_callable=mocker.PropertyMock)
+
+    # Act
+    result_wells = load_wells(wells_file, start_date=start_date, default_units=UnitSystem.ENGLISH,
+                              date_format=date_format)
+
+    # Assert
+    assert result_wells == expected_wells
+    # the file is read line by line rather than flattened into a list
+    flat_list_mock.assert_not_called()
+    assert wells_file.get_object_locations_for_id(result_wells[1].completions[0].id) == [8]
+
+
 def test_load_wells_multiple_wells_multiple_dates(mocker, fixture_for_osstat_pathlib):
     # Arrange
     start_date = '01/01/2023'
@@ -378,6 +417,51 @@ def test_load_wells_rel_perm_tables(mocker, fixture_for_osstat_pathlib):
     assert result_wells == expected_wells
 
 
+def test_load_wells_repeated_well_mixed_case_table_end(mocker, fixture_for_osstat_pathlib):
+    # Arrange
+    start_date = '01/01/2023'
+    date_format = DateFormat.DD_MM_YYYY
+
+    file_contents = """
+    WELLSPEC WELL1
+    IW JW L SWL RADW KRW_SWRO
+    1  2  3 0.1 4.5  0.5
+    time 01/02/2023 ! second date
+    wellspec WELL2 ! second well
+    JW IW SGL L
+    7  6  0.2 8
+    Time 01/03/2023
+    WELLSPEC WELL1
+    L IW JW RADW SWL
+    9 4  5  5.5  0.3
+    """
+
+    expected_wells = [
+        NexusWell(well_name='WELL1', units=UnitSystem.ENGLISH, completions=[
+            NexusCompletion(i=1, j=2, k=3, well_radius=4.5, date=start_date, date_format=date_format,
+                            rel_perm_end_point=NexusRelPermEndPoint(swl=0.1, krw_swro=0.5)),
+            NexusCompletion(i=4, j=5, k=9, well_radius=5.5, date='01/03/2023', date_format=date_format,
+                            rel_perm_end_point=NexusRelPermEndPoint(swl=0.3))]),
+        NexusWell(well_name='WELL2', units=UnitSystem.ENGLISH, completions=[
+            NexusCompletion(i=6, j=7, k=8, date='01/02/2023', date_format=date_format,
+                            rel_perm_end_point=NexusRelPermEndPoint(sgl=0.2))]),
+    ]
+
+    open_mock = mocker.mock_open(read_data=file_contents)
+    mocker.patch("builtins.open", open_mock)
+    wells_file = NexusFile.generate_file_include_structure('test/file/location.dat')
+
+    # Act
+    result_wells = load_wells(wells_file, start_date=start_date, default_units=UnitSystem.ENGLISH,
+                              date_format=date_format)
+
+    # Assert
+    assert result_wells == expected_wells
+    # the second table for WELL1 is added to the existing well rather than creating a new one
+    assert [x.well_name for x in result_wells] == ['WELL1', 'WELL2']
+    assert wells_file.get_object_locations_for_id(result_wells[0].completions[1].id) == [11]
+
+
 def test_load_wells_na_values_converted_to_none(mocker, fixture_for_osstat_pathlib):
     # Arrange
     start_date = '01/01/2023'
@@ -0,0 +1,74 @@
+import pytest
+
+from ResSimpy.Nexus.log_file_reader import LogFileContent, LogFileReader
+
+PROLOG_LINE = 'start generic pdsh   prolog  with cleanup on  hpchw1104 Wed Sep 2 03:20:19 CST 2020\n'
+EPILOG_LINE = 'end generic pdsh   epilog  with cleanup on  hpchw0101 Fri Sep 18 09:25:19 CST 2020\n'
+TIME_HEADER = ' Case Name = nexus_run\nTIME  TS NWT   OIL\n   DAYS  RP ITN   C.P.\n'
+
+
+def test_read_only_new_lines(mocker, tmp_path):
+    # Arrange
+    log_path = tmp_path / 'nexus_run.log'
+    log_path.write_text(PROLOG_LINE + 'Job number: 1234\n' + TIME_HEADER + '10.0 0   1 81961.8\n20.0 0')
+    reader = LogFileReader()
+    first_result = reader.read(str(log_path), 'nexus_run')
+    add_line_spy = mocker.spy(LogFileContent, 'add_line')
+
+    # Act
+    with open(log_path, 'a') as f:
+        f.write('   1 81961.8\n30.0 0   1 81961.8\nNexus finished\nerrors 0 warnings 3\n')
+    result = reader.read(str(log_path), 'nexus_run')
+
+    # Assert
+    assert first_result.last_time == '20.0'
+    assert not first_result.finished
+    assert add_line_spy.call_count == 4
+    assert result.last_time == '30.0'
+    assert result.finished
+    assert result.job_number_line == 'Job number: 1234\n'
+    assert result.errors_warnings_line == 'errors 0 warnings 3\n'
+
+
+def test_read_replaced_log_file(tmp_path):
+    # Arrange
+    log_path = tmp_path / 'nexus_run.log'
+    log_path.write_text(PROLOG_LINE + 'Job number: 1234\n' + TIME_HEADER + '10.0 0   1 81961.8\n20.0 0   1 81961.8\n')
+    reader = LogFileReader()
+    reader.read(str(log_path), 'nexus_run')
+
+    # Act
+    log_path.write_text(PROLOG_LINE.replace('03:20:19', '04:00:00') + 'Job number: 5678\n' + TIME_HEADER +
+                        '5.0 0   1 81961.8\n')
+    result = reader.read(str(log_path), 'nexus_run')
+
+    # Assert
+    assert result.last_time == '5.0'
+    assert result.job_number_line == 'Job number: 5678\n'
+
+
+@pytest.mark.parametrize('finished, expected_last_time', [
+    (True, None),  # finished so only the ends of the file are read
+    (False, '199.0'),  # might still be running so the whole file is read
+])
+def test_read_status_large_log_file(tmp_path, finished, expected_last_time):
+    # Arrange
+    log_path = tmp_path / 'nexus_run.log'
+    time_lines = ''.join(f'{x}.0 0   1 81961.8\n' for x in range(200))
+    end_lines = 'Nexus finished\nerrors 1 warnings 2\n' + EPILOG_LINE if finished else ''
+    log_path.write_text(PROLOG_LINE + 'Job number: 1234\n' + TIME_HEADER + time_lines + end_lines)
+    reader = LogFileReader(end_bytes=200)
+
+    # Act
+    result = reader.read_status(str(log_path), 'nexus_run')
+    full_result = reader.read(str(log_path), 'nexus_run')
+
+    # Assert
+    assert result.finished is finished
+    assert result.start_time_line == PROLOG_LINE
+    assert result.last_time == expected_last_time
+    assert full_result.last_time == '199.0'
+    assert full_result.finished is finished
+    if finished:
+        assert result.end_time_line == EPILOG_LINE
+        assert result.errors_warnings_line == 'errors 1 warnings 2\n'
@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ResSimpy.Nexus.log_timestep_parser import iter_timesteps, read_timestep_array, read_timestep_table
+
+LOG_FILE_CONTENTS = (
+    'start generic pdsh   prolog  with cleanup on  hpchw1104 Wed Sep 2 03:20:19 CST 2020\n\n'
+    ' Case Name = other_case\nTIME  TS NWT   OIL\n   DAYS  RP ITN   C.P.\n1.00 0   1 81961.8\n\n'
+    ' Case Name = nexus_run        \nTIME  DT   NWT CUTS   CPU    OIL     GAS\n'
+    '   DAYS  DAYS  ITN       SEC    C.P.    C.I.\n'
+    '1.00 1.00   3 0   0.52  81961.8     0.0\n'
+    '3.50 2.50   5 1   1.25  81961.8     0.0\n'
+    ' Summary of errors\n'
+    '10.0 6.50   4 0   0.75  81961.8     0.0\n'
+    'Errors            0     Warnings           65\n'
+)
+
+
+@pytest.mark.parametrize('log_file_contents, case_name, expected_rows', [
+    (LOG_FILE_CONTENTS, 'nexus_run', [(1.0, 1.0, 3.0, 0.0, 0.52), (3.5, 2.5, 5.0, 1.0, 1.25), (10.0, 6.5, 4.0, 0.0, 0.75)]),
+    # no timestep size, cuts or cpu columns
+    (' Case Name = nexus_run\nCOL1 COL2 TIME  TS NWT   OIL\n  DAYS  RP ITN\n1 2 1.00 0   1 81961.8\n'
+     '3 4 4.00 0   2 81961.8\n', 'nexus_run',
+     [(1.0, math.nan, 1.0, math.nan, math.nan), (4.0, 3.0, 2.0, math.nan, math.nan)]),
+    (LOG_FILE_CONTENTS, None,
+     [(1.0, math.nan, 1.0, math.nan, math.nan), (1.0, 1.0, 3.0, 0.0, 0.52), (3.5, 2.5, 5.0, 1.0, 1.25),
+      (10.0, 6.5, 4.0, 0.0, 0.75)]),
+], ids=['all columns', 'missing columns', 'all cases'])
+def test_iter_timesteps(log_file_contents, case_name, expected_rows):
+    # Act
+    result = list(iter_timesteps(log_file_contents.splitlines(keepends=True), case_name))
+
+    # Assert
+    np.testing.assert_array_equal(np.array(result), np.array(expected_rows))
+
+
+def test_read_timestep_table(tmp_path):
+    # Arrange
+    log_path = tmp_path / 'nexus_run.log'
+    log_path.write_text(LOG_FILE_CONTENTS)
+    expected_df = pd.DataFrame({'time': [1.0, 3.5, 10.0], 'timestep_size': [1.0, 2.5, 6.5],
+                                'newton_iterations': [3.0, 5.0, 4.0], 'cuts': [0.0, 1.0, 0.0],
+                                'cpu_time': [0.52, 1.25, 0.75]})
+
+    # Act
+    result_array = read_timestep_array(str(log_path), 'nexus_run')
+    result_df = read_timestep_table(str(log_path), 'nexus_run')
+
+    # Assert
+    assert result_array.dtype.names == tuple(expected_df.columns)
+    np.testing.assert_array_equal(result_array['cpu_time'], expected_df['cpu_time'].to_numpy())
+    pd.testing.assert_frame_equal(result_df, expected_df)
@@ -0,0 +1,104 @@
+import pickle
+import uuid
+
+import pandas as pd
+import pytest
+
+from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
+from ResSimpy.Nexus.DataModels.NexusCompletionStore import NexusCompletionList, NexusCompletionStore, \
+    completion_columns
+from ResSimpy.Nexus.DataModels.NexusRelPermEndPoint import NexusRelPermEndPoint
+from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+
+
+@pytest.fixture
+def store():
+    store = NexusCompletionStore(date_format=DateFormat.DD_MM_YYYY)
+    store.append('01/01/2020', [('i', 1), ('j', 2), ('k', 3), ('grid', 'NA')])
+    store.append('01/02/2020', [('i', 4), ('well_radius', 4.5), ('polymer_block_radius', 0.2)],
+                 NexusRelPermEndPoint(swl=0.1))
+    store.append('01/02/2020', [('i', 5), ('status', 'OFF')])
+    return store
+
+
+def test_completions_created_from_columns(store):
+    # Arrange
+    expected_completions = [
+        NexusCompletion(date='01/01/2020', i=1, j=2, k=3, grid='NA', date_format=DateFormat.DD_MM_YYYY),
+        NexusCompletion(date='01/02/2020', i=4, well_radius=4.5, polymer_bore_radius=0.2,
+                        rel_perm_end_point=NexusRelPermEndPoint(swl=0.1), date_format=DateFormat.DD_MM_YYYY),
+        NexusCompletion(date='01/02/2020', i=5, status='OFF', date_format=DateFormat.DD_MM_YYYY),
+    ]
+
+    # Act
+    result = NexusCompletionList(store, range(3))
+
+    # Assert
+    assert result == expected_completions
+    assert [x.id for x in result] == [store.row_id(row) for row in range(3)]
+    assert isinstance(result[0].i, int)
+
+
+def test_completion_only_created_once(store):
+    # Arrange
+    completions = NexusCompletionList(store, [0, 1])
+
+    # Act
+    first_completion = completions[1]
+    first_completion.update({'skin': 2.0})
+
+    # Assert
+    assert not store.is_materialized(0)
+    assert completions[1] is first_completion
+    assert store.get_value(1, 'skin') == 2.0
+    assert store.get_value(0, 'skin') is None
+    assert store.get_value(2, 'status') == 'OFF'
+
+
+def test_completion_list_modified_like_a_list(store):
+    # Arrange
+    completions = NexusCompletionList(store, [0, 1, 2])
+    new_completion = NexusCompletion(date='01/03/2020', i=9, date_format=DateFormat.DD_MM_YYYY)
+    id_to_remove = store.row_id(1)
+
+    # Act
+    completions.insert(1, new_completion)
+    del completions[completions.index_of_id(id_to_remove)]
+
+    # Assert
+    assert [x.i for x in completions] == [1, 9, 5]
+    assert completions[1] is new_completion
+    assert completions.index_of_id(new_completion.id) == 1
+    assert not store.is_materialized(1)
+    with pytest.raises(ValueError):
+        completions.index_of_id(uuid.uuid4())
+
+
+def test_completion_list_pickled(store):
+    # Arrange
+    completions = NexusCompletionList(store, [0, 2])
+    expected_ids = [store.row_id(0), store.row_id(2)]
+
+    # Act
+    result = pickle.loads(pickle.dumps(completions))
+
+    # Assert
+    assert result == completions
+    assert [x.id for x in result] == expected_ids
+
+
+def test_store_columns_match_completion_dicts(store):
+    # Arrange
+    completions = NexusCompletionList(store, [2, 0, 1])
+    completions[0].update({'i': 7, 'grid': 'LGR1'})
+    expected_df = pd.DataFrame([x.to_dict() for x in completions]).dropna(axis=1, how='all')
+    store_completions = NexusCompletionList(store, [2, 0, 1])
+    object_completions = list(store_completions)
+
+    # Act
+    store_df = pd.DataFrame(completion_columns(store_completions)).dropna(axis=1, how='all')
+    object_df = pd.DataFrame(completion_columns(object_completions)).dropna(axis=1, how='all')
+
+    # Assert
+    pd.testing.assert_frame_equal(store_df, expected_df, check_like=True)
+    pd.testing.assert_frame_equal(object_df, expected_df, check_like=True)
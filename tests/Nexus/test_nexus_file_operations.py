@@ -74,6 +74,31 @@ def test_get_token_value(mocker, line_contents, file_contents, expected_result):
     assert result == expected_result
 
 
+@pytest.mark.parametrize("line_index, expected_result", [
+    (0, '1'),
+    (1, 'first'),
+    (4, 'second'),
+], ids=['value on same line', 'value on next line', 'duplicate line'])
+def test_get_token_value_at(line_index, expected_result):
+    # Arrange
+    file_as_list = ['MYTESTTOKEN 1\n', 'MYTESTTOKEN\n', 'first\n', 'C comment\n', 'MYTESTTOKEN\n', 'second\n']
+
+    # Act
+    result = nfo.get_token_value_at(token='MYTESTTOKEN', line_index=line_index, file_list=file_as_list)
+
+    # Assert
+    assert result == expected_result
+
+
+def test_get_expected_token_value_at_no_value():
+    # Arrange
+    file_as_list = ['MYTESTTOKEN 1\n', 'MYTESTTOKEN\n']
+
+    # Act Assert
+    with pytest.raises(ValueError):
+        nfo.get_expected_token_value_at(token='MYTESTTOKEN', line_index=1, file_list=file_as_list)
+
+
 @pytest.mark.parametrize("line_string, token, expected_result",
                          [("Line contains TOKEN 124", "ToKEN", True),
                           ("TokeN 323 and other text", "TOKEN", True),
@@ -502,6 +527,26 @@ def test_get_previous_value_multiple_lines_specify_search_before(file, search_be
     assert result == expected_result
 
 
+@pytest.mark.parametrize("file, search_before, expected_result", [
+    (['\t ', '1', '       INCLUDE', 'after'], 'INCLUDE', '1'),
+    (['\t ', '\n', '     \n', '\n', '\n', '1'], '1', None),
+    (['1', '2 ', ' 3', '!4', '1 START_TEXT 5'], 'START_TEXT', '1'),
+    (['NOLIST 4', 'NOLIST INCLUDE'], 'INCLUDE', '4'),
+])
+def test_get_previous_value_at(file, search_before, expected_result):
+    # Arrange
+    original_file = file.copy()
+    line_index = next(i for i, x in enumerate(file) if search_before in x)
+
+    # Act
+    result = nfo.get_previous_value_at(line_index=line_index, file_as_list=file, search_before=search_before,
+                                       ignore_values=['NOLIST'])
+
+    # Assert
+    assert result == expected_result
+    assert file == original_file
+
+
 @pytest.mark.parametrize("file_contents, expected_header_index, expected_header_result", [
     ('KH \t NAME \t COLUMN1 \t   COLUMN2 \n\n SOMETHING ELSe',
      0, ['KH', 'NAME', 'COLUMN1', 'COLUMN2']),
@@ -790,3 +835,15 @@ def test_load_file_as_list_unicode_error(mocker, ):
     result = nfo.load_file_as_list(file_path)
     # Assert
     assert result == expected_file_as_list
+
+
+@pytest.mark.parametrize("list_tokens, line, expected_result", [
+    (['QOIL', 'GOR', 'ALQ'], 'ALQ 1 2 GOR 0.5\n', 'GOR'),
+    (['QOIL', 'GOR', 'ALQ'], 'ALQ GASRATE 1 2\n', 'ALQ'),
+    (['QOIL', 'GOR', 'ALQ'], 'QGAS 1 2 ! QOIL\n', None),
+])
+def test_check_list_tokens(list_tokens, line, expected_result):
+    # Act
+    result = nfo.check_list_tokens(list_tokens, line)
+    # Assert
+    assert result == expected_result
@@ -0,0 +1,90 @@
+import pytest
+
+import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.nexus_lexer import KeywordMatcher, NexusToken, keyword_matcher, line_values, tokenize, \
+    tokenize_line
+
+
+@pytest.mark.parametrize("line, expected_values", [
+    ('WELLSPEC well1\n', ['WELLSPEC', 'well1']),
+    ('\t 1, 2 ,3\n', ['1', '2', '3']),
+    ('KX VALUE ! comment KY\n', ['KX', 'VALUE']),
+    ('C this is a comment line\n', []),
+    ('C', []),
+    ('CONSTRAINTS\n', ['CONSTRAINTS']),
+    ('NAME "well name 1" "!not a comment"\n', ['NAME', '"well name 1"', '"!not a comment"']),
+    ('"unterminated quote\n', ['"unterminated', 'quote']),
+    ('IW JW L RADW >\n', ['IW', 'JW', 'L', 'RADW']),
+    ('QOSMAX > 100\n', ['QOSMAX', '>', '100']),
+    ('', []),
+])
+def test_line_values(line, expected_values):
+    # Act
+    result = line_values(line)
+    # Assert
+    assert result == expected_values
+
+
+def test_tokenize_line_spans():
+    # Arrange
+    line = 'TIME 01/01/2020 ! start\n'
+    expected_result = [NexusToken('TIME', 3, 0, 4), NexusToken('01/01/2020', 3, 5, 15)]
+    # Act
+    result = tokenize_line(line, line_index=3)
+    # Assert
+    assert result == expected_result
+    assert [line[x.start:x.end] for x in result] == ['TIME', '01/01/2020']
+
+
+def test_tokenize_file():
+    # Arrange
+    file_as_list = ['ignored line\n', '! comment\n', 'WELLSPEC well1\n', 'C comment\n', 'IW JW\n']
+    expected_result = [NexusToken('WELLSPEC', 2, 0, 8), NexusToken('well1', 2, 9, 14),
+                       NexusToken('IW', 4, 0, 2), NexusToken('JW', 4, 3, 5)]
+    # Act
+    result = list(tokenize(file_as_list, start_line_index=1))
+    # Assert
+    assert result == expected_result
+
+
+@pytest.mark.parametrize("file_as_list, ignore_values, expected_result", [
+    (['INCLUDE file.dat\n'], ['INCLUDE'], 'file.dat'),
+    (['NOLIST\n', 'NOLIST 5\n'], ['NOLIST'], '5'),
+    (['NAME "well name 1"\n'], ['NAME'], '"well name 1"'),
+])
+def test_get_next_value_ignore_values(file_as_list, ignore_values, expected_result):
+    # Act
+    result = nfo.get_next_value(0, file_as_list, ignore_values=ignore_values)
+    # Assert
+    assert result == expected_result
+
+
+@pytest.mark.parametrize("line, expected_all, expected_first", [
+    ('PINIT 3000 WOC 7000\n', ['PINIT', 'WOC'], 'WOC'),
+    ('woc 7000, pinit 3000\n', ['WOC', 'PINIT'], 'WOC'),
+    ('PINIT 3000 ! WOC 7000\n', ['PINIT'], 'PINIT'),
+    ('C WOC 7000\n', [], None),
+    ('PINITIAL 3000 GOCWOC\n', [], None),
+    ('WOC 7000 WOC 8000\n', ['WOC'], 'WOC'),
+    ('"WOC" 7000\n', [], None),
+])
+def test_keyword_matcher(line, expected_all, expected_first):
+    # Arrange
+    matcher = KeywordMatcher(['WOC', 'GOC', 'PINIT'])
+    # Act
+    result_all = matcher.find_all(line)
+    result_first = matcher.find_first(line)
+    result_found = matcher.found_in(line)
+    # Assert
+    assert result_all == expected_all
+    assert result_first == expected_first
+    assert result_found == bool(expected_all)
+
+
+def test_keyword_matcher_cached():
+    # Act
+    result = keyword_matcher(['WOC', 'GOC'])
+    # Assert
+    assert result is keyword_matcher(('WOC', 'GOC'))
+    assert result is not keyword_matcher(['GOC', 'WOC'])
+
@@ -0,0 +1,126 @@
+import os
+import pickle
+
+import pytest
+
+from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
+from ResSimpy.Nexus.DataModels.NexusFileContent import NexusFileContent
+from ResSimpy.Nexus.include_file_reader import IncludeFileReader
+from ResSimpy.Nexus.nexus_parse_cache import NexusParseCache
+
+
+@pytest.fixture
+def model_on_disk(tmp_path):
+    fcs_path = tmp_path / 'model.fcs'
+    fcs_path.write_text('DESC test model\nRUN_UNITS ENGLISH\nRECURRENT_FILES\n WELLS Set 1 wells.dat\n')
+    (tmp_path / 'wells.dat').write_text('TIME 01/01/2020\nINCLUDE wells_inc.dat\n')
+    (tmp_path / 'wells_inc.dat').write_text('WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n')
+    return tmp_path
+
+
+def load_and_store(cache, fcs_path):
+    with IncludeFileReader() as file_reader:
+        fcs_file = FcsNexusFile.generate_fcs_structure(str(fcs_path), file_reader=file_reader)
+    cache.store(str(fcs_path), fcs_file, file_reader.read_paths)
+    return fcs_file
+
+
+def test_parse_cache_round_trip(model_on_disk):
+    # Arrange
+    fcs_path = model_on_disk / 'model.fcs'
+    cache = NexusParseCache(str(model_on_disk / 'cache'))
+    fcs_file = load_and_store(cache, fcs_path)
+    expected_flat_file = fcs_file.well_files[1].get_flat_list_str_file
+
+    # Act
+    result = cache.load(str(fcs_path))
+
+    # Assert
+    assert result is not None
+    assert result.well_files[1].get_flat_list_str_file == expected_flat_file
+    assert result.well_files[1].include_objects[0].location == str(model_on_disk / 'wells_inc.dat')
+
+
+def test_parse_cache_read_paths(model_on_disk):
+    # Arrange
+    fcs_path = model_on_disk / 'model.fcs'
+    expected_read_paths = [str(fcs_path), str(model_on_disk / 'wells.dat'), str(model_on_disk / 'wells_inc.dat')]
+
+    # Act
+    with IncludeFileReader() as file_reader:
+        FcsNexusFile.generate_fcs_structure(str(fcs_path), file_reader=file_reader)
+
+    # Assert
+    assert file_reader.read_paths == expected_read_paths
+
+
+@pytest.mark.parametrize('new_content, expected_hit', [
+    ('WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n', True),  # touched but unchanged
+    ('WELLSPEC well1\nIW JW L RADW\n1 2 3 9.5\n', False),  # same size, different content
+    ('WELLSPEC well1\nIW JW L RADW\n1 2 3 4.55\n', False),  # different size
+])
+def test_parse_cache_invalidated_by_change(model_on_disk, new_content, expected_hit):
+    # Arrange
+    fcs_path = model_on_disk / 'model.fcs'
+    cache = NexusParseCache(str(model_on_disk / 'cache'))
+    load_and_store(cache, fcs_path)
+    include_path = model_on_disk / 'wells_inc.dat'
+    include_path.write_text(new_content)
+    stat_obj = os.stat(include_path)
+    os.utime(include_path, ns=(stat_obj.st_atime_ns, stat_obj.st_mtime_ns + 10 ** 9))
+
+    # Act
+    result = cache.load(str(fcs_path))
+
+    # Assert
+    assert (result is not None) is expected_hit
+
+
+def test_parse_cache_missing_file_created(model_on_disk):
+    # Arrange
+    fcs_path = model_on_disk / 'model.fcs'
+    (model_on_disk / 'wells_inc.dat').unlink()
+    cache = NexusParseCache(str(model_on_disk / 'cache'))
+    with pytest.warns(UserWarning):
+        load_and_store(cache, fcs_path)
+
+    # Act
+    result_before = cache.load(str(fcs_path))
+    (model_on_disk / 'wells_inc.dat').write_text('WELLSPEC well1\n')
+    result_after = cache.load(str(fcs_path))
+
+    # Assert
+    assert result_before is not None
+    assert result_after is None
+
+
+def test_parse_cache_corrupt_entry(model_on_disk):
+    # Arrange
+    fcs_path = model_on_disk / 'model.fcs'
+    cache_dir = model_on_disk / 'cache'
+    cache = NexusParseCache(str(cache_dir))
+    load_and_store(cache, fcs_path)
+    for entry in cache_dir.iterdir():
+        entry.write_bytes(entry.read_bytes()[:-20])
+
+    # Act
+    with pytest.warns(UserWarning):
+        result = cache.load(str(fcs_path))
+
+    # Assert
+    assert result is None
+
+
+def test_file_content_version_after_pickle():
+    # Arrange
+    content = NexusFileContent(['line 1\n', 'line 2\n'])
+    content.mark_modified()
+
+    # Act
+    result = pickle.loads(pickle.dumps(content))
+    new_content = NexusFileContent()
+
+    # Assert
+    assert result == content
+    assert result.version == content.version
+    assert new_content.version > result.version
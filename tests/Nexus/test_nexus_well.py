@@ -1,9 +1,12 @@
 import os
 import uuid
+from contextlib import nullcontext
 from unittest.mock import Mock
+import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
 from ResSimpy.Enums.HowEnum import OperationEnum
+import ResSimpy.Nexus.DataModels.NexusWell
 
 from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
@@ -835,7 +838,9 @@ iw jw l radw
 
 
 ], ids=['modify well in include_locations file'])
-def test_add_completion_include_files(mocker, fixture_for_osstat_pathlib, fcs_file_contents, wells_file, include_file_contents, add_perf_date, expected_result):
+@pytest.mark.parametrize('use_batch_edit', [False, True], ids=['sequential edits', 'batch edit'])
+def test_add_completion_include_files(mocker, fixture_for_osstat_pathlib, fcs_file_contents, wells_file, include_file_contents, add_perf_date, expected_result,
+                                      use_batch_edit):
     '''TODO after an include in main file
         TODO inside an include file
      '''
@@ -869,22 +874,24 @@ def test_add_completion_include_files(mocker, fixture_for_osstat_pathlib, fcs_fi
         include_locations=[include_file_path], origin=fcs_file_path, file_content_as_list=expected_wells_file_as_list)
     # Act
     # test adding a load of completions sequentially
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict,
-                                         preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_2,
-                                         preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
-                                         preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
-                                         preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
-                                         preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
-                                         preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
-                                        preserve_previous_completions=True)
-    mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
-                                         preserve_previous_completions=True)
+    flatten_spy = mocker.spy(NexusFile, 'iterate_line')
+    with mock_nexus_sim.batch_edit() if use_batch_edit else nullcontext():
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict,
+                                             preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_2,
+                                             preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
+                                             preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
+                                             preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
+                                             preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
+                                             preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
+                                            preserve_previous_completions=True)
+        mock_nexus_sim.wells.add_completion(well_name='well1', completion_properties=add_perf_dict_3,
+                                             preserve_previous_completions=True)
 
     result = mock_nexus_sim.model_files.well_files[1].include_objects[0]
 
@@ -892,6 +899,9 @@ def test_add_completion_include_files(mocker, fixture_for_osstat_pathlib, fcs_fi
     assert result.file_content_as_list == expected_include_file.file_content_as_list
     assert result == expected_include_file
     assert mock_nexus_sim.model_files.well_files[1].file_content_as_list == expected_wells_file.file_content_as_list
+    if use_batch_edit:
+        # the wells file and its include file are only flattened once
+        assert flatten_spy.call_count == 2
 
 def test_add_completion_other(mocker, fixture_for_osstat_pathlib):
     # Arrange
@@ -1060,7 +1070,7 @@ def test_object_locations_updating(mocker, fixture_for_osstat_pathlib, well_file
     RUNCONTROL ref_runcontrol.dat
     WELLS Set 1 wells.dat'''
     runcontrol_data = 'START 01/01/2020'
-    mocker.patch.object(uuid, 'uuid4', side_effect=['file_uuid', 'runcontrol_uuid','wells_file_uuid',
+    mocker.patch.object(uuid, 'uuid4', side_effect=['runcontrol_uuid','wells_file_uuid',
                                                     '1', 'wells_file_uuid', 'uuid1','uuid2', 'uuid3', 'uuid4', 'uuid5', 'uuid6', 'uuid7'])
 
     def mock_open_wrapper(filename, mode):
@@ -1086,3 +1096,88 @@ def test_object_locations_updating(mocker, fixture_for_osstat_pathlib, well_file
     # Assert
 
     assert model.model_files.well_files[1].object_locations == expected_uuid
+
+
+def test_completions_df_cached_until_modified(mocker):
+    # Arrange
+    completions = [
+        NexusCompletion(i=1, j=2, k=3, date='01/01/2023', date_format=DateFormat.DD_MM_YYYY),
+        NexusCompletion(i=1, j=2, k=4, date='01/02/2023', date_format=DateFormat.DD_MM_YYYY, status='OFF'),
+    ]
+    well = NexusWell(well_name='test well', completions=completions, units=UnitSystem.METKGCM2)
+    expected_df = pd.DataFrame({'well_name': ['test well', 'test well'], 'units': ['METKGCM2', 'METKGCM2'],
+                                'i': [1, 1], 'j': [2, 2], 'k': [3, 5], 'status': [None, 'OFF'],
+                                'date': ['01/01/2023', '01/02/2023']})
+    completion_columns_spy = mocker.spy(ResSimpy.Nexus.DataModels.NexusWell, 'completion_columns')
+
+    # Act
+    first_df = well.get_completions_df()
+    first_df['k'] = 0
+    second_df = well.get_completions_df()
+    well._modify_completion_in_memory({'k': 5}, completion_to_modify=completions[1].id)
+    result = well.get_completions_df()
+
+    # Assert
+    assert completion_columns_spy.call_count == 2
+    pd.testing.assert_series_equal(second_df['k'], pd.Series([3, 4], name='k'))
+    pd.testing.assert_frame_equal(result, expected_df, check_like=True)
+
+
+def test_wells_state_at_and_completions_between(mocker, fixture_for_osstat_pathlib):
+    # Arrange
+    file_as_list = ['TIME 01/01/2020\n', 'WELLSPEC well1\n', 'IW JW L\n', '1 2 3\n', '1 2 4\n',
+                    'WELLSPEC well2\n', 'IW JW L\n', '5 6 7\n',
+                    'TIME 01/03/2020\n', 'WELLSPEC well1\n', 'IW JW L STAT\n', '1 2 3 OFF\n',
+                    'TIME 01/05/2020\n', 'WELLSPEC well3\n', 'IW JW L\n', '8 9 10\n']
+    file = NexusFile(location='wells.dat', file_content_as_list=file_as_list)
+    fake_nexus_sim = get_fake_nexus_simulator(mocker)
+    fake_nexus_sim.model_files.well_files = {1: file}
+    fake_nexus_sim.date_format = DateFormat.DD_MM_YYYY
+    fake_nexus_sim._sim_controls.date_format_string = "%d/%m/%Y"
+    fake_nexus_sim.start_date = '01/01/2020'
+    wells_obj = NexusWells(fake_nexus_sim)
+
+    # Act
+    state_before_start = wells_obj.state_at('31/12/2019')
+    state = wells_obj.state_at('15/03/2020')
+    changes = wells_obj.completions_between('01/03/2020', '01/05/2020')
+    wells_obj.get_well('well1')._add_completion_to_memory('01/04/2020', {'i': 1, 'j': 2, 'k': 5,
+                                                                               'date_format': DateFormat.DD_MM_YYYY})
+    state_after_change = wells_obj.state_at('15/04/2020')
+
+    # Assert
+    assert state_before_start.empty
+    assert state[['well_name', 'k']].values.tolist() == [['well1', 3], ['well2', 7]]
+    assert state['status'].fillna('').tolist() == ['OFF', '']
+    assert changes[['well_name', 'date']].values.tolist() == [['well1', '01/03/2020'], ['well3', '01/05/2020']]
+    assert state_after_change[['well_name', 'k']].values.tolist() == [['well1', 5], ['well2', 7]]
+
+
+def test_wells_completions_in_cells(mocker, fixture_for_osstat_pathlib):
+    # Arrange
+    file_as_list = ['TIME 01/01/2020\n', 'WELLSPEC well1\n', 'IW JW L\n', '1 2 3\n', '1 2 4\n',
+                    'WELLSPEC well2\n', 'IW JW L\n', '5 6 3\n',
+                    'WELLSPEC well3\n', 'DTOP DBOT\n', '1000 1010\n',
+                    'TIME 01/03/2020\n', 'WELLSPEC well1\n', 'IW JW L\n', '1 2 4\n']
+    file = NexusFile(location='wells.dat', file_content_as_list=file_as_list)
+    fake_nexus_sim = get_fake_nexus_simulator(mocker)
+    fake_nexus_sim.model_files.well_files = {1: file}
+    fake_nexus_sim.date_format = DateFormat.DD_MM_YYYY
+    fake_nexus_sim._sim_controls.date_format_string = "%d/%m/%Y"
+    fake_nexus_sim.start_date = '01/01/2020'
+    wells_obj = NexusWells(fake_nexus_sim)
+
+    # Act
+    in_cell = wells_obj.completions_in_cell(1, 2, 4)
+    in_layer = wells_obj.completions_in_layers(3, 3)
+    in_layer_at_date = wells_obj.completions_in_layers(3, 3, date='01/04/2020')
+    in_box = wells_obj.completions_in_box(i_range=(1, 4), j_range=(1, 6), k_range=(4, 10))
+    wells_obj.get_well('well2')._remove_completion_from_memory(wells_obj.get_well('well2').completions[0].id)
+    in_layer_after_removal = wells_obj.completions_in_layers(3, 3)
+
+    # Assert
+    assert in_cell[['well_name', 'date']].values.tolist() == [['well1', '01/01/2020'], ['well1', '01/03/2020']]
+    assert in_layer[['well_name', 'i']].values.tolist() == [['well1', 1], ['well2', 5]]
+    assert in_layer_at_date['well_name'].tolist() == ['well2']
+    assert in_box['k'].tolist() == [4, 4]
+    assert in_layer_after_removal['well_name'].tolist() == ['well1']
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from ResSimpy.Nexus.NexusEnums.SimulationEventEnum import SimulationEventType
+from ResSimpy.Nexus.simulation_monitor import SimulationMonitor
+
+
+def mock_model(mocker, statuses, progresses, job_id=1234):
+    """Mock model that reports each status in turn, finishing after the last one."""
+    model = mocker.MagicMock()
+    model.get_simulation_status.side_effect = statuses
+    model.get_simulation_progress.side_effect = progresses
+    model.logging.get_job_id.return_value = job_id
+    log_file_reads = len([x for x in statuses if not isinstance(x, Exception)])
+    model.logging.is_simulation_finished.side_effect = [False] * (log_file_reads - 1) + [True]
+    return model
+
+
+async def collect_events(monitor):
+    return [event async for event in monitor.events()]
+
+
+def test_simulation_monitor_events(mocker):
+    # Arrange
+    running_status = 'Job Running, ID: 1234'
+    finished_status = 'Simulation complete - Errors: 0 and Warnings: 3'
+    model_1 = mock_model(mocker, [NotImplementedError(), running_status, running_status, running_status,
+                                  finished_status], [10.0, 10.0, 50.0])
+    model_2 = mock_model(mocker, [running_status, finished_status], [20.0], job_id=5678)
+    monitor = SimulationMonitor([model_1, model_2, model_1], poll_interval=0.0, max_poll_interval=0.01)
+
+    # Act
+    result = asyncio.run(collect_events(monitor))
+
+    # Assert
+    model_1_events = [(x.event_type, x.value) for x in result if x.model is model_1]
+    model_2_events = [(x.event_type, x.value) for x in result if x.model is model_2]
+    assert monitor.models == [model_1, model_2]
+    assert model_1_events == [(SimulationEventType.JOB_ID, 1234), (SimulationEventType.STATUS, running_status),
+                              (SimulationEventType.PROGRESS, 10.0), (SimulationEventType.PROGRESS, 50.0),
+                              (SimulationEventType.STATUS, finished_status),
+                              (SimulationEventType.ERRORS_WARNINGS, finished_status),
+                              (SimulationEventType.FINISHED, True)]
+    assert model_2_events == [(SimulationEventType.JOB_ID, 5678), (SimulationEventType.STATUS, running_status),
+                              (SimulationEventType.PROGRESS, 20.0), (SimulationEventType.STATUS, finished_status),
+                              (SimulationEventType.ERRORS_WARNINGS, finished_status),
+                              (SimulationEventType.FINISHED, True)]
+    assert model_1.get_simulation_status.call_count == 5
+
+
+
+def test_simulation_monitor_failed_check(mocker):
+    # Arrange
+    running_status = 'Job Running, ID: 1234'
+    finished_status = 'Simulation complete - Errors: 0 and Warnings: 3'
+    model_1 = mock_model(mocker, [PermissionError('Permission denied'), PermissionError('Permission denied'),
+                                  running_status, finished_status], [10.0])
+    model_2 = mock_model(mocker, [running_status, running_status, finished_status], [20.0])
+    model_2.logging.get_job_id.side_effect = [ValueError("invalid literal for int() with base 10: 'x'"), 5678, 5678]
+    monitor = SimulationMonitor([model_1, model_2], poll_interval=0.0, max_poll_interval=0.01)
+
+    # Act
+    result = asyncio.run(collect_events(monitor))
+
+    # Assert
+    model_1_events = [(x.event_type, x.value) for x in result if x.model is model_1]
+    model_2_events = [(x.event_type, x.value) for x in result if x.model is model_2]
+    assert model_1_events == [(SimulationEventType.CHECK_FAILED, 'PermissionError: Permission denied'),
+                              (SimulationEventType.JOB_ID, 1234), (SimulationEventType.STATUS, running_status),
+                              (SimulationEventType.PROGRESS, 10.0), (SimulationEventType.STATUS, finished_status),
+                              (SimulationEventType.ERRORS_WARNINGS, finished_status),
+                              (SimulationEventType.FINISHED, True)]
+    assert model_2_events == [(SimulationEventType.CHECK_FAILED,
+                               "ValueError: invalid literal for int() with base 10: 'x'"),
+                              (SimulationEventType.JOB_ID, 5678), (SimulationEventType.STATUS, running_status),
+                              (SimulationEventType.PROGRESS, 20.0), (SimulationEventType.STATUS, finished_status),
+                              (SimulationEventType.ERRORS_WARNINGS, finished_status),
+                              (SimulationEventType.FINISHED, True)]
+    assert model_1.get_simulation_status.call_count == 4
+
+@pytest.mark.parametrize('poll_interval, max_poll_interval, backoff_factor', [
+    (-1.0, 60.0, 2.0),
+    (10.0, 5.0, 2.0),
+    (5.0, 60.0, 0.5),
+])
+def test_simulation_monitor_invalid_settings(poll_interval, max_poll_interval, backoff_factor):
+    # Act Assert
+    with pytest.raises(ValueError):
+        SimulationMonitor(poll_interval=poll_interval, max_poll_interval=max_poll_interval,
+                          backoff_factor=backoff_factor)
@@ -0,0 +1,42 @@
+import pytest
+
+from ResSimpy.Nexus.streamed_lines import StreamedLines
+
+
+def test_streamed_lines_reads_lazily():
+    # Arrange
+    lines_read = []
+
+    def stream():
+        for line in ['TIME 01/01/2020\n', 'WELLSPEC well1\n', 'IW JW L\n', '1 2 3\n']:
+            lines_read.append(line)
+            yield line
+
+    # Act
+    streamed_lines = StreamedLines(stream())
+    first_line = streamed_lines[0]
+    look_ahead = streamed_lines[1:3]
+
+    # Assert
+    assert first_line == 'TIME 01/01/2020\n'
+    assert look_ahead == ['WELLSPEC well1\n', 'IW JW L\n']
+    assert len(lines_read) == 3
+    assert len(streamed_lines) == 3
+    assert list(streamed_lines) == list(stream())
+
+
+def test_streamed_lines_release_before():
+    # Arrange
+    streamed_lines = StreamedLines(['a\n', 'b\n', 'c\n'])
+
+    # Act
+    for index, line in enumerate(streamed_lines):
+        streamed_lines.release_before(index)
+
+    # Assert
+    assert streamed_lines[2] == 'c\n'
+    with pytest.raises(IndexError):
+        streamed_lines[1]
+    with pytest.raises(IndexError):
+        streamed_lines[3]
+    assert list(streamed_lines) == ['c\n']
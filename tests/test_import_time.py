@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize('module_name', ['ResSimpy', 'ResSimpy.Nexus.NexusSimulator'])
+def test_import_does_not_load_heavy_dependencies(module_name):
+    # Arrange
+    heavy_dependencies = ['pandas', 'numpy', 'resqpy']
+    code = (f'import sys, time\nstart = time.perf_counter()\nimport {module_name}\n'
+            f'print(time.perf_counter() - start)\n'
+            f'print(",".join(x for x in {heavy_dependencies!r} if x in sys.modules))')
+
+    # Act
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    import_time, loaded_dependencies = result.stdout.splitlines()
+
+    # Assert
+    assert loaded_dependencies == ''
+    # generous limit so that the test is not flaky on slow machines
+    assert float(import_time) < 5.0
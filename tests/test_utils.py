@@ -6,6 +6,7 @@ import pytest
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Utils import to_dict_generic
+from ResSimpy.Utils.fenwick_tree import FenwickTree
 from ResSimpy.Utils.generic_repr import generic_repr
 from ResSimpy.Utils.invert_nexus_map import invert_nexus_map, attribute_name_to_nexus_keyword, \
     nexus_keyword_to_attribute_name
@@ -198,3 +199,20 @@ def test_to_string_generic(mocker, headers, expected_result):
 
     # Assert
     assert result_string == expected_result
+
+
+def test_fenwick_tree():
+    # Arrange
+    values = [3, 0, 2, 5, 0, 1]
+    tree = FenwickTree(values)
+
+    # Act
+    tree.add(2, 4)
+    values[2] += 4
+
+    # Assert
+    assert len(tree) == 6
+    assert tree[2] == 6
+    assert [tree.prefix_sum(i) for i in range(7)] == [sum(values[:i]) for i in range(7)]
+    # smallest number of values for the sum to reach the target
+    assert [tree.lower_bound(target) for target in [0, 1, 3, 4, 9, 14, 15, 16]] == [0, 1, 1, 3, 3, 4, 6, 6]